@@ -0,0 +1,203 @@
+"""
+cohort.py
+Batch analytics over every trainee with NumPy (coach reports).
+The current-level sessions of all trainees are read in one query into a
+per-session matrix; per-trainee totals are grouped reductions (bincount)
+over it. The points / success-rate / promotion rules are the same as
+progression.evaluate(), applied to whole columns instead of one trainee at
+a time.
+
+Only backend.tools.cohort_report imports this module, so the app itself
+does not need NumPy.
+"""
+
+import itertools
+
+import numpy as np
+
+from backend.models import progression
+from backend.models.data_manager import get_workout_plan
+
+# Same exercises and order as SessionAnalytics.load_sessions
+REP_EXERCISES = [
+    ("Push-up", "pushup_crt", "pushup_wrg"),
+    ("Jumping Jack", "jumpingjack_crt", "jumpingjack_wrg"),
+    ("Squat", "squat_crt", "squat_wrg"),
+    ("Crunches", "crunches_crt", "crunches_wrg")
+]
+TIMED_EXERCISES = [
+    ("Plank", "plank_time"),
+    ("Cobra Stretch", "cobrastretch_time")
+]
+EXERCISES = [name for name, _, _ in REP_EXERCISES] + [name for name, _ in TIMED_EXERCISES]
+
+NEAR_PROMOTION = 0.9        # share of the plan's max points
+NEAR_PASS_RATE = progression.PASS_RATE - 10
+
+
+class SessionArrays:
+    """Current-level sessions of every trainee as columns"""
+
+    def __init__(self, trainee_ids, plan_ids, session_trainee, correct, wrong, held):
+        self.trainee_ids = trainee_ids          # (T,) sorted
+        self.plan_ids = plan_ids                # (T,)
+        self.session_trainee = session_trainee  # (S,) index into trainee_ids
+        self.correct = correct                  # (S, 4) REP_EXERCISES
+        self.wrong = wrong                      # (S, 4)
+        self.held = held                        # (S, 2) TIMED_EXERCISES, seconds
+
+    @property
+    def session_count(self):
+        return len(self.session_trainee)
+
+
+def load_session_arrays(connection, all_levels=False):
+    """One trainee query and one session query; rows stream straight into arrays"""
+    cursor = connection.cursor()
+    cursor.row_factory = None
+    try:
+        cursor.execute("SELECT trainee_id, COALESCE(plan_id, 0) FROM trainee ORDER BY trainee_id")
+        trainees = np.array(cursor.fetchall(), dtype=np.int64).reshape(-1, 2)
+
+        cols = ["s.trainee_id"]
+        for _, crt, wrg in REP_EXERCISES:
+            cols += [f"COALESCE(s.{crt}, 0)", f"COALESCE(s.{wrg}, 0)"]
+        cols += [f"COALESCE(s.{col}, 0)" for _, col in TIMED_EXERCISES]
+        epoch = "" if all_levels else "AND s.epoch = t.level_epoch"
+        cursor.execute(f"""
+            SELECT {', '.join(cols)}
+            FROM workout_session s
+            JOIN trainee t ON t.trainee_id = s.trainee_id {epoch}
+        """)
+        rows = np.fromiter(itertools.chain.from_iterable(cursor), dtype=np.int64)
+        rows = rows.reshape(-1, len(cols))
+    finally:
+        cursor.close()
+
+    trainee_ids = trainees[:, 0]
+    reps = rows[:, 1:1 + 2 * len(REP_EXERCISES)]
+    return SessionArrays(
+        trainee_ids,
+        trainees[:, 1],
+        np.searchsorted(trainee_ids, rows[:, 0]),
+        reps[:, 0::2],
+        reps[:, 1::2],
+        rows[:, 1 + 2 * len(REP_EXERCISES):]
+    )
+
+
+class TraineeMetrics:
+    """Per-trainee totals and progression state, one row per trainee"""
+
+    def __init__(self, arrays, plans):
+        """plans: plan_id -> get_workout_plan() rows"""
+        n = len(arrays.trainee_ids)
+        group = arrays.session_trainee
+
+        def per_trainee(values):
+            return np.bincount(group, weights=values, minlength=n)
+
+        self.trainee_ids = arrays.trainee_ids
+        self.plan_ids = arrays.plan_ids
+        self.sessions = np.bincount(group, minlength=n)
+
+        correct = np.column_stack([per_trainee(c) for c in arrays.correct.T])
+        wrong = np.column_stack([per_trainee(c) for c in arrays.wrong.T])
+        held = np.column_stack([per_trainee(c) for c in arrays.held.T])
+        # sessions that have a hold (the divisor of the timed success rate)
+        holds = np.column_stack([per_trainee(c > 0) for c in arrays.held.T])
+
+        self.points = (2 * correct - wrong).sum(axis=1) + 2 * held.sum(axis=1)
+
+        # plan targets / max points looked up by plan id
+        size = max([0, *plans, *arrays.plan_ids.tolist()]) + 1
+        max_by_plan = np.zeros(size)
+        targets_by_plan = np.zeros((size, len(TIMED_EXERCISES)))
+        for plan_id, plan_data in plans.items():
+            max_by_plan[plan_id] = progression.plan_max_points(plan_data)
+            targets = progression.plan_targets(plan_data)
+            for j, (name, _) in enumerate(TIMED_EXERCISES):
+                targets_by_plan[plan_id, j] = targets.get(name) or 0
+        self.max_points = max_by_plan[self.plan_ids]
+
+        # success rates; NaN where the trainee has no data for the exercise
+        total = correct + wrong
+        expected = targets_by_plan[self.plan_ids] * holds
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rep_rates = np.where(total > 0, correct / total * 100, np.nan)
+            timed_rates = np.where(expected > 0, held / expected * 100, 0.0)
+        timed_rates[held <= 0] = np.nan
+        self.rates = np.hstack([rep_rates, timed_rates])
+
+        has_rates = ~np.isnan(self.rates).all(axis=1)
+        self.min_rate = np.full(n, np.inf)
+        self.min_rate[has_rates] = np.nanmin(self.rates[has_rates], axis=1)
+
+        self.eligible = (self.points >= self.max_points) & (self.min_rate >= progression.PASS_RATE)
+        self.restart_due = (self.sessions >= progression.SESSIONS_PER_LEVEL) & ~self.eligible
+
+    def __len__(self):
+        return len(self.trainee_ids)
+
+    @property
+    def progress(self):
+        """points / max points (0 where the plan has no max)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.max_points > 0, self.points / self.max_points, 0.0)
+
+    def near_promotion(self, share=NEAR_PROMOTION, pass_rate=NEAR_PASS_RATE):
+        """Indices of trainees close to, but not yet meeting, the promotion rule"""
+        near = ((self.progress >= share) & (self.min_rate >= pass_rate)
+                & ~self.eligible & (self.sessions > 0))
+        index = np.flatnonzero(near)
+        return index[np.argsort(-self.progress[index], kind="stable")]
+
+
+def load_plans(plan_ids):
+    return {int(plan_id): get_workout_plan(int(plan_id)) for plan_id in np.unique(plan_ids) if plan_id}
+
+
+def cohort_summary(metrics, percentiles=(10, 25, 50, 75, 90)):
+    """Cohort-wide distributions as plain dicts (for printing / JSON)"""
+    active = metrics.sessions > 0
+    summary = {
+        "trainees": len(metrics),
+        "active_trainees": int(active.sum()),
+        "sessions": int(metrics.sessions.sum()),
+        "eligible": int(metrics.eligible[active].sum()),
+        "restart_due": int(metrics.restart_due.sum()),
+        "near_promotion": len(metrics.near_promotion()),
+        "accuracy": {},
+        "progress": {},
+        "plans": {}
+    }
+
+    for j, name in enumerate(EXERCISES):
+        rates = metrics.rates[:, j]
+        rates = rates[~np.isnan(rates)]
+        if len(rates):
+            summary["accuracy"][name] = {
+                "trainees": len(rates),
+                "mean": float(rates.mean()),
+                "passing": float((rates >= progression.PASS_RATE).mean() * 100),
+                **{f"p{p}": float(v) for p, v in zip(percentiles, np.percentile(rates, percentiles))}
+            }
+
+    progress = metrics.progress[active] * 100
+    if len(progress):
+        summary["progress"] = {
+            "mean": float(progress.mean()),
+            **{f"p{p}": float(v) for p, v in zip(percentiles, np.percentile(progress, percentiles))}
+        }
+
+    plan_ids, counts = np.unique(metrics.plan_ids[active], return_counts=True)
+    for plan_id, count in zip(plan_ids.tolist(), counts.tolist()):
+        on_plan = active & (metrics.plan_ids == plan_id)
+        summary["plans"][plan_id] = {
+            "level": progression.LEVEL_NAMES.get(plan_id, "Custom"),
+            "trainees": count,
+            "mean_points": float(metrics.points[on_plan].mean()),
+            "max_points": float(metrics.max_points[on_plan][0])
+        }
+
+    return summary
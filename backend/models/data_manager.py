@@ -4,7 +4,10 @@ Handles ALL SQLite database operations for SmartARTrainer
 """
 
 import sqlite3
+from datetime import datetime, timedelta
 from backend.models.db_config import get_db_connection, close_connection
+from backend.models import progression
+from backend.utils.activity_tracker import touch_activity, INACTIVITY_DAYS
 
 # =====================================================
 # REGISTRATION & LOGIN
@@ -187,28 +190,41 @@ def get_workout_plan(plan_id):
 
     try:
         cursor = connection.cursor()
-        cursor.execute("SELECT * FROM workout_plan WHERE plan_id = ?", (plan_id,))
-        row = cursor.fetchone()
-        if not row:
-            return []
-
-        return [
-            {"workout_id": 1, "name": "Jumping Jacks", "target": row["jumpingjack_count"]},
-            {"workout_id": 2, "name": "Push Ups", "target": row["pushup_count"]},
-            {"workout_id": 3, "name": "Plank", "target": row["plank_time"]},
-            {"workout_id": 4, "name": "Crunches", "target": row["crunches_count"]},
-            {"workout_id": 5, "name": "Squats", "target": row["squat_count"]},
-            {"workout_id": 6, "name": "Cobra Stretch", "target": row["cobra_stretch_time"]}
-        ]
+        return _read_workout_plan(cursor, plan_id)
 
     finally:
         close_connection(connection, cursor)
 
 
+def _read_workout_plan(cursor, plan_id):
+    cursor.execute("SELECT * FROM workout_plan WHERE plan_id = ?", (plan_id,))
+    row = cursor.fetchone()
+    if not row:
+        return []
+
+    return [
+        {"workout_id": 1, "name": "Jumping Jacks", "target": row["jumpingjack_count"]},
+        {"workout_id": 2, "name": "Push Ups", "target": row["pushup_count"]},
+        {"workout_id": 3, "name": "Plank", "target": row["plank_time"]},
+        {"workout_id": 4, "name": "Crunches", "target": row["crunches_count"]},
+        {"workout_id": 5, "name": "Squats", "target": row["squat_count"]},
+        {"workout_id": 6, "name": "Cobra Stretch", "target": row["cobra_stretch_time"]}
+    ]
+
+
 # =====================================================
 # WORKOUT SESSION
 # =====================================================
 
+# Sessions of the trainee's current level. A reset starts a new epoch
+# (see _start_new_epoch) instead of deleting rows; served by
+# idx_workout_session_trainee_epoch.
+_CURRENT_EPOCH = """
+    trainee_id = :tid
+    AND epoch = COALESCE((SELECT level_epoch FROM trainee WHERE trainee_id = :tid), 0)
+"""
+
+
 def save_workout_session(trainee_id, session_data):
     connection = get_db_connection()
     if not connection:
@@ -216,13 +232,16 @@ def save_workout_session(trainee_id, session_data):
 
     try:
         cursor = connection.cursor()
-        cols = ["trainee_id"] + WORKOUT_COLUMNS
-        placeholders = ["?"] * len(cols)
+        cols = ["trainee_id"] + WORKOUT_COLUMNS + ["epoch"]
+        placeholders = ["?"] * (len(cols) - 1)
+        placeholders.append("COALESCE((SELECT level_epoch FROM trainee WHERE trainee_id = ?), 0)")
 
         query = f"INSERT INTO workout_session ({', '.join(cols)}) VALUES ({', '.join(placeholders)})"
-        params = [trainee_id] + [session_data.get(c, 0) for c in WORKOUT_COLUMNS]
+        params = [trainee_id] + [session_data.get(c, 0) for c in WORKOUT_COLUMNS] + [trainee_id]
 
         cursor.execute(query, params)
+        # last activity is committed together with the session
+        touch_activity(cursor, trainee_id)
         connection.commit()
         return True, "Session saved"
     except sqlite3.Error as e:
@@ -238,11 +257,11 @@ def get_latest_session_status(trainee_id):
 
     try:
         cursor = connection.cursor()
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT * FROM workout_session
-            WHERE trainee_id = ?
+            WHERE {_CURRENT_EPOCH}
             ORDER BY session_id DESC LIMIT 1
-        """, (trainee_id,))
+        """, {"tid": trainee_id})
         row = cursor.fetchone()
         return dict(row) if row else None
     finally:
@@ -299,23 +318,33 @@ class WorkoutSessionStats:
         self.duration = duration
 
 
+class SessionTotals:
+    """Per-exercise totals over the loaded sessions, built in one pass"""
+    def __init__(self):
+        self.rep_totals = {}     # name -> [total, correct, wrong]
+        self.time_totals = {}    # name -> total seconds held
+        self.time_counts = {}    # name -> number of sessions with a hold
+
+
 class SessionAnalytics:
     def __init__(self):
         self.sessions = []
         self.total_sessions = 0
 
-    def load_sessions(self, trainee_id):
+    def load_sessions(self, trainee_id, all_levels=False):
+        """Sessions of the current level, or the whole history with all_levels"""
         connection = get_db_connection()
         if not connection:
             return
 
+        where = "trainee_id = :tid" if all_levels else _CURRENT_EPOCH
         try:
             cursor = connection.cursor()
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT * FROM workout_session
-                WHERE trainee_id = ?
+                WHERE {where}
                 ORDER BY session_id DESC
-            """, (trainee_id,))
+            """, {"tid": trainee_id})
             rows = cursor.fetchall()
 
             self.sessions.clear()
@@ -354,6 +383,23 @@ class SessionAnalytics:
         finally:
             close_connection(connection, cursor)
 
+    def aggregate(self):
+        """Sum reps / hold times per exercise in a single pass over sessions"""
+        totals = SessionTotals()
+
+        for s in self.sessions:
+            if s.reps_completed > 0:
+                stats = totals.rep_totals.setdefault(s.exercise_name, [0, 0, 0])
+                stats[0] += s.reps_completed
+                stats[1] += s.correct_reps
+                stats[2] += s.wrong_reps
+
+            elif s.duration > 0:
+                totals.time_totals[s.exercise_name] = totals.time_totals.get(s.exercise_name, 0) + s.duration
+                totals.time_counts[s.exercise_name] = totals.time_counts.get(s.exercise_name, 0) + 1
+
+        return totals
+
 
 # ✅ THIS LINE FIXES YOUR ERROR
 session_analytics = SessionAnalytics()
@@ -463,6 +509,27 @@ def promote_trainee_plan(trainee_id, new_plan_id):
 # RESET AFTER PROMOTION
 # =====================================================
 
+def _start_new_epoch(cursor, trainee_where, params, reason, when=None):
+    """
+    Close the current level of the trainees matching `trainee_where` (SQL on
+    the trainee table, named parameters) and start a fresh one. Their
+    sessions stay in workout_session for history; the caller commits.
+    Returns the number of trainees reset.
+    """
+    ended_at = (when or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+    params = dict(params, reason=reason, ended_at=ended_at)
+    cursor.execute(f"""
+        INSERT OR REPLACE INTO level_history (trainee_id, epoch, plan_id, ended_at, reason)
+        SELECT trainee_id, level_epoch, plan_id, :ended_at, :reason
+        FROM trainee WHERE {trainee_where}
+    """, params)
+    cursor.execute(f"""
+        UPDATE trainee SET level_epoch = level_epoch + 1
+        WHERE {trainee_where}
+    """, params)
+    return cursor.rowcount
+
+
 def reset_sessions_after_promotion(trainee_id):
     connection = get_db_connection()
     if not connection:
@@ -471,11 +538,8 @@ def reset_sessions_after_promotion(trainee_id):
     try:
         cursor = connection.cursor()
 
-        # DELETE old sessions → fresh start
-        cursor.execute("""
-            DELETE FROM workout_session
-            WHERE trainee_id = ?
-        """, (trainee_id,))
+        # new level epoch → fresh start, old sessions kept as history
+        _start_new_epoch(cursor, "trainee_id = :tid", {"tid": trainee_id}, progression.PROMOTE)
 
         connection.commit()
         return True, "Sessions reset"
@@ -512,3 +576,142 @@ def update_fitness_level(trainee_id, plan_id):
 
     finally:
         close_connection(connection, cursor)
+
+
+# =====================================================
+# APPLY A PROGRESSION DECISION (USED BY AnalyticsScreen)
+# =====================================================
+
+def apply_progression(trainee_id, decision):
+    """
+    Apply a progression.evaluate() decision in one transaction:
+    - PROMOTE: new plan and level name, new level epoch
+    - RESTART: new level epoch
+    Nothing changes unless the trainee is still on decision.plan_id
+    (another app instance may have promoted them already).
+    Returns (ok, message, plan_data); plan_data holds the new plan's
+    get_workout_plan() rows after a promotion, else None.
+    """
+    if not decision.resets_sessions:
+        return True, "Nothing to apply", None
+
+    connection = get_db_connection()
+    if not connection:
+        return False, "DB connection failed", None
+
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        plan_data = None
+
+        # new level epoch → fresh start, old sessions kept as history
+        reset = _start_new_epoch(
+            cursor, "trainee_id = :tid AND plan_id = :plan",
+            {"tid": trainee_id, "plan": decision.plan_id}, decision.action
+        )
+        if reset != 1:
+            connection.rollback()
+            return False, "Plan already changed", None
+
+        if decision.action == progression.PROMOTE:
+            cursor.execute("""
+                UPDATE trainee
+                SET plan_id = ?, fitness_level = ?
+                WHERE trainee_id = ?
+            """, (decision.new_plan_id, decision.new_level, trainee_id))
+            plan_data = _read_workout_plan(cursor, decision.new_plan_id)
+
+        connection.commit()
+        if plan_data is not None:
+            return True, f"Promoted to {decision.new_level}", plan_data
+        return True, "Sessions reset", None
+
+    except sqlite3.Error as e:
+        connection.rollback()
+        return False, str(e), None
+
+    finally:
+        close_connection(connection, cursor)
+
+
+# =====================================================
+# INACTIVITY SWEEP (USED BY backend.tools.inactivity_sweep)
+# =====================================================
+
+# trainees past the cutoff that have not been reset since their last activity
+_INACTIVE_WHERE = """
+    last_active < :cutoff
+    AND (last_reset IS NULL OR last_reset < last_active)
+"""
+
+
+def reset_inactive_trainees(days=INACTIVITY_DAYS, today=None, dry_run=False):
+    """
+    Reset every trainee inactive for at least `days` days in one transaction:
+    they start a new level epoch and a reset notice is queued for the
+    analytics screen. Returns (trainee ids, message).
+    """
+    today = today or datetime.today()
+    # dates up to today - days inclusive: last_active < the day after that
+    cutoff = (today - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    params = {"cutoff": cutoff, "now": today.strftime("%Y-%m-%d %H:%M:%S")}
+
+    connection = get_db_connection()
+    if not connection:
+        return [], "Database connection failed"
+
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute(f"SELECT trainee_id FROM trainee_activity WHERE {_INACTIVE_WHERE}", params)
+        trainee_ids = [row[0] for row in cursor.fetchall()]
+
+        if dry_run or not trainee_ids:
+            connection.rollback()
+            return trainee_ids, "Dry run" if dry_run else "No inactive trainees"
+
+        _start_new_epoch(
+            cursor, f"trainee_id IN (SELECT trainee_id FROM trainee_activity WHERE {_INACTIVE_WHERE})",
+            params, "inactive", today
+        )
+        cursor.execute(f"""
+            UPDATE trainee_activity SET last_reset = :now, reset_notice = 1
+            WHERE {_INACTIVE_WHERE}
+        """, params)
+
+        connection.commit()
+        return trainee_ids, f"Reset {len(trainee_ids)} trainee(s)"
+    except sqlite3.Error as e:
+        connection.rollback()
+        return [], str(e)
+    finally:
+        close_connection(connection, cursor)
+
+
+def take_inactivity_notice(trainee_id):
+    """True once after the sweep reset this trainee (clears the notice)"""
+    connection = get_db_connection()
+    if not connection:
+        return False
+
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        # read first: refresh_data calls this on every render, the notice is rare
+        cursor.execute("SELECT reset_notice FROM trainee_activity WHERE trainee_id = ?", (trainee_id,))
+        row = cursor.fetchone()
+        if not row or not row[0]:
+            return False
+
+        cursor.execute("""
+            UPDATE trainee_activity SET reset_notice = 0
+            WHERE trainee_id = ? AND reset_notice = 1
+        """, (trainee_id,))
+        connection.commit()
+        return cursor.rowcount == 1
+    except sqlite3.Error:
+        return False
+    finally:
+        close_connection(connection, cursor)
@@ -1,18 +1,35 @@
+import json
 import sqlite3
 from sqlite3 import Error
 import os
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database', 'smartar.db')
+
+# SMARTAR_DB_PATH points the app (or a tool / test run) at another database file
+DB_PATH = os.getenv("SMARTAR_DB_PATH") or DEFAULT_DB_PATH
+
+# Legacy per-trainee activity file, imported into the bundled database once
+LEGACY_ACTIVITY_FILE = os.path.join(PROJECT_ROOT, "last_activity.json")
+
+# PRAGMA user_version this code expects; see ensure_schema()
+SCHEMA_VERSION = 3
+
+_schema_ready = False
+
+
 def get_db_connection():
     """Create and return a SQLite database connection"""
-    db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database', 'smartar.db')
     try:
-        connection = sqlite3.connect(db_path)
+        connection = sqlite3.connect(DB_PATH)
         # Enable WAL mode for better concurrency
         connection.execute("PRAGMA journal_mode=WAL;")
         connection.execute("PRAGMA synchronous=NORMAL;")
-        
+
         # Enable row factory to access columns by name
         connection.row_factory = sqlite3.Row
+        ensure_schema(connection)
         return connection
     except Error as e:
         print(f"Error connecting to SQLite: {e}")
@@ -24,3 +41,150 @@ def close_connection(connection, db_query=None):
         db_query.close()
     if connection:
         connection.close()
+
+
+# =====================================================
+# SCHEMA MIGRATIONS
+# =====================================================
+
+def ensure_schema(connection):
+    """Bring the database up to SCHEMA_VERSION (checked once per process)"""
+    global _schema_ready
+    if _schema_ready:
+        return
+
+    migrate(connection)
+    _schema_ready = True
+
+
+def migrate(connection):
+    """Run the migrations this connection's database is missing (any file,
+    e.g. a scratch database built by backend.tools.generate_data)"""
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    for target, step in ((1, _migrate_v1), (2, _migrate_v2), (3, _migrate_v3)):
+        if version < target and not _run_migration(connection, target, step):
+            break
+
+
+def _run_migration(connection, target, step):
+    """
+    Run one step and stamp user_version = target in a single transaction.
+    sqlite3 autocommits DDL outside an explicit transaction, so BEGIN here:
+    a step that fails (or a killed process) leaves the previous version.
+    A step returns False to be skipped and retried on a later start.
+    """
+    if connection.in_transaction:
+        connection.commit()
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        # another process may have migrated while we waited for the lock
+        if connection.execute("PRAGMA user_version").fetchone()[0] >= target:
+            connection.rollback()
+            return True
+        if step(connection) is False:
+            connection.rollback()
+            return False
+        connection.execute(f"PRAGMA user_version = {target}")
+        connection.commit()
+        return True
+    except BaseException:
+        connection.rollback()
+        raise
+
+
+def database_file(connection):
+    """Path of the main database file behind a connection"""
+    return connection.execute("PRAGMA database_list").fetchone()[2]
+
+
+def _has_table(connection, table):
+    return connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def _add_column(connection, table, column, definition):
+    """ALTER TABLE ... ADD COLUMN unless the column is already there"""
+    columns = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+def _migrate_v1(connection):
+    """trainee_activity table, seeded once from last_activity.json"""
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS trainee_activity (
+            trainee_id   INTEGER PRIMARY KEY REFERENCES trainee(trainee_id),
+            last_active  TEXT NOT NULL
+        )
+    """)
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_trainee_activity_last_active "
+        "ON trainee_activity(last_active)"
+    )
+    if os.path.realpath(database_file(connection)) == os.path.realpath(DEFAULT_DB_PATH):
+        imported = import_activity_json(connection, LEGACY_ACTIVITY_FILE)
+        if imported:
+            print(f"Imported {imported} last-activity record(s) from {LEGACY_ACTIVITY_FILE}")
+
+
+def _migrate_v2(connection):
+    """Inactivity sweep bookkeeping: when a trainee was last reset, and
+    whether they still have to be told about it"""
+    _add_column(connection, "trainee_activity", "last_reset", "TEXT")
+    _add_column(connection, "trainee_activity", "reset_notice", "INTEGER NOT NULL DEFAULT 0")
+
+
+def _migrate_v3(connection):
+    """Level epochs: a reset starts a new epoch instead of deleting sessions.
+    Sessions keep the epoch they were recorded in; level_history records
+    which plan each finished epoch was on and why it ended. Skipped while
+    the database has no trainee / workout_session tables (a new, empty file)."""
+    if not (_has_table(connection, "trainee") and _has_table(connection, "workout_session")):
+        return False
+    _add_column(connection, "trainee", "level_epoch", "INTEGER NOT NULL DEFAULT 0")
+    _add_column(connection, "workout_session", "epoch", "INTEGER NOT NULL DEFAULT 0")
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_workout_session_trainee_epoch "
+        "ON workout_session(trainee_id, epoch)"
+    )
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS level_history (
+            trainee_id  INTEGER NOT NULL REFERENCES trainee(trainee_id),
+            epoch       INTEGER NOT NULL,
+            plan_id     INTEGER,
+            ended_at    TEXT NOT NULL,
+            reason      TEXT NOT NULL,
+            PRIMARY KEY (trainee_id, epoch)
+        )
+    """)
+
+
+def import_activity_json(connection, path):
+    """
+    Merge a legacy {"<trainee_id>": "YYYY-MM-DD"} file into trainee_activity,
+    keeping the newer date when a trainee already has one. Returns the row
+    count; the caller commits.
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"Skipping activity import from {path}: {e}")
+        return 0
+
+    rows = []
+    for trainee_id, day in data.items():
+        try:
+            rows.append((int(trainee_id), f"{str(day)[:10]} 00:00:00"))
+        except (TypeError, ValueError):
+            continue
+
+    connection.executemany("""
+        INSERT INTO trainee_activity (trainee_id, last_active) VALUES (?, ?)
+        ON CONFLICT(trainee_id) DO UPDATE
+        SET last_active = MAX(last_active, excluded.last_active)
+    """, rows)
+    return len(rows)
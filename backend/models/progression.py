@@ -0,0 +1,113 @@
+"""
+progression.py
+Plan progression rules for SmartARTrainer, free of Qt and database access.
+evaluate() turns a trainee's aggregated session totals into a
+ProgressionDecision in one pass; callers (AnalyticsScreen, batch tools)
+decide how to apply it.
+
+Rules:
+- points: +2 per correct rep, -1 per wrong rep, +2 per second held
+- success rate: correct / total reps; for holds, time held / (target x sessions)
+- promotion: points >= the plan's max points AND every exercise >= 60 %
+- after SESSIONS_PER_LEVEL sessions without meeting them, the level restarts
+(Inactivity resets are done by the inactivity sweep, see data_manager.)
+"""
+
+SESSIONS_PER_LEVEL = 60
+PASS_RATE = 60              # % every exercise needs for promotion
+MAX_PLAN = 3
+
+LEVEL_NAMES = {
+    1: "Beginner",
+    2: "Intermediate",
+    3: "Advanced"
+}
+
+# decision.action values
+KEEP = "keep"
+PROMOTE = "promote"
+RESTART = "restart"
+
+
+def is_timed(name):
+    return "Time" in name or "Plank" in name or "Cobra" in name
+
+
+def plan_targets(plan_data):
+    """get_workout_plan() rows -> {"Jumping Jacks": 15, "Plank": 10, ...}"""
+    return {ex["name"]: ex["target"] for ex in plan_data}
+
+
+def plan_max_points(plan_data):
+    """Points needed for promotion: 2 per target rep / second, x4"""
+    total = 0
+    for ex in plan_data:
+        total += (ex["target"] or 0) * 2
+    return total * 4
+
+
+def next_plan(plan_id):
+    if plan_id == 1:
+        return 2
+    elif plan_id == 2:
+        return 3
+    return MAX_PLAN   # already max
+
+
+class ProgressionDecision:
+    """Outcome of evaluate(); `action` is KEEP, PROMOTE or RESTART"""
+
+    def __init__(self, action, plan_id, new_plan_id, total_points, max_points, rates, sessions, eligible):
+        self.action = action
+        self.plan_id = plan_id
+        self.new_plan_id = new_plan_id
+        self.total_points = total_points
+        self.max_points = max_points
+        self.rates = rates              # exercise -> success %
+        self.sessions = sessions
+        self.eligible = eligible        # meets the promotion rule (even at the top plan)
+
+    @property
+    def resets_sessions(self):
+        return self.action in (PROMOTE, RESTART)
+
+    @property
+    def new_level(self):
+        return LEVEL_NAMES.get(self.new_plan_id, "Custom")
+
+    def __repr__(self):
+        return (f"ProgressionDecision({self.action}, plan {self.plan_id}->{self.new_plan_id}, "
+                f"{self.total_points}/{self.max_points} pts, {self.sessions} sessions)")
+
+
+def evaluate(totals, sessions, plan_id, targets, max_points):
+    """
+    totals:     SessionTotals (rep_totals / time_totals / time_counts)
+    sessions:   number of sessions in the current level
+    targets:    plan_targets() of the current plan
+    max_points: plan_max_points() of the current plan
+    """
+    points = 0
+    rates = {}
+
+    for name, (total, correct, wrong) in totals.rep_totals.items():
+        points += correct * 2 - wrong
+        rates[name] = (correct / total) * 100 if total > 0 else 0
+
+    for name, seconds in totals.time_totals.items():
+        points += seconds * 2
+        target = targets.get(name, 0)
+        count = totals.time_counts.get(name, 0)
+        rates[name] = (seconds / (target * count)) * 100 if target > 0 and count > 0 else 0
+
+    eligible = points >= max_points and all(rate >= PASS_RATE for rate in rates.values())
+    promoted_to = next_plan(plan_id)
+
+    if eligible and promoted_to != plan_id:
+        action, new_plan = PROMOTE, promoted_to
+    elif sessions >= SESSIONS_PER_LEVEL and not eligible:
+        action, new_plan = RESTART, plan_id
+    else:
+        action, new_plan = KEEP, plan_id
+
+    return ProgressionDecision(action, plan_id, new_plan, points, max_points, rates, sessions, eligible)
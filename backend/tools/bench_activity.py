@@ -0,0 +1,103 @@
+"""
+Benchmark: last-activity reads and writes with thousands of trainees
+Compares, on a scratch database seeded with --trainees entries:
+  json     - the old tracker: parse (and for writes rewrite) a whole
+             last_activity.json per call
+  sql      - one primary-key query / upsert per call (touch_activity, as
+             save_workout_session records it)
+
+Usage (from the project root):
+    python -m backend.tools.bench_activity --trainees 5000 --ops 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+
+def per_op_us(fn, ops):
+    t0 = time.perf_counter()
+    for i in range(ops):
+        fn(i)
+    return (time.perf_counter() - t0) * 1e6 / ops
+
+
+def json_tracker(path):
+    """The pre-database implementation, kept here as the baseline"""
+    def read(trainee_id):
+        with open(path, "r") as f:
+            return json.load(f).get(str(trainee_id))
+
+    def write(trainee_id):
+        with open(path, "r") as f:
+            data = json.load(f)
+        data[str(trainee_id)] = datetime.today().strftime("%Y-%m-%d")
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    return read, write
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--trainees", type=int, default=5000)
+    parser.add_argument("--ops", type=int, default=2000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="smartar-activity-")
+    db_path = os.path.join(workdir, "bench.db")
+    json_path = os.path.join(workdir, "last_activity.json")
+
+    # the scratch database must be chosen before the backend is imported
+    os.environ["SMARTAR_DB_PATH"] = db_path
+    from backend.models.db_config import get_db_connection, close_connection
+    from backend.utils import activity_tracker as at
+
+    rng = random.Random(7)
+    today = datetime.today()
+    seed = {tid: (today - timedelta(days=rng.randint(0, 90))).strftime("%Y-%m-%d 00:00:00")
+            for tid in range(1, args.trainees + 1)}
+
+    connection = get_db_connection()
+    with connection:
+        connection.executemany("INSERT OR REPLACE INTO trainee_activity (trainee_id, last_active) VALUES (?, ?)", list(seed.items()))
+    close_connection(connection)
+    with open(json_path, "w") as f:
+        json.dump({str(k): v[:10] for k, v in seed.items()}, f)
+
+    ids = [rng.randint(1, args.trainees) for _ in range(args.ops)]
+    read_json, write_json = json_tracker(json_path)
+
+    def read_sql(i):
+        conn = get_db_connection()
+        conn.execute("SELECT last_active FROM trainee_activity WHERE trainee_id = ?", (ids[i],)).fetchone()
+        close_connection(conn)
+
+    def write_sql(i):
+        conn = get_db_connection()
+        at.touch_activity(conn.cursor(), ids[i])
+        conn.commit()
+        close_connection(conn)
+
+    write_ops = max(1, args.ops // 10)
+    rows = [
+        ("json", per_op_us(lambda i: read_json(ids[i]), args.ops),
+         per_op_us(lambda i: write_json(ids[i]), write_ops)),
+        ("sql", per_op_us(read_sql, args.ops), per_op_us(write_sql, write_ops)),
+    ]
+
+    print(f"{args.trainees} trainees, {args.ops} reads, JSON/SQL writes: {write_ops}")
+    print(f"{'backend':<10}{'read us/op':>12}{'write us/op':>13}")
+    for name, read, write in rows:
+        print(f"{name:<10}{read:>12.1f}{write:>13.1f}")
+
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
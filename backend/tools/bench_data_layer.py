@@ -0,0 +1,183 @@
+"""
+Benchmark: data_manager at 1k / 100k / 1M sessions
+For each --sessions size a scratch database is generated
+(backend.tools.generate_data) and timed in a fresh process:
+  login_user                  random trainee, correct password
+  get_latest_session_status   random trainee
+  load_sessions               random trainee / the most active trainee
+  aggregate + evaluate        analytics for that trainee (no database)
+  save_workout_session        one session per call, committed
+Reported as microseconds per call (median of the calls).
+
+Usage (from the project root):
+    python -m backend.tools.bench_data_layer --sessions 1000 100000 1000000
+    python -m backend.tools.bench_data_layer --db /tmp/scale.db    # existing scratch DB
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+OPERATIONS = [
+    "login_user",
+    "get_latest_session_status",
+    "load_sessions",
+    "load_sessions (most active)",
+    "aggregate + evaluate",
+    "aggregate + evaluate (most active)",
+    "save_workout_session"
+]
+
+
+def timed(fn, args_list):
+    """Median microseconds of fn(*args) over args_list"""
+    samples = []
+    for args in args_list:
+        t0 = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples)
+
+
+def run_benchmark(calls, seed):
+    """Time the data layer against SMARTAR_DB_PATH; returns {operation: us}"""
+    from backend.models import progression
+    from backend.models.db_config import get_db_connection, close_connection
+    from backend.models.data_manager import (
+        login_user, get_latest_session_status, save_workout_session,
+        session_analytics, get_trainee_info, get_workout_plan
+    )
+
+    connection = get_db_connection()
+    trainee_ids = [row[0] for row in connection.execute("SELECT trainee_id FROM trainee")]
+    busiest = connection.execute("""
+        SELECT s.trainee_id, COUNT(*) FROM workout_session s
+        JOIN trainee t ON t.trainee_id = s.trainee_id AND s.epoch = t.level_epoch
+        GROUP BY s.trainee_id ORDER BY COUNT(*) DESC LIMIT 1
+    """).fetchone()
+    logins = {row[0]: (row[1], row[2]) for row in connection.execute("SELECT trainee_id, email, pwd FROM trainee")}
+    close_connection(connection)
+
+    rng = random.Random(seed)
+    sample = [rng.choice(trainee_ids) for _ in range(calls)]
+    busiest, sessions = busiest if busiest else (sample[0], 0)
+    plans = {}
+
+    def analytics(trainee_id):
+        # what AnalyticsScreen.refresh_data does after loading the sessions
+        plan_id = get_trainee_info(trainee_id)["plan_id"]
+        if plan_id not in plans:
+            plan_data = get_workout_plan(plan_id)
+            plans[plan_id] = (progression.plan_targets(plan_data), progression.plan_max_points(plan_data))
+        targets, max_points = plans[plan_id]
+        session_analytics.load_sessions(trainee_id)
+        t0 = time.perf_counter()
+        progression.evaluate(session_analytics.aggregate(), session_analytics.total_sessions,
+                             plan_id, targets, max_points)
+        return (time.perf_counter() - t0) * 1e6
+
+    results = {
+        "login_user": timed(login_user, [logins[tid] for tid in sample]),
+        "get_latest_session_status": timed(get_latest_session_status, [(tid,) for tid in sample]),
+        "load_sessions": timed(session_analytics.load_sessions, [(tid,) for tid in sample]),
+        "load_sessions (most active)": timed(session_analytics.load_sessions,
+                                             [(busiest,)] * max(1, calls // 10)),
+        "aggregate + evaluate": statistics.median(analytics(tid) for tid in sample),
+        "aggregate + evaluate (most active)": statistics.median(
+            analytics(busiest) for _ in range(max(1, calls // 10))
+        ),
+    }
+
+    session = {"pushup_crt": 10, "jumpingjack_crt": 12, "squat_crt": 8,
+               "crunches_crt": 9, "plank_time": 30, "cobrastretch_time": 20}
+    results["save_workout_session"] = timed(save_workout_session,
+                                            [(tid, session) for tid in sample[:max(1, calls // 5)]])
+    results["_busiest_sessions"] = sessions
+    return results
+
+
+def bench_scale(sessions, calls, seed, workdir, keep):
+    """Generate a database of `sessions` rows and benchmark it in a child process"""
+    from backend.tools.generate_data import generate
+
+    path = os.path.join(workdir, f"scale_{sessions}.db")
+    t0 = time.perf_counter()
+    if not os.path.exists(path):
+        generate(path, sessions, seed=seed)
+    generated = time.perf_counter() - t0
+
+    # a fresh interpreter per size: no caches or schema state from the previous one
+    env = dict(os.environ, SMARTAR_DB_PATH=path)
+    child = subprocess.run(
+        [sys.executable, "-m", "backend.tools.bench_data_layer", "--child",
+         "--calls", str(calls), "--seed", str(seed)],
+        env=env, capture_output=True, text=True
+    )
+    if child.returncode != 0:
+        print(child.stdout + child.stderr)
+        raise SystemExit(1)
+    results = json.loads(child.stdout.strip().splitlines()[-1])
+    results["_generate_s"] = generated
+
+    if not keep:
+        os.remove(path)
+    return results
+
+
+def print_table(labels, results):
+    print(f"\n{'us per call (median)':<36}" + "".join(f"{label:>12}" for label in labels))
+    for op in OPERATIONS:
+        print(f"{op:<36}" + "".join(f"{r[op]:>12.1f}" for r in results))
+    print(f"{'most active trainee: sessions':<36}" + "".join(f"{r['_busiest_sessions']:>12}" for r in results))
+    if all("_generate_s" in r for r in results):
+        print(f"{'generate database (s)':<36}" + "".join(f"{r['_generate_s']:>12.1f}" for r in results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--db", help="benchmark this database instead of generating ones")
+    parser.add_argument("--calls", type=int, default=500, help="calls per operation")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep", help="keep the generated databases in this directory")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_benchmark(args.calls, args.seed)))
+        return
+
+    if args.db:
+        # benchmark a copy: save_workout_session writes
+        workdir = tempfile.mkdtemp(prefix="smartar-bench-")
+        copy = os.path.join(workdir, "bench.db")
+        shutil.copyfile(args.db, copy)
+        os.environ["SMARTAR_DB_PATH"] = copy
+        try:
+            print_table([os.path.basename(args.db)], [run_benchmark(args.calls, args.seed)])
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        return
+
+    workdir = args.keep or tempfile.mkdtemp(prefix="smartar-bench-")
+    os.makedirs(workdir, exist_ok=True)
+    try:
+        results = []
+        for sessions in args.sessions:
+            print(f"{sessions:,} sessions ...", flush=True)
+            results.append(bench_scale(sessions, args.calls, args.seed, workdir, args.keep))
+        print_table([f"{n:,}" for n in args.sessions], results)
+    finally:
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: plan progression decisions over thousands of synthetic trainees
+Builds random per-exercise SessionTotals (no database involved) and runs
+progression.evaluate() on each, reporting the time per trainee and how many
+trainees would be kept, promoted or restarted.
+
+Usage (from the project root):
+    python -m backend.tools.bench_progression --trainees 10000
+"""
+
+import argparse
+import random
+import time
+
+from backend.models import progression
+from backend.models.data_manager import SessionTotals
+
+# Beginner plan shape: rep exercises and timed holds with their targets
+PLAN = [
+    {"name": "Jumping Jack", "target": 15},
+    {"name": "Push-up", "target": 10},
+    {"name": "Plank", "target": 20},
+    {"name": "Crunches", "target": 12},
+    {"name": "Squat", "target": 12},
+    {"name": "Cobra Stretch", "target": 20},
+]
+
+
+def synthetic_trainee(rng, targets):
+    """(totals, sessions) for one trainee with a random skill level"""
+    sessions = rng.randint(0, progression.SESSIONS_PER_LEVEL)
+    skill = rng.uniform(0.3, 1.0)
+    totals = SessionTotals()
+
+    for name, target in targets.items():
+        if progression.is_timed(name):
+            held = sum(int(target * rng.uniform(skill - 0.2, 1.0)) for _ in range(sessions))
+            if held > 0:
+                totals.time_totals[name] = held
+                totals.time_counts[name] = sessions
+        else:
+            done = target * sessions
+            correct = int(done * min(1.0, rng.uniform(skill - 0.1, skill + 0.1)))
+            if done:
+                totals.rep_totals[name] = [done, correct, done - correct]
+
+    return totals, sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--trainees", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    targets = progression.plan_targets(PLAN)
+    max_points = progression.plan_max_points(PLAN)
+    trainees = [(synthetic_trainee(rng, targets), rng.randint(1, progression.MAX_PLAN))
+                for _ in range(args.trainees)]
+
+    counts = {progression.KEEP: 0, progression.PROMOTE: 0, progression.RESTART: 0}
+    t0 = time.perf_counter()
+    for (totals, sessions), plan_id in trainees:
+        decision = progression.evaluate(totals, sessions, plan_id, targets, max_points)
+        counts[decision.action] += 1
+    elapsed = time.perf_counter() - t0
+
+    print(f"{args.trainees} trainees, plan max points {max_points}")
+    print(f"evaluate: {elapsed * 1e6 / max(args.trainees, 1):.2f} us/trainee, {elapsed * 1000:.1f} ms total")
+    for action, count in counts.items():
+        print(f"  {action:<8}{count:>8}")
+
+
+if __name__ == "__main__":
+    main()
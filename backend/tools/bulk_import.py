@@ -0,0 +1,418 @@
+"""
+Bulk import of trainees (gym onboarding) and historical workout sessions
+Reads CSV or JSON Lines (optionally .gz) one record at a time, validates
+each row and inserts them with executemany() in batches inside large
+transactions, instead of one register_user() connection + commit per
+member. Invalid rows and duplicate emails (trainee.email is UNIQUE) are
+reported with their line number and skipped; the rest of the batch goes in.
+
+  trainees  name, email, password (or pwd) required; dob, gender, height,
+            weight, workout_experience, workout_duration, weekly_frequency,
+            plan_id optional (plan chosen from workout_experience when
+            missing, as at sign-up)
+  sessions  trainee_id or email; pushup_crt, pushup_wrg, jumpingjack_crt,
+            jumpingjack_wrg, squat_crt, squat_wrg, crunches_crt,
+            crunches_wrg, plank_time, cobrastretch_time (missing = 0);
+            date (YYYY-MM-DD) optional, updates the trainee's last activity.
+            Sessions go into the trainee's current level.
+
+Secondary indexes of the target table are dropped for large inputs and
+rebuilt once at the end (--indexes defer / keep to force either way). The
+drop, the import and the rebuild are then one transaction: a killed import
+leaves the old indexes in place, and the app's readers (WAL) keep using
+them until the commit.
+
+Usage (from the project root):
+    python -m backend.tools.bulk_import trainees members.csv
+    python -m backend.tools.bulk_import sessions history.jsonl.gz --rejects rejects.txt
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import math
+import os
+import re
+import sqlite3
+import time
+from datetime import date
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+SESSION_COLUMNS = [
+    "pushup_crt", "pushup_wrg",
+    "jumpingjack_crt", "jumpingjack_wrg",
+    "squat_crt", "squat_wrg",
+    "crunches_crt", "crunches_wrg",
+    "plank_time", "cobrastretch_time"
+]
+
+TRAINEE_COLUMNS = [
+    "name", "email", "pwd", "dob", "gender", "height", "weight",
+    "workout_experience", "workout_duration", "weekly_frequency",
+    "plan_id", "fitness_level"
+]
+
+BATCH_ROWS = 5000           # rows per executemany()
+COMMIT_ROWS = 100000        # rows per transaction
+LOOKUP_CHUNK = 500          # emails / ids per IN (...) lookup
+
+# --indexes auto: defer index builds from about 50k rows on; below that a
+# rebuild over the whole table costs more than the per-row index updates
+DEFER_INDEXES_BYTES = 4 * 1024 * 1024
+GZIP_RATIO = 5
+
+
+# ---------------- Reading ----------------
+def read_records(path):
+    """Yield (line number, dict) from a CSV or JSONL file; bad JSON yields (line, None)"""
+    opener = gzip.open if path.endswith(".gz") else open
+    name = path[:-3] if path.endswith(".gz") else path
+
+    with opener(path, "rt", newline="", encoding="utf-8") as f:
+        if name.endswith(".csv"):
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+        elif name.endswith(".jsonl") or name.endswith(".ndjson"):
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                yield line_no, record if isinstance(record, dict) else None
+        else:
+            raise ValueError(f"Unknown input format for {path} (use .csv or .jsonl, optionally .gz)")
+
+
+# ---------------- Validation ----------------
+def _text(record, key, required=False):
+    value = record.get(key)
+    value = "" if value is None else str(value).strip()
+    if required and not value:
+        raise ValueError(f"missing {key}")
+    return value or None
+
+
+def _number(record, key, kind=float, minimum=0):
+    value = record.get(key)
+    if isinstance(value, bool) or (isinstance(value, float) and not math.isfinite(value)):
+        raise ValueError(f"{key} is not a number: {value!r}")
+    if isinstance(value, (int, float)):
+        # JSON numbers need no parsing; 2.0 is a valid count, 2.5 is not
+        if isinstance(value, float) and kind is int:
+            if not value.is_integer():
+                raise ValueError(f"{key} is not a whole number: {value!r}")
+            value = int(value)
+        number = value
+    else:
+        value = _text(record, key)
+        if value is None:
+            return None
+        try:
+            number = kind(value)
+        except ValueError:
+            raise ValueError(f"{key} is not a number: {value!r}")
+    if number < minimum:
+        raise ValueError(f"{key} must be >= {minimum}")
+    return number
+
+
+def trainee_params(record, plan_ids):
+    """Validated TRAINEE_COLUMNS values for one record (raises ValueError)"""
+    from backend.models.data_manager import determine_plan_id
+    from backend.models.progression import LEVEL_NAMES
+
+    name = _text(record, "name", required=True)
+    email = _text(record, "email", required=True)
+    if not EMAIL_PATTERN.match(email):
+        raise ValueError(f"invalid email {email!r}")
+    password = _text(record, "password") or _text(record, "pwd")
+    if not password:
+        raise ValueError("missing password")
+
+    plan_id = _number(record, "plan_id", int, minimum=1)
+    if plan_id is None:
+        plan_id = determine_plan_id(record)
+    elif plan_id not in plan_ids:
+        raise ValueError(f"unknown plan_id {plan_id}")
+
+    return (
+        name, email, password,
+        _text(record, "dob"),
+        _text(record, "gender"),
+        _number(record, "height"),
+        _number(record, "weight"),
+        _text(record, "workout_experience"),
+        _number(record, "workout_duration"),
+        _number(record, "weekly_frequency", int),
+        plan_id,
+        LEVEL_NAMES.get(plan_id, "Custom")
+    )
+
+
+def session_params(record):
+    """(trainee reference, column values, date or None) for one record (raises ValueError)"""
+    trainee_id = _number(record, "trainee_id", int, minimum=1)
+    email = _text(record, "email")
+    if trainee_id is None and email is None:
+        raise ValueError("missing trainee_id / email")
+
+    values = tuple(_number(record, col, int) or 0 for col in SESSION_COLUMNS)
+    if not any(values):
+        raise ValueError("empty session")
+
+    day = _text(record, "date")
+    if day is not None:
+        try:
+            day = f"{date.fromisoformat(day[:10]).isoformat()} 00:00:00"
+        except ValueError:
+            raise ValueError(f"invalid date {day!r}")
+
+    return trainee_id if trainee_id is not None else email, values, day
+
+
+# ---------------- Import ----------------
+def _lookup(cursor, query, keys):
+    """Run `query` (with one {} for the placeholders) over `keys` in IN (...) chunks"""
+    rows = []
+    keys = list(keys)
+    for start in range(0, len(keys), LOOKUP_CHUNK):
+        chunk = keys[start:start + LOOKUP_CHUNK]
+        cursor.execute(query.format(", ".join("?" * len(chunk))), chunk)
+        rows.extend(cursor.fetchall())
+    return rows
+
+
+class BulkImport:
+    """Validates records and writes them in batches; one instance per run"""
+
+    def __init__(self, connection, kind, batch_rows=BATCH_ROWS, commit_rows=COMMIT_ROWS, dry_run=False):
+        self.connection = connection
+        self.cursor = connection.cursor()
+        self.kind = kind
+        self.batch_rows = batch_rows
+        # a dry run stays in one transaction so later batches see earlier rows
+        self.commit_rows = float("inf") if dry_run else commit_rows
+        self.dry_run = dry_run
+
+        self.read = 0
+        self.inserted = 0
+        self.rejects = []           # (line, reason)
+        self._batch = []
+        self._uncommitted = 0
+
+        self.cursor.execute("SELECT plan_id FROM workout_plan")
+        self.plan_ids = {row[0] for row in self.cursor.fetchall()}
+
+    def reject(self, line, reason):
+        self.rejects.append((line, reason))
+
+    def add(self, line, record):
+        self.read += 1
+        if record is None:
+            self.reject(line, "unreadable record")
+            return
+        try:
+            if self.kind == "trainees":
+                params = trainee_params(record, self.plan_ids)
+            else:
+                params = session_params(record)
+        except ValueError as e:
+            self.reject(line, str(e))
+            return
+
+        self._batch.append((line, params))
+        if len(self._batch) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        if not self.connection.in_transaction:
+            self.cursor.execute("BEGIN IMMEDIATE")
+
+        if self.kind == "trainees":
+            self._insert_trainees(batch)
+        else:
+            self._insert_sessions(batch)
+
+        self._uncommitted += len(batch)
+        if self._uncommitted >= self.commit_rows:
+            self.commit()
+
+    def commit(self):
+        if not self._uncommitted:
+            return
+        if self.dry_run:
+            self.connection.rollback()
+        else:
+            self.connection.commit()
+        self._uncommitted = 0
+
+    def _insert_trainees(self, batch):
+        # duplicates against the table and inside the batch are reported by line
+        taken = {row[0] for row in _lookup(
+            self.cursor, "SELECT email FROM trainee WHERE email IN ({})",
+            {params[1] for _, params in batch}
+        )}
+        rows = []
+        for line, params in batch:
+            if params[1] in taken:
+                self.reject(line, f"duplicate email {params[1]}")
+            else:
+                taken.add(params[1])
+                rows.append(params)
+
+        # OR IGNORE keeps the batch going should another writer add an email meanwhile
+        self.cursor.executemany(f"""
+            INSERT OR IGNORE INTO trainee ({', '.join(TRAINEE_COLUMNS)})
+            VALUES ({', '.join('?' * len(TRAINEE_COLUMNS))})
+        """, rows)
+        self.inserted += self.cursor.rowcount
+        for _ in range(len(rows) - self.cursor.rowcount):
+            self.reject(None, "duplicate email (added concurrently)")
+
+    def _insert_sessions(self, batch):
+        ids = {ref for _, (ref, _, _) in batch if isinstance(ref, int)}
+        emails = {ref for _, (ref, _, _) in batch if isinstance(ref, str)}
+        epochs = dict(_lookup(self.cursor, "SELECT trainee_id, level_epoch FROM trainee WHERE trainee_id IN ({})", ids))
+        by_email = {email: (tid, epoch) for tid, email, epoch in _lookup(
+            self.cursor, "SELECT trainee_id, email, level_epoch FROM trainee WHERE email IN ({})", emails
+        )}
+
+        rows = []
+        last_active = {}
+        for line, (ref, values, day) in batch:
+            if isinstance(ref, int):
+                trainee_id, epoch = ref, epochs.get(ref)
+            else:
+                trainee_id, epoch = by_email.get(ref, (None, None))
+            if epoch is None:
+                self.reject(line, f"unknown trainee {ref}")
+                continue
+            rows.append((trainee_id, *values, epoch))
+            if day and day > last_active.get(trainee_id, ""):
+                last_active[trainee_id] = day
+
+        cols = ["trainee_id"] + SESSION_COLUMNS + ["epoch"]
+        self.cursor.executemany(f"""
+            INSERT INTO workout_session ({', '.join(cols)})
+            VALUES ({', '.join('?' * len(cols))})
+        """, rows)
+        self.inserted += len(rows)
+
+        self.cursor.executemany("""
+            INSERT INTO trainee_activity (trainee_id, last_active) VALUES (?, ?)
+            ON CONFLICT(trainee_id) DO UPDATE
+            SET last_active = MAX(last_active, excluded.last_active)
+        """, list(last_active.items()))
+
+
+def deferred_indexes(connection, table):
+    """(name, sql) of the non-unique indexes on `table`; rebuilt after the import"""
+    rows = connection.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table,)
+    ).fetchall()
+    return [(name, sql) for name, sql in rows if not sql.upper().startswith("CREATE UNIQUE")]
+
+
+def should_defer_indexes(path, mode):
+    if mode != "auto":
+        return mode == "defer"
+    size = os.path.getsize(path) * (GZIP_RATIO if path.endswith(".gz") else 1)
+    return size >= DEFER_INDEXES_BYTES
+
+
+def run_import(kind, path, batch_rows=BATCH_ROWS, commit_rows=COMMIT_ROWS, indexes="auto", dry_run=False):
+    from backend.models.db_config import get_db_connection, close_connection
+
+    connection = get_db_connection()
+    if not connection:
+        raise SystemExit(1)
+    # explicit BEGIN / COMMIT
+    connection.isolation_level = None
+
+    table = "trainee" if kind == "trainees" else "workout_session"
+    defer = should_defer_indexes(path, indexes) and not dry_run
+    indexes = deferred_indexes(connection, table) if defer else []
+    # deferred indexes: drop, import and rebuild in a single transaction
+    job = BulkImport(connection, kind, batch_rows, float("inf") if indexes else commit_rows, dry_run)
+
+    t0 = time.perf_counter()
+    t_rebuild = None
+    try:
+        if indexes:
+            connection.execute("BEGIN IMMEDIATE")
+            for name, _ in indexes:
+                connection.execute(f"DROP INDEX IF EXISTS {name}")
+        for line, record in read_records(path):
+            job.add(line, record)
+        job.flush()
+        if indexes:
+            t1 = time.perf_counter()
+            for name, sql in indexes:
+                connection.execute(sql)
+            t_rebuild = time.perf_counter() - t1
+        job.commit()
+        if connection.in_transaction:
+            connection.commit()
+    except BaseException:
+        if connection.in_transaction:
+            connection.rollback()
+        raise
+    finally:
+        close_connection(connection, job.cursor)
+
+    return job, time.perf_counter() - t0, t_rebuild
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("kind", choices=["trainees", "sessions"])
+    parser.add_argument("input", help=".csv or .jsonl file, optionally .gz")
+    parser.add_argument("--db", help="database file (default: the app database)")
+    parser.add_argument("--batch", type=int, default=BATCH_ROWS, help="rows per executemany()")
+    parser.add_argument("--commit", type=int, default=COMMIT_ROWS, help="rows per transaction")
+    parser.add_argument("--indexes", choices=["auto", "defer", "keep"], default="auto",
+                        help="drop secondary indexes and rebuild them at the end (auto: large inputs)")
+    parser.add_argument("--rejects", help="write every rejected line number and reason to this file")
+    parser.add_argument("--dry-run", action="store_true", help="validate and roll back")
+    args = parser.parse_args()
+
+    if args.db:
+        # the database must be chosen before the backend is imported
+        os.environ["SMARTAR_DB_PATH"] = os.path.abspath(args.db)
+
+    try:
+        job, elapsed, rebuild = run_import(
+            args.kind, args.input, args.batch, args.commit, args.indexes, args.dry_run
+        )
+    except (ValueError, OSError, sqlite3.Error) as e:
+        print(f"Import failed: {e}")
+        raise SystemExit(1)
+
+    action = "would insert" if args.dry_run else "inserted"
+    print(f"{job.read} {args.kind} read, {job.inserted} {action}, {len(job.rejects)} rejected "
+          f"in {elapsed:.2f} s ({job.read / max(elapsed, 1e-9):,.0f} rows/s"
+          f"{f', index rebuild {rebuild:.2f} s' if rebuild is not None else ''})")
+
+    job.rejects.sort(key=lambda reject: reject[0] or 0)
+    for line, reason in job.rejects[:10]:
+        print(f"  line {line}: {reason}")
+    if len(job.rejects) > 10:
+        print(f"  ... {len(job.rejects) - 10} more")
+
+    if args.rejects and job.rejects:
+        with open(args.rejects, "w") as f:
+            for line, reason in job.rejects:
+                f.write(f"{line}\t{reason}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Cohort report: accuracy, points and promotion state across every trainee
+Loads the current-level sessions of all trainees in one query and
+computes per-trainee metrics with NumPy grouped reductions
+(backend.models.cohort). --check recomputes every trainee the way the
+analytics screen does (SessionAnalytics + progression.evaluate) and
+compares the results.
+
+Requires NumPy.
+
+Usage (from the project root):
+    python -m backend.tools.cohort_report [--near 20] [--json] [--check]
+    python -m backend.tools.cohort_report --db other.db --all-levels
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+
+
+def check(metrics):
+    """Compare the vectorized metrics with the per-trainee path; returns mismatches"""
+    from backend.models import progression
+    from backend.models.cohort import EXERCISES
+    from backend.models.data_manager import session_analytics
+
+    plans = {}
+    mismatches = 0
+    for i, trainee_id in enumerate(metrics.trainee_ids.tolist()):
+        plan_id = int(metrics.plan_ids[i])
+        if plan_id not in plans:
+            from backend.models.data_manager import get_workout_plan
+            plan_data = get_workout_plan(plan_id)
+            plans[plan_id] = (progression.plan_targets(plan_data), progression.plan_max_points(plan_data))
+        targets, max_points = plans[plan_id]
+
+        session_analytics.load_sessions(trainee_id)
+        decision = progression.evaluate(
+            session_analytics.aggregate(), session_analytics.total_sessions,
+            plan_id, targets, max_points
+        )
+        rates_ok = all(
+            math.isclose(decision.rates[name], metrics.rates[i, j], abs_tol=1e-9)
+            if name in decision.rates else math.isnan(metrics.rates[i, j])
+            for j, name in enumerate(EXERCISES)
+        )
+        if (decision.total_points != metrics.points[i] or decision.eligible != metrics.eligible[i]
+                or decision.sessions != metrics.sessions[i] or not rates_ok):
+            mismatches += 1
+            print(f"  mismatch for trainee {trainee_id}: {decision}")
+    return mismatches
+
+
+def print_report(summary, metrics, near):
+    print(f"{summary['trainees']} trainees ({summary['active_trainees']} active), "
+          f"{summary['sessions']} sessions in the current levels")
+    print(f"eligible for promotion: {summary['eligible']}, "
+          f"near promotion: {summary['near_promotion']}, "
+          f"level restart due: {summary['restart_due']}")
+
+    print("\nPlans")
+    for plan_id, plan in summary["plans"].items():
+        print(f"  {plan_id} {plan['level']:<13}{plan['trainees']:>8} trainees  "
+              f"mean points {plan['mean_points']:.0f}/{plan['max_points']:.0f}")
+
+    if summary["progress"]:
+        p = summary["progress"]
+        print(f"\nPoints vs plan max (%): mean {p['mean']:.1f}  "
+              f"p10 {p['p10']:.1f}  p50 {p['p50']:.1f}  p90 {p['p90']:.1f}")
+
+    print("\nAccuracy (% per trainee)")
+    print(f"  {'exercise':<15}{'trainees':>9}{'mean':>8}{'p10':>8}{'p25':>8}{'p50':>8}{'p75':>8}{'p90':>8}{'>=60%':>8}")
+    for name, a in summary["accuracy"].items():
+        print(f"  {name:<15}{a['trainees']:>9}{a['mean']:>8.1f}{a['p10']:>8.1f}{a['p25']:>8.1f}"
+              f"{a['p50']:>8.1f}{a['p75']:>8.1f}{a['p90']:>8.1f}{a['passing']:>7.1f}%")
+
+    index = metrics.near_promotion()[:near]
+    if len(index):
+        print(f"\nNear promotion (top {len(index)})")
+        for i in index.tolist():
+            print(f"  trainee {int(metrics.trainee_ids[i]):<8} plan {int(metrics.plan_ids[i])}  "
+                  f"{metrics.points[i]:.0f}/{metrics.max_points[i]:.0f} pts  "
+                  f"lowest rate {metrics.min_rate[i]:.0f}%  {int(metrics.sessions[i])} sessions")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", help="database file (default: the app database)")
+    parser.add_argument("--all-levels", action="store_true", help="include sessions of finished levels")
+    parser.add_argument("--near", type=int, default=10, help="near-promotion trainees to list")
+    parser.add_argument("--json", action="store_true", help="print the cohort summary as JSON")
+    parser.add_argument("--check", action="store_true", help="verify against the per-trainee analytics")
+    args = parser.parse_args()
+
+    if args.db:
+        # the database must be chosen before the backend is imported
+        os.environ["SMARTAR_DB_PATH"] = os.path.abspath(args.db)
+
+    try:
+        from backend.models import cohort
+    except ImportError as e:
+        print(f"Cohort report needs NumPy: {e}")
+        raise SystemExit(1)
+    from backend.models.db_config import get_db_connection, close_connection
+
+    connection = get_db_connection()
+    if not connection:
+        raise SystemExit(1)
+
+    t0 = time.perf_counter()
+    try:
+        arrays = cohort.load_session_arrays(connection, all_levels=args.all_levels)
+    finally:
+        close_connection(connection)
+    t_load = time.perf_counter()
+    metrics = cohort.TraineeMetrics(arrays, cohort.load_plans(arrays.plan_ids))
+    summary = cohort.cohort_summary(metrics)
+    t_done = time.perf_counter()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary, metrics, args.near)
+        print(f"\nload {(t_load - t0) * 1000:.0f} ms, metrics {(t_done - t_load) * 1000:.0f} ms "
+              f"({arrays.session_count} sessions)")
+
+    if args.check:
+        if args.all_levels:
+            print("--check compares the current levels only; ignored with --all-levels")
+            return
+        mismatches = check(metrics)
+        print(f"check: {len(metrics) - mismatches}/{len(metrics)} trainees match")
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Export workout session history to a columnar file for offline analysis
+Streams workout_session joined to trainee and the plan each session was
+recorded on, cursor.fetchmany() chunk by chunk, so memory stays constant
+whatever the table size. The database is opened read-only (WAL readers do
+not block the app) and the output is written to a temporary file that
+replaces the target only when complete.
+
+Formats, picked from the file extension:
+  .parquet   Parquet, one row group per chunk     (needs pyarrow)
+  .arrow     Arrow IPC file, one batch per chunk  (needs pyarrow)
+  .csv       CSV, also .csv.gz                    (always available)
+Only ids and workout data are exported, no names, emails or passwords.
+
+Usage (from the project root):
+    python -m backend.tools.export_sessions sessions.parquet
+    python -m backend.tools.export_sessions sessions.csv.gz --db copy.db --chunk 5000
+"""
+
+import argparse
+import csv
+import gzip
+import os
+import pathlib
+import sqlite3
+import time
+
+from backend.models import db_config
+
+CHUNK_ROWS = 20000
+
+SESSION_COLUMNS = [
+    "pushup_crt", "pushup_wrg",
+    "jumpingjack_crt", "jumpingjack_wrg",
+    "squat_crt", "squat_wrg",
+    "crunches_crt", "crunches_wrg",
+    "plank_time", "cobrastretch_time"
+]
+
+TARGET_COLUMNS = [
+    "jumpingjack_count", "pushup_count", "plank_time",
+    "crunches_count", "squat_count", "cobra_stretch_time"
+]
+
+# (name, arrow type) of every exported column, in query order
+EXPORT_COLUMNS = (
+    [("session_id", "int64"), ("trainee_id", "int64"), ("epoch", "int64"),
+     ("current_level", "bool_"), ("plan_id", "int64"),
+     ("gender", "string"), ("workout_experience", "string")]
+    + [(col, "int64") for col in SESSION_COLUMNS]
+    + [(f"target_{col}", "int64") for col in TARGET_COLUMNS]
+)
+
+
+def open_read_only(path):
+    return sqlite3.connect(pathlib.Path(path).resolve().as_uri() + "?mode=ro", uri=True)
+
+
+def export_query(connection):
+    """SELECT for EXPORT_COLUMNS; databases without level epochs (schema < 3) export epoch 0"""
+    session_cols = {row[1] for row in connection.execute("PRAGMA table_info(workout_session)")}
+    has_history = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'level_history'"
+    ).fetchone()
+
+    if "epoch" in session_cols and has_history:
+        epoch = "s.epoch, s.epoch = t.level_epoch"
+        history = "LEFT JOIN level_history h ON h.trainee_id = s.trainee_id AND h.epoch = s.epoch"
+        plan = "COALESCE(h.plan_id, t.plan_id)"
+    else:
+        epoch, history, plan = "0, 1", "", "t.plan_id"
+
+    return f"""
+        SELECT s.session_id, s.trainee_id, {epoch}, {plan},
+               t.gender, t.workout_experience,
+               {', '.join(f's.{col}' for col in SESSION_COLUMNS)},
+               {', '.join(f'p.{col}' for col in TARGET_COLUMNS)}
+        FROM workout_session s
+        LEFT JOIN trainee t ON t.trainee_id = s.trainee_id
+        {history}
+        LEFT JOIN workout_plan p ON p.plan_id = {plan}
+        ORDER BY s.session_id
+    """
+
+
+# ---------------- Writers ----------------
+class CSVExport:
+    def __init__(self, path, compress=False):
+        opener = gzip.open if compress else open
+        self.file = opener(path, "wt", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([name for name, _ in EXPORT_COLUMNS])
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class ArrowExport:
+    def __init__(self, path, kind):
+        import pyarrow as pa
+
+        self.pa = pa
+        self.schema = pa.schema([(name, getattr(pa, kind_)()) for name, kind_ in EXPORT_COLUMNS])
+        if kind == "parquet":
+            import pyarrow.parquet as pq
+            self.writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+        else:
+            self.writer = pa.ipc.new_file(path, self.schema)
+
+    def column(self, values, field):
+        if field.type == self.pa.bool_():
+            # SQLite returns comparisons as 0 / 1
+            return self.pa.array(values, type=self.pa.int8()).cast(field.type)
+        return self.pa.array(values, type=field.type)
+
+    def write(self, rows):
+        columns = [self.column(values, field) for values, field in zip(zip(*rows), self.schema)]
+        self.writer.write_batch(self.pa.RecordBatch.from_arrays(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def output_format(path):
+    name = path.lower()
+    if name.endswith(".parquet"):
+        return "parquet"
+    if name.endswith(".arrow") or name.endswith(".feather"):
+        return "arrow"
+    if name.endswith(".csv.gz"):
+        return "csv.gz"
+    if name.endswith(".csv"):
+        return "csv"
+    return None
+
+
+def export_sessions(db_path, out_path, chunk_rows=CHUNK_ROWS):
+    """Stream every session into out_path; returns the row count"""
+    kind = output_format(out_path)
+    if kind is None:
+        raise ValueError(f"Unknown export format for {out_path} (use .parquet, .arrow, .csv or .csv.gz)")
+
+    # the compression follows the target name, not the ".part" temporary file
+    tmp_path = out_path + ".part"
+    if kind in ("csv", "csv.gz"):
+        writer = CSVExport(tmp_path, compress=kind == "csv.gz")
+    else:
+        writer = ArrowExport(tmp_path, kind)
+
+    rows_written = 0
+    try:
+        try:
+            connection = open_read_only(db_path)
+            try:
+                cursor = connection.execute(export_query(connection))
+                while True:
+                    rows = cursor.fetchmany(chunk_rows)
+                    if not rows:
+                        break
+                    writer.write(rows)
+                    rows_written += len(rows)
+            finally:
+                connection.close()
+        finally:
+            writer.close()
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, out_path)
+    return rows_written
+
+
+def peak_rss_mib():
+    """Peak resident memory of this process in MiB, None where unavailable (Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output", help="target file: .parquet, .arrow, .csv or .csv.gz")
+    parser.add_argument("--db", default=db_config.DB_PATH, help="database file (default: the app database)")
+    parser.add_argument("--chunk", type=int, default=CHUNK_ROWS, help="rows per fetchmany() / row group")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    try:
+        rows = export_sessions(args.db, args.output, args.chunk)
+    except ImportError as e:
+        print(f"{output_format(args.output)} export needs pyarrow ({e}); use a .csv or .csv.gz target")
+        raise SystemExit(1)
+    except (ValueError, sqlite3.Error, OSError) as e:
+        print(f"Export failed: {e}")
+        raise SystemExit(1)
+
+    elapsed = time.perf_counter() - t0
+    size = os.path.getsize(args.output)
+    peak = peak_rss_mib()
+    print(f"Exported {rows} sessions to {args.output} ({size / 1e6:.1f} MB) "
+          f"in {elapsed:.1f} s, {rows / max(elapsed, 1e-9):,.0f} rows/s"
+          + (f", max RSS {peak:.0f} MiB" if peak is not None else ""))
+
+
+if __name__ == "__main__":
+    main()
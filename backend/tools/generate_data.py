@@ -0,0 +1,202 @@
+"""
+Generate a scratch database with synthetic trainees and session histories
+Copies the schema, workouts and workout plans of the app database into a
+new file (never touching its trainees or sessions), then simulates --days
+of training: each day a share of the --sessions total is spread over the
+trainees, weighted by how often each one trains. Every trainee has a plan
+(1-3), a skill level that improves slowly, and levels of 25-60 sessions
+that end in a promotion or a restart, so workout_session, level_history
+and trainee_activity look like a real gym's history. Trainee i logs in
+with trainee<i>@example.com / password<i>.
+
+Usage (from the project root):
+    python -m backend.tools.generate_data /tmp/scale.db --sessions 100000
+    python -m backend.tools.generate_data /tmp/scale.db --sessions 1000000 --trainees 40000 --seed 3
+"""
+
+import argparse
+import bisect
+import itertools
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+from backend.models import db_config, progression
+
+SESSIONS_PER_TRAINEE = 25   # default --trainees = --sessions / this
+PLAN_WEIGHTS = [0.5, 0.3, 0.2]
+PROMOTE_SKILL = 0.72        # skill needed to pass a level early
+
+REP_EXERCISES = [
+    # (workout_plan target column, correct column, wrong column)
+    ("pushup_count", "pushup_crt", "pushup_wrg"),
+    ("jumpingjack_count", "jumpingjack_crt", "jumpingjack_wrg"),
+    ("squat_count", "squat_crt", "squat_wrg"),
+    ("crunches_count", "crunches_crt", "crunches_wrg")
+]
+TIMED_EXERCISES = [
+    ("plank_time", "plank_time"),
+    ("cobra_stretch_time", "cobrastretch_time")
+]
+SESSION_COLUMNS = (["trainee_id"]
+                   + [col for _, crt, wrg in REP_EXERCISES for col in (crt, wrg)]
+                   + [col for _, col in TIMED_EXERCISES]
+                   + ["epoch"])
+
+
+def create_database(path, source=db_config.DEFAULT_DB_PATH):
+    """New file with the source's schema and plan data, migrated to SCHEMA_VERSION"""
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} already exists")
+
+    src = sqlite3.connect(f"file:{os.path.abspath(source)}?mode=ro", uri=True)
+    dst = sqlite3.connect(path)
+    try:
+        schema = src.execute("""
+            SELECT sql FROM sqlite_master
+            WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%'
+            ORDER BY type = 'index'
+        """).fetchall()
+        version = src.execute("PRAGMA user_version").fetchone()[0]
+        with dst:
+            for (sql,) in schema:
+                dst.execute(sql)
+            for table in ("workout", "workout_plan"):
+                rows = src.execute(f"SELECT * FROM {table}").fetchall()
+                if rows:
+                    dst.executemany(f"INSERT INTO {table} VALUES ({', '.join('?' * len(rows[0]))})", rows)
+            dst.execute(f"PRAGMA user_version = {version}")
+        db_config.migrate(dst)
+    finally:
+        src.close()
+        dst.close()
+
+
+class Trainee:
+    def __init__(self, trainee_id, rng):
+        self.trainee_id = trainee_id
+        self.plan_id = rng.choices([1, 2, 3], PLAN_WEIGHTS)[0]
+        self.skill = min(0.98, rng.betavariate(5, 2.5))
+        self.epoch = 0
+        self.in_level = 0
+        self.level_length = 0
+        self.last_active = None
+        self.new_level(rng)
+
+    def new_level(self, rng):
+        self.in_level = 0
+        promotable = self.skill >= PROMOTE_SKILL and self.plan_id < progression.MAX_PLAN
+        self.level_length = rng.randint(25, 59) if promotable else progression.SESSIONS_PER_LEVEL
+
+
+def session_row(trainee, targets, rng):
+    """One session's column values around the trainee's skill and plan targets"""
+    skill = trainee.skill
+    row = [trainee.trainee_id]
+    for target_col, _, _ in REP_EXERCISES:
+        if rng.random() < 0.1:          # skipped exercise
+            row += [0, 0]
+            continue
+        done = max(1, round(targets[target_col] * rng.uniform(0.6, 1.1)))
+        correct = min(done, max(0, round(done * rng.gauss(skill, 0.1))))
+        row += [correct, done - correct]
+    for target_col, _ in TIMED_EXERCISES:
+        held = 0 if rng.random() < 0.1 else round(targets[target_col] * rng.uniform(skill - 0.25, 1.05))
+        row.append(max(0, held))
+    row.append(trainee.epoch)
+    return row
+
+
+def generate(path, sessions, trainees=None, days=365, seed=1, today=None):
+    """Fill a new scratch database at `path`; returns (trainees, sessions, levels ended)"""
+    trainees = trainees or max(1, sessions // SESSIONS_PER_TRAINEE)
+    today = today or datetime.today()
+    rng = random.Random(seed)
+
+    create_database(path)
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode = OFF")
+    connection.execute("PRAGMA synchronous = OFF")
+
+    cursor = connection.execute("SELECT * FROM workout_plan")
+    names = [d[0] for d in cursor.description]
+    plans = {row[0]: {name: (value or 0) for name, value in zip(names, row)} for row in cursor.fetchall()}
+
+    people = [Trainee(i + 1, rng) for i in range(trainees)]
+    for person in people:
+        if person.plan_id not in plans:
+            person.plan_id = min(plans)
+    # how often each trainee trains: a few regulars, many occasional members
+    cum_weights = list(itertools.accumulate(rng.paretovariate(1.5) for _ in people))
+    history = []
+
+    def simulate():
+        per_day, extra = divmod(sessions, days)
+        for day in range(days):
+            stamp = (today - timedelta(days=days - 1 - day)).strftime("%Y-%m-%d %H:%M:%S")
+            for _ in range(per_day + (1 if day < extra else 0)):
+                person = people[bisect.bisect_left(cum_weights, rng.random() * cum_weights[-1])]
+                yield session_row(person, plans[person.plan_id], rng)
+                person.last_active = stamp
+                person.in_level += 1
+                if person.in_level >= person.level_length:
+                    promoted = person.skill >= PROMOTE_SKILL and person.plan_id < progression.MAX_PLAN
+                    history.append((person.trainee_id, person.epoch, person.plan_id, stamp,
+                                    progression.PROMOTE if promoted else progression.RESTART))
+                    if promoted and person.plan_id + 1 in plans:
+                        person.plan_id += 1
+                    person.epoch += 1
+                    person.skill = min(0.98, person.skill + rng.uniform(0, 0.05))
+                    person.new_level(rng)
+
+    with connection:
+        connection.executemany(
+            f"INSERT INTO workout_session ({', '.join(SESSION_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(SESSION_COLUMNS))})",
+            simulate()
+        )
+        connection.executemany("""
+            INSERT INTO trainee (trainee_id, name, email, pwd, gender, workout_experience,
+                                 weekly_frequency, plan_id, fitness_level, level_epoch)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            (p.trainee_id, f"Trainee {p.trainee_id}", f"trainee{p.trainee_id}@example.com",
+             f"password{p.trainee_id}", rng.choice(["Male", "Female"]),
+             progression.LEVEL_NAMES.get(p.plan_id, "Custom"), rng.randint(1, 6),
+             p.plan_id, progression.LEVEL_NAMES.get(p.plan_id, "Custom"), p.epoch)
+            for p in people
+        ))
+        connection.executemany("INSERT INTO level_history VALUES (?, ?, ?, ?, ?)", history)
+        connection.executemany(
+            "INSERT INTO trainee_activity (trainee_id, last_active) VALUES (?, ?)",
+            ((p.trainee_id, p.last_active) for p in people if p.last_active)
+        )
+    connection.execute("ANALYZE")
+    connection.close()
+    return trainees, sessions, len(history)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output", help="new database file")
+    parser.add_argument("--sessions", type=int, default=100000)
+    parser.add_argument("--trainees", type=int, help=f"default: sessions / {SESSIONS_PER_TRAINEE}")
+    parser.add_argument("--days", type=int, default=365, help="length of the simulated history")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    try:
+        trainees, sessions, levels = generate(args.output, args.sessions, args.trainees, args.days, args.seed)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Generation failed: {e}")
+        raise SystemExit(1)
+    size = os.path.getsize(args.output) / 1e6
+    print(f"{args.output}: {trainees} trainees, {sessions} sessions, {levels} finished levels "
+          f"({size:.1f} MB) in {time.perf_counter() - t0:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
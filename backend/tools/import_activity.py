@@ -0,0 +1,37 @@
+"""
+Import a legacy last_activity.json into the trainee_activity table
+The project-root file is imported automatically on first start; use this
+for copies that were written elsewhere (the old tracker resolved the file
+against the current working directory). Newer dates already in the
+database are kept.
+
+Usage (from the project root):
+    python -m backend.tools.import_activity path/to/last_activity.json [...]
+"""
+
+import argparse
+
+from backend.models.db_config import get_db_connection, close_connection, import_activity_json, DB_PATH
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="+", help="last_activity.json file(s)")
+    args = parser.parse_args()
+
+    connection = get_db_connection()
+    if not connection:
+        raise SystemExit(1)
+
+    try:
+        with connection:
+            for path in args.files:
+                count = import_activity_json(connection, path)
+                print(f"{path}: {count} record(s)")
+    finally:
+        close_connection(connection)
+    print(f"Database: {DB_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Inactivity sweep: reset every trainee inactive for 30+ days
+Finds them with one indexed query on trainee_activity.last_active, starts
+them on a new level epoch (old sessions stay as history) and queues the
+"progress restarted" notice in a single transaction. Trainees already
+reset since their last activity are skipped, so the sweep can run as often
+as wanted; the app runs it at startup, on every login and hourly.
+
+Usage (from the project root):
+    python -m backend.tools.inactivity_sweep [--days 30] [--dry-run]
+"""
+
+import argparse
+import time
+
+from backend.models.data_manager import reset_inactive_trainees
+from backend.utils.activity_tracker import INACTIVITY_DAYS
+
+
+def run_sweep(days=INACTIVITY_DAYS, dry_run=False, verbose=True):
+    t0 = time.perf_counter()
+    trainee_ids, message = reset_inactive_trainees(days, dry_run=dry_run)
+    if verbose or trainee_ids:
+        print(f"Inactivity sweep: {message} ({(time.perf_counter() - t0) * 1000:.1f} ms)")
+    return trainee_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=INACTIVITY_DAYS)
+    parser.add_argument("--dry-run", action="store_true", help="only list the trainees")
+    args = parser.parse_args()
+
+    trainee_ids = run_sweep(args.days, args.dry_run)
+    if trainee_ids:
+        print("Trainees:", ", ".join(str(t) for t in trainee_ids))
+
+
+if __name__ == "__main__":
+    main()
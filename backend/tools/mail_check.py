@@ -0,0 +1,186 @@
+"""
+Mail delivery check against a local SMTP stand-in
+Starts a throwaway SMTP server on localhost (aiosmtpd when installed,
+otherwise a minimal built-in one), sends OTP emails through the
+MailDispatcher and reports how long submit() blocked the caller versus
+how long delivery took. --fail-first N makes the stand-in answer
+"451 try again later" to the first N messages to exercise retry/backoff,
+--drop-after N makes it hang up after N messages on a connection to
+exercise the transparent reconnect, and --fresh compares against opening a
+new connection per message (the pre-keep-alive behaviour).
+
+To point the app itself at a stand-in, run with --serve and start the app
+with SMTP_HOST=127.0.0.1 SMTP_PORT=<port> SMTP_FROM=noreply@smartar.local.
+
+Usage (from the project root):
+    python -m backend.tools.mail_check --count 20 --fail-first 2
+    python -m backend.tools.mail_check --count 20 --delay 0.05 [--fresh]
+    python -m backend.tools.mail_check --serve --port 8025
+"""
+
+import argparse
+import socketserver
+import threading
+import time
+
+from backend.utils.email_service import SMTPConfig, SMTPSession, build_otp_message, generate_otp
+from backend.utils.mail_dispatcher import MailDispatcher
+
+
+class SinkServer(socketserver.ThreadingTCPServer):
+    """Minimal SMTP server that accepts (or defers) and counts messages"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, fail_first=0, delay=0.0, verbose=False, drop_after=0):
+        super().__init__(address, SinkHandler)
+        self.fail_first = fail_first
+        self.drop_after = drop_after    # hang up after this many messages per connection
+        self.delay = delay              # seconds before each reply, to mimic a slow server
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.received = []
+        self.deferred = 0
+        self.connections = 0
+
+
+class SinkHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        with self.server.lock:
+            self.server.connections += 1
+        self.reply("220 smartar-sink ESMTP")
+        recipients = []
+        accepted = 0
+
+        for raw in self.rfile:
+            command = raw.decode(errors="replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 smartar-sink")
+            elif verb == "MAIL":
+                with self.server.lock:
+                    defer = self.server.deferred < self.server.fail_first
+                    if defer:
+                        self.server.deferred += 1
+                self.reply("451 Try again later" if defer else "250 OK")
+            elif verb == "RCPT":
+                recipients.append(command.split(":", 1)[-1].strip(" <>"))
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                for data in self.rfile:
+                    if data.rstrip(b"\r\n") == b".":
+                        break
+                    lines.append(data)
+                with self.server.lock:
+                    self.server.received.append((recipients, b"".join(lines)))
+                if self.server.verbose:
+                    print(f"[sink] message for {', '.join(recipients)}")
+                recipients = []
+                self.reply("250 OK queued")
+                accepted += 1
+                if self.server.drop_after and accepted >= self.server.drop_after:
+                    return      # hang up without QUIT, like a server timing out
+            elif verb in ("RSET", "NOOP"):
+                recipients = [] if verb == "RSET" else recipients
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+def start_sink(port=0, fail_first=0, delay=0.0, verbose=False, drop_after=0):
+    server = SinkServer(("127.0.0.1", port), fail_first, delay, verbose, drop_after)
+    threading.Thread(target=server.serve_forever, name="smtp-sink", daemon=True).start()
+    return server
+
+
+def serve(port, fail_first, delay):
+    try:
+        from aiosmtpd.controller import Controller
+        from aiosmtpd.handlers import Debugging
+    except ImportError:
+        server = start_sink(port, fail_first, delay, verbose=True)
+        print(f"Built-in SMTP stand-in on 127.0.0.1:{server.server_address[1]} (Ctrl+C to stop)")
+    else:
+        controller = Controller(Debugging(), hostname="127.0.0.1", port=port)
+        controller.start()
+        print(f"aiosmtpd stand-in on 127.0.0.1:{port} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+
+
+def check(count, fail_first, delay, backoff, drop_after=0, fresh=False):
+    server = start_sink(0, fail_first, delay, drop_after=drop_after)
+    config = SMTPConfig(host="127.0.0.1", port=server.server_address[1],
+                        from_addr="noreply@smartar.local", starttls=False, timeout=5)
+    # idle_timeout=0: every send finds the connection expired and reconnects
+    session = SMTPSession(idle_timeout=0 if fresh else 60)
+    dispatcher = MailDispatcher(config, backoff=backoff, session=session)
+
+    done = threading.Event()
+    results = []
+
+    def finished(job, error=None):
+        results.append((job, time.perf_counter() - job.submitted, error))
+        if len(results) == count:
+            done.set()
+
+    submit_ms = []
+    for i in range(count):
+        message = build_otp_message(config, f"trainee{i}@example.com", generate_otp())
+        t0 = time.perf_counter()
+        dispatcher.submit(message, on_sent=finished,
+                          on_failed=lambda job, error: finished(job, error))
+        submit_ms.append((time.perf_counter() - t0) * 1000)
+
+    done.wait(timeout=60 + count * (delay * 8 + 1))
+    dispatcher.shutdown()
+    server.shutdown()
+
+    latencies = sorted(seconds * 1000 for _, seconds, _ in results)
+    failures = [error for _, _, error in results if error]
+    print(f"submit():  max {max(submit_ms):.3f} ms, mean {sum(submit_ms) / len(submit_ms):.3f} ms (caller blocked)")
+    if latencies:
+        print(f"delivery:  median {latencies[len(latencies) // 2]:.1f} ms, max {latencies[-1]:.1f} ms")
+    print(f"dispatcher: {dispatcher.stats()}")
+    print(f"stand-in:  {len(server.received)} received, {server.deferred} deferred, "
+          f"{server.connections} connections")
+    if failures:
+        print(f"failures:  {failures[:3]}")
+    return len(server.received) == count and not failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=10, help="messages to send")
+    parser.add_argument("--fail-first", type=int, default=0, help="answer 451 to the first N messages")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds the stand-in waits per reply")
+    parser.add_argument("--drop-after", type=int, default=0, help="hang up after N messages per connection")
+    parser.add_argument("--fresh", action="store_true", help="new connection per message (no keep-alive)")
+    parser.add_argument("--backoff", type=float, default=0.2, help="first retry delay in seconds")
+    parser.add_argument("--serve", action="store_true", help="only run the stand-in server")
+    parser.add_argument("--port", type=int, default=8025, help="port for --serve")
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.fail_first, args.delay)
+    elif not check(args.count, args.fail_first, args.delay, args.backoff, args.drop_after, args.fresh):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
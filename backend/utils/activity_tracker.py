@@ -1,42 +1,27 @@
-import json
-import os
-from datetime import datetime
-
-FILE = "last_activity.json"
-
-
-def get_last_activity(trainee_id):
-    if not os.path.exists(FILE):
-        return None
-
-    with open(FILE, "r") as f:
-        data = json.load(f)
-
-    return data.get(str(trainee_id))
-
+"""
+Last-activity tracking for SmartARTrainer
+Stored in the trainee_activity table (one row per trainee, primary key
+lookup, indexed last_active) instead of last_activity.json, which was read
+and rewritten whole on every call and resolved against the current working
+directory. save_workout_session() records activity in the same transaction
+as the session; the old JSON is imported once by db_config.ensure_schema().
+Inactivity is checked by the batch sweep (backend.tools.inactivity_sweep),
+not per trainee.
+"""
 
-def update_last_activity(trainee_id):
-    data = {}
-
-    if os.path.exists(FILE):
-        with open(FILE, "r") as f:
-            data = json.load(f)
-
-    data[str(trainee_id)] = datetime.today().strftime("%Y-%m-%d")
-
-    with open(FILE, "w") as f:
-        json.dump(data, f)
-
-
-def is_inactive_30_days(trainee_id):
-    last = get_last_activity(trainee_id)
+from datetime import datetime
 
-    if not last:
-        return False   # first time → no reset
+INACTIVITY_DAYS = 30
 
-    from datetime import datetime
+STAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-    last_date = datetime.strptime(last, "%Y-%m-%d")
-    today = datetime.today()
 
-    return (today - last_date).days >= 30
+def touch_activity(cursor, trainee_id, when=None):
+    """Record activity on an open cursor; the caller commits. Never moves
+    last_active backwards (same rule as the legacy import)."""
+    stamp = (when or datetime.now()).strftime(STAMP_FORMAT)
+    cursor.execute("""
+        INSERT INTO trainee_activity (trainee_id, last_active) VALUES (?, ?)
+        ON CONFLICT(trainee_id) DO UPDATE
+        SET last_active = MAX(last_active, excluded.last_active)
+    """, (trainee_id, stamp))
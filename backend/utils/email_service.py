@@ -1,310 +1,260 @@
+"""
+Email transport and OTP generation for SmartARTrainer
+Qt-free, so backend tools and headless processes can send mail without
+importing PyQt or needing a display. The OTP dialogs and the GUI-side
+send_otp() live in frontend/ui/otp_dialogs.py.
+"""
+
 import os
-import random
+import secrets
 import string
 import smtplib
 import ssl
+import threading
+import time
 from email.message import EmailMessage
-from PyQt6.QtWidgets import (
-    QMessageBox, QDialog, QVBoxLayout, QLabel, 
-    QLineEdit, QPushButton, QHBoxLayout
-)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
 
 def generate_otp(length=6):
-    """Generate a random numeric OTP"""
-    return ''.join(random.choices(string.digits, k=length))
+    """Generate a random numeric OTP (cryptographically secure)"""
+    return ''.join(secrets.choice(string.digits) for _ in range(length))
 
 
-def send_otp_email(recipient_email: str, otp: str) -> tuple[bool, str]:
-    """Send OTP via SMTP using environment-configured credentials.
+class SMTPConfig:
+    """SMTP settings, normally read from the environment"""
 
-    Expects the following environment variables (recommended):
-      - SMTP_HOST
-      - SMTP_PORT
-      - SMTP_USER
-      - SMTP_PASS
-      - SMTP_FROM (optional; defaults to SMTP_USER)
-      - SMTP_USE_SSL (optional; 'true' enables SSL)
-      - SMTP_STARTTLS (optional; 'true' enables STARTTLS)
+    def __init__(self, host=None, port=None, user=None, password=None, from_addr=None,
+                 use_ssl=False, starttls=True, timeout=10):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.from_addr = from_addr or user
+        self.use_ssl = use_ssl
+        self.starttls = starttls
+        self.timeout = timeout
 
-    Returns (success: bool, message: str).
-    """
-    host = os.getenv("SMTP_HOST")
-    port = os.getenv("SMTP_PORT")
-    user = os.getenv("SMTP_USER")
-    password = os.getenv("SMTP_PASS")
-    use_ssl = os.getenv("SMTP_USE_SSL", "false").lower() == "true"
-    starttls = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
-    from_addr = os.getenv("SMTP_FROM", user)
+    @classmethod
+    def from_env(cls):
+        """
+        Environment variables:
+          - SMTP_HOST, SMTP_PORT
+          - SMTP_USER, SMTP_PASS (optional for servers without AUTH,
+            e.g. a local test server)
+          - SMTP_FROM (optional; defaults to SMTP_USER)
+          - SMTP_USE_SSL (optional; 'true' enables SSL)
+          - SMTP_STARTTLS (optional; 'true' enables STARTTLS, default when logging in)
+          - SMTP_TIMEOUT (optional; seconds, default 10)
+        """
+        user = os.getenv("SMTP_USER")
+        return cls(
+            host=os.getenv("SMTP_HOST"),
+            port=os.getenv("SMTP_PORT"),
+            user=user,
+            password=os.getenv("SMTP_PASS"),
+            from_addr=os.getenv("SMTP_FROM", user),
+            use_ssl=os.getenv("SMTP_USE_SSL", "false").lower() == "true",
+            starttls=os.getenv("SMTP_STARTTLS", "true" if user else "false").lower() == "true",
+            timeout=float(os.getenv("SMTP_TIMEOUT", "10") or 10),
+        )
 
-    if not (host and port and user and password):
-        return False, "SMTP credentials not configured"
+    def problem(self):
+        """Why this config cannot send, or None if it can"""
+        if not (self.host and self.port and self.from_addr):
+            return "SMTP credentials not configured"
+        if bool(self.user) != bool(self.password):
+            return "SMTP credentials not configured"
+        try:
+            int(self.port)
+        except (TypeError, ValueError):
+            return "Invalid SMTP_PORT"
+        return None
 
-    try:
-        port_int = int(port)
-    except Exception:
-        return False, "Invalid SMTP_PORT"
+    @property
+    def is_configured(self):
+        return self.problem() is None
 
+
+def build_otp_message(config, recipient_email, otp):
     msg = EmailMessage()
     msg["Subject"] = "Your verification code"
-    msg["From"] = from_addr
+    msg["From"] = config.from_addr
     msg["To"] = recipient_email
     msg.set_content(f"Your verification code is: {otp}\nThis code will expire in 10 minutes.")
-
-    try:
-        if use_ssl:
-            context = ssl.create_default_context()
-            with smtplib.SMTP_SSL(host, port_int, context=context) as server:
-                server.login(user, password)
-                server.send_message(msg)
-        else:
-            with smtplib.SMTP(host, port_int, timeout=10) as server:
-                server.ehlo()
-                if starttls:
-                    server.starttls(context=ssl.create_default_context())
-                    server.ehlo()
-                server.login(user, password)
-                server.send_message(msg)
-        return True, "Email sent"
-    except Exception as e:
-        return False, str(e)
+    return msg
 
 
-def send_otp(email, otp, parent=None, purpose="Verification"):
-    """Attempt to send OTP via SMTP, fallback to simulated dialog on failure.
+def connect(config):
+    """Open an SMTP connection and log in if configured; raises on failure"""
+    problem = config.problem()
+    if problem:
+        raise ValueError(problem)
 
-    Returns True if real send succeeded, False if fallback was used.
-    """
-    ok, msg = send_otp_email(email, otp)
-    if ok:
-        try:
-            # Inform user a verification email was sent
-            if parent:
-                QMessageBox.information(parent, "Verification Sent", f"A verification code was sent to {email}.")
-        except Exception:
-            pass
-        return True
-
-    # Fallback: show simulated in-app dialog and inform of failure
+    port = int(config.port)
+    if config.use_ssl:
+        context = ssl.create_default_context()
+        server = smtplib.SMTP_SSL(config.host, port, context=context, timeout=config.timeout)
+    else:
+        server = smtplib.SMTP(config.host, port, timeout=config.timeout)
     try:
-        if parent:
-            QMessageBox.warning(parent, "Email Send Failed", f"Failed to send verification email: {msg}\nShowing in-app code instead.")
+        server.ehlo()
+        if config.starttls and not config.use_ssl:
+            server.starttls(context=ssl.create_default_context())
+            server.ehlo()
+        if config.user:
+            server.login(config.user, config.password)
     except Exception:
-        pass
-    send_otp_simulated(email, otp, parent, purpose)
-    return False
+        server.close()
+        raise
+    return server
+
 
-def send_otp_simulated(email, otp, parent=None, purpose="Password Reset Request"):
+def deliver(config, msg):
+    """Send `msg` over a new connection that is closed afterwards"""
+    with connect(config) as server:
+        server.send_message(msg)
+
+
+class SMTPSession:
     """
-    Compact simulated OTP notification to remove empty space.
+    One authenticated SMTP connection kept open between sends, so a burst of
+    OTP emails (several sign-ups, the resend button) pays for the TCP/TLS
+    handshake and login once.
+
+    - A connection idle for `idle_timeout` seconds is closed (close_idle()
+      does it proactively; send() checks before reusing).
+    - A connection idle for `health_after` seconds is checked with NOOP
+      before reuse.
+    - If a reused connection turns out to be dead, send() reconnects and
+      sends again once; errors on a fresh connection are raised.
     """
-    dialog = QDialog(parent)
-    dialog.setWindowTitle(purpose)
-    dialog.setMinimumWidth(320)
-    
-    layout = QVBoxLayout(dialog)
-    layout.setContentsMargins(20, 20, 20, 20)
-    layout.setSpacing(10)
-    
-    dialog.setStyleSheet("""
-        QDialog {
-            background-color: #0f172a;
-            border: 1px solid #334155;
-            border-radius: 10px;
-        }
-        QLabel {
-            color: #f1f5f9;
-            font-size: 13px;
-            font-family: 'Segoe UI', sans-serif;
-        }
-        QPushButton {
-            background-color: #334155;
-            color: white;
-            border-radius: 5px;
-            padding: 6px 20px;
-            font-weight: bold;
-            border: 1px solid #475569;
-        }
-        QPushButton:hover {
-            background-color: #475569;
-        }
-    """)
-    
-    content = QLabel(
-        f"<b>To:</b> {email}<br>"
-        f"<b>Your Verification Code:</b> <b style='color:#667eea;'>{otp}</b><br><br>"
-        f"Please enter this code in the application to proceed.<br>"
-        f"This code will expire in 10 minutes."
-    )
-    content.setWordWrap(True)
-    layout.addWidget(content)
-    
-    btn_layout = QHBoxLayout()
-    btn_layout.addStretch()
-    ok_btn = QPushButton("OK")
-    ok_btn.setCursor(Qt.CursorShape(13))
-    ok_btn.clicked.connect(dialog.accept)
-    btn_layout.addWidget(ok_btn)
-    layout.addLayout(btn_layout)
-    
-    dialog.exec()
-
-
-class OTPInputDialog(QDialog):
-    """Custom styled dialog for entering OTP"""
-    def __init__(self, email, title="Verify OTP", description=None, parent=None):
-        super().__init__(parent)
-        self.email = email
-        self.dialog_title = title
-        self.dialog_description = description or f"Enter the 6-digit code sent to\n{self.email}"
-        self.otp_value = ""
-        self.resend_callback = None # Can be set to a function that regenerates and resends
-        self.init_ui()
-
-    def init_ui(self):
-        self.setWindowTitle(self.dialog_title)
-        self.setFixedWidth(460) # Increased width to accommodate long emails
-        self.setMinimumHeight(320)
-        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.FramelessWindowHint)
-        
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #0f172a;
-                border: 2px solid #334155;
-                border-radius: 20px;
-            }
-            QLabel {
-                color: #f1f5f9;
-                background: transparent;
-            }
-            QLineEdit {
-                background-color: #1e293b;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                padding: 10px;
-                color: white;
-                font-size: 18px;
-                letter-spacing: 5px;
-                font-weight: bold;
-            }
-            QPushButton#verify_btn {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                   stop:0 #667eea, stop:1 #764ba2);
-                color: white;
-                border-radius: 8px;
-                font-weight: bold;
-                padding: 10px;
-                font-size: 14px;
-            }
-            QPushButton#verify_btn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                   stop:0 #764ba2, stop:1 #667eea);
-            }
-            QPushButton#cancel_btn {
-                background: transparent;
-                color: #94a3b8;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton#cancel_btn:hover {
-                color: white;
-                border-color: #475569;
-            }
-        """)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(30, 30, 30, 30)
-        layout.setSpacing(20)
-
-        title = QLabel(self.dialog_title)
-        title.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title)
-
-        desc = QLabel(self.dialog_description)
-        desc.setFont(QFont("Segoe UI", 10))
-        desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        desc.setWordWrap(True)
-        desc.setStyleSheet("color: #94a3b8; padding: 0 10px;")
-        layout.addWidget(desc)
-
-        self.otp_input = QLineEdit()
-        self.otp_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.otp_input.setMaxLength(6)
-        self.otp_input.setPlaceholderText("· · · · · ·")
-        self.otp_input.setMinimumHeight(50)
-        layout.addWidget(self.otp_input)
-
-        # Resend Option
-        resend_layout = QHBoxLayout()
-        resend_layout.setContentsMargins(0, 0, 0, 0)
-        resend_text = QLabel("Didn't receive the code?")
-        resend_text.setStyleSheet("color: #64748b; font-size: 11px;")
-        
-        self.resend_btn = QPushButton("Resend OTP")
-        self.resend_btn.setCursor(Qt.CursorShape(13))
-        self.resend_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: #667eea;
-                border: none;
-                font-size: 11px;
-                font-weight: bold;
-                text-decoration: underline;
-            }
-            QPushButton:hover {
-                color: #764ba2;
-            }
-        """)
-        self.resend_btn.clicked.connect(self.on_resend)
-        
-        resend_layout.addStretch()
-        resend_layout.addWidget(resend_text)
-        resend_layout.addWidget(self.resend_btn)
-        resend_layout.addStretch()
-        layout.addLayout(resend_layout)
-
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(15)
-
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setObjectName("cancel_btn")
-        cancel_btn.setCursor(Qt.CursorShape(13))
-        cancel_btn.setMinimumHeight(45)
-        cancel_btn.clicked.connect(self.reject)
-        
-        verify_btn = QPushButton("Verify Account")
-        verify_btn.setObjectName("verify_btn")
-        verify_btn.setCursor(Qt.CursorShape(13))
-        verify_btn.setMinimumHeight(45)
-        verify_btn.clicked.connect(self.on_verify)
-
-        btn_layout.addWidget(cancel_btn, 1)
-        btn_layout.addWidget(verify_btn, 2)
-        layout.addLayout(btn_layout)
-
-    def on_resend(self):
-        """Simulate resending the OTP"""
-        if self.resend_callback:
-            self.resend_callback()
-            QMessageBox.information(self, "OTP Resent", "A new verification code has been sent to your email.")
-        else:
-            # Default behavior if no callback
-            QMessageBox.information(self, "OTP Resent", "Verification code has been resent to your email.")
-
-    def on_verify(self):
-        self.otp_value = self.otp_input.text().strip()
-        if len(self.otp_value) == 6:
-            self.accept()
-        else:
-            QMessageBox.warning(self, "Invalid OTP", "Please enter a 6-digit code.")
+
+    def __init__(self, idle_timeout=None, health_after=15.0):
+        self.idle_timeout = idle_timeout if idle_timeout is not None else float(
+            os.getenv("SMTP_IDLE_TIMEOUT", "60") or 60
+        )
+        self.health_after = health_after
+
+        self._server = None
+        self._key = None            # settings the open connection was made with
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+        self.connects = 0
+        self.reuses = 0
+        self.noops = 0
+        self.reconnects = 0
 
     @staticmethod
-    def get_otp(email, title="Verify OTP", description=None, parent=None, resend_callback=None):
-        dialog = OTPInputDialog(email, title, description, parent)
-        dialog.resend_callback = resend_callback
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            return dialog.otp_value, True
-        return "", False
+    def config_key(config):
+        return (config.host, str(config.port), config.user, config.password,
+                config.use_ssl, config.starttls)
+
+    def send(self, config, msg):
+        with self._lock:
+            server, reused = self._acquire(config)
+            try:
+                self._send(server, msg)
+            except ConnectionError:
+                if not reused:
+                    raise
+                # the server dropped the kept-alive connection: one fresh try
+                self.reconnects += 1
+                server, _ = self._acquire(config)
+                self._send(server, msg)
+
+    def _send(self, server, msg):
+        try:
+            server.send_message(msg)
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            # the server answered (and smtplib sent RSET): connection still usable
+            self._last_used = time.monotonic()
+            raise
+        except OSError as e:
+            # SMTPServerDisconnected or a socket error: the connection is gone
+            if isinstance(e, smtplib.SMTPException) and not isinstance(e, smtplib.SMTPServerDisconnected):
+                raise
+            self._drop()
+            raise ConnectionError(str(e) or type(e).__name__) from e
+        self._last_used = time.monotonic()
+
+    def _acquire(self, config):
+        """(connection, reused) for `config`, connecting if needed"""
+        key = self.config_key(config)
+        if self._server is not None:
+            idle = time.monotonic() - self._last_used
+            if key != self._key or idle > self.idle_timeout:
+                self._drop()
+            elif idle > self.health_after and not self._alive():
+                self._drop()
+            else:
+                self.reuses += 1
+                return self._server, True
+
+        self._server = connect(config)
+        self._key = key
+        self._last_used = time.monotonic()
+        self.connects += 1
+        return self._server, False
+
+    def _alive(self):
+        self.noops += 1
+        try:
+            return self._server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _drop(self):
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def idle_deadline(self):
+        """monotonic() time the open connection expires, or None"""
+        return self._last_used + self.idle_timeout if self._server is not None else None
+
+    def close_idle(self):
+        with self._lock:
+            if self._server is not None and time.monotonic() - self._last_used >= self.idle_timeout:
+                self._drop()
+
+    def close(self):
+        with self._lock:
+            self._drop()
+
+    def stats(self):
+        return (f"{self.connects} connects, {self.reuses} reuses, {self.noops} NOOPs, "
+                f"{self.reconnects} reconnects")
+
+
+smtp_session = None
+
+
+def get_smtp_session():
+    """Global keep-alive SMTP session shared by every sender"""
+    global smtp_session
+    if smtp_session is None:
+        smtp_session = SMTPSession()
+    return smtp_session
+
+
+def send_otp_email(recipient_email: str, otp: str) -> tuple[bool, str]:
+    """Send OTP via SMTP using environment-configured credentials (blocking).
+
+    GUI code should use frontend.ui.otp_dialogs.send_otp(), which delivers
+    on a background thread.
+    Returns (success: bool, message: str).
+    """
+    config = SMTPConfig.from_env()
+    problem = config.problem()
+    if problem:
+        return False, problem
+
+    try:
+        get_smtp_session().send(config, build_otp_message(config, recipient_email, otp))
+        return True, "Email sent"
+    except Exception as e:
+        return False, str(e)
@@ -0,0 +1,169 @@
+"""
+Background mail delivery for SmartARTrainer
+submit() puts a message on a queue and returns immediately; one worker
+thread sends it over the shared keep-alive SMTPSession, so a slow or
+unreachable server never blocks the GUI thread and a burst of messages
+shares one login. Temporary failures (connection errors,
+timeouts, 4xx replies) are retried with exponential backoff, permanent ones
+(bad credentials, 5xx replies) are reported at once.
+
+Results are reported through the job's callbacks, which run ON THE WORKER
+THREAD - GUI code should forward them through a Qt signal
+(see frontend.ui.otp_dialogs.OTPDelivery).
+"""
+
+import heapq
+import itertools
+import queue
+import smtplib
+import threading
+import time
+
+from backend.utils.email_service import SMTPConfig, get_smtp_session
+
+
+def is_transient(error):
+    """True if sending again later may succeed"""
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        return bool(codes) and all(400 <= code < 500 for code in codes)
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    # socket errors and timeouts (ConnectionRefusedError, TimeoutError, ...)
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class MailJob:
+    """One queued message and its result callbacks"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, message, on_sent=None, on_failed=None, on_retry=None):
+        self.id = next(self._ids)
+        self.message = message
+        self.recipient = message["To"]
+        self.on_sent = on_sent          # (job)
+        self.on_failed = on_failed      # (job, error text)
+        self.on_retry = on_retry        # (job, attempt, delay seconds, error text)
+        self.attempts = 0
+        self.submitted = time.perf_counter()
+
+
+class MailDispatcher:
+    """Queue + single worker thread delivering MailJobs with retry/backoff"""
+
+    def __init__(self, config=None, max_attempts=4, backoff=2.0, max_backoff=60.0, session=None):
+        self.config = config
+        self.session = session or get_smtp_session()    # kept-alive connection
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self._queue = queue.Queue()
+        self._delayed = []              # heap of (due, job id, job) waiting to retry
+        self._thread = None
+        self._lock = threading.Lock()
+
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+
+    # ---------------- Public API ----------------
+    def submit(self, message, on_sent=None, on_failed=None, on_retry=None):
+        """Queue `message` (an EmailMessage) for delivery; never blocks"""
+        job = MailJob(message, on_sent, on_failed, on_retry)
+        self._ensure_worker()
+        self._queue.put(job)
+        return job
+
+    def pending(self):
+        return self._queue.qsize() + len(self._delayed)
+
+    def shutdown(self, timeout=5.0):
+        """Stop the worker after the queued (not the delayed) jobs"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        self.session.close()
+
+    def stats(self):
+        return (f"{self.sent} sent, {self.failed} failed, {self.retried} retries, "
+                f"{self.pending()} pending; {self.session.stats()}")
+
+    # ---------------- Worker ----------------
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="mail-dispatcher", daemon=True)
+                self._thread.start()
+
+    def _next_job(self):
+        """Next job to attempt: a due retry, or whatever arrives on the queue"""
+        while True:
+            now = time.monotonic()
+            if self._delayed and self._delayed[0][0] <= now:
+                return heapq.heappop(self._delayed)[2]
+
+            # sleep until the next retry is due or the idle connection expires
+            deadlines = [self._delayed[0][0]] if self._delayed else []
+            idle_deadline = self.session.idle_deadline()
+            if idle_deadline is not None:
+                deadlines.append(idle_deadline)
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+            try:
+                return self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self.session.close_idle()
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            self._attempt(job)
+
+    def _attempt(self, job):
+        config = self.config or SMTPConfig.from_env()
+        job.attempts += 1
+        try:
+            self.session.send(config, job.message)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            if is_transient(e) and job.attempts < self.max_attempts:
+                delay = min(self.max_backoff, self.backoff * 2 ** (job.attempts - 1))
+                self.retried += 1
+                heapq.heappush(self._delayed, (time.monotonic() + delay, job.id, job))
+                self._notify(job.on_retry, job, job.attempts, delay, error)
+            else:
+                self.failed += 1
+                print(f"Mail to {job.recipient} failed after {job.attempts} attempt(s): {error}")
+                self._notify(job.on_failed, job, error)
+            return
+
+        self.sent += 1
+        self._notify(job.on_sent, job)
+
+    @staticmethod
+    def _notify(callback, *args):
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            # a broken callback must not kill the worker thread
+            print(f"Mail callback error: {e}")
+
+
+mail_dispatcher = None
+
+
+def get_mail_dispatcher():
+    """Global dispatcher (SMTP settings are read from the environment per send)"""
+    global mail_dispatcher
+    if mail_dispatcher is None:
+        mail_dispatcher = MailDispatcher()
+    return mail_dispatcher
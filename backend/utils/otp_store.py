@@ -0,0 +1,168 @@
+"""
+One-time password store for SmartARTrainer
+Keeps the current code per (purpose, email) in memory with:
+- expiry: a code is valid for OTP_TTL seconds (the "expires in 10 minutes"
+  the email promises); heaps of expiry times let purge() drop stale codes
+  and send histories without scanning every entry
+- attempt limit: after MAX_ATTEMPTS wrong guesses the code is invalidated
+- resend throttling: at least RESEND_INTERVAL seconds between codes, and at
+  most MAX_SENDS codes per SEND_WINDOW, so a resend loop cannot hammer the
+  SMTP server
+
+Codes are stored as SHA-256 digests and compared in constant time;
+verification is a dict lookup.
+"""
+
+import hashlib
+import heapq
+import hmac
+import threading
+import time
+
+from backend.utils.email_service import generate_otp
+
+OTP_TTL = 10 * 60           # seconds a code stays valid
+MAX_ATTEMPTS = 5            # wrong guesses before the code is invalidated
+RESEND_INTERVAL = 30        # seconds between two codes for the same email
+MAX_SENDS = 5               # codes per SEND_WINDOW for the same email
+SEND_WINDOW = 15 * 60
+
+
+def _digest(code):
+    return hashlib.sha256(code.encode()).hexdigest()
+
+
+class OTPEntry:
+    def __init__(self, digest, expires_at):
+        self.digest = digest
+        self.expires_at = expires_at
+        self.attempts = 0
+
+
+class OTPStore:
+    """Current code, attempt counter and send history per (purpose, email)"""
+
+    def __init__(self, ttl=OTP_TTL, max_attempts=MAX_ATTEMPTS, resend_interval=RESEND_INTERVAL,
+                 max_sends=MAX_SENDS, send_window=SEND_WINDOW, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_attempts = max_attempts
+        self.resend_interval = resend_interval
+        self.max_sends = max_sends
+        self.send_window = send_window
+        self.clock = clock
+
+        self._codes = {}        # key -> OTPEntry
+        self._sends = {}        # key -> [send times within the window]
+        self._expiry = []       # heap of (expires_at, key)
+        self._send_expiry = []  # heap of (send time + send_window, key)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(email, purpose):
+        return (purpose, (email or "").strip().lower())
+
+    # ---------------- Issuing ----------------
+    def retry_after(self, email, purpose="verify"):
+        """Seconds until a new code may be issued for `email` (0 = now)"""
+        with self._lock:
+            return self._retry_after(self.key(email, purpose), self.clock())
+
+    def _retry_after(self, key, now):
+        sends = [t for t in self._sends.get(key, []) if now - t < self.send_window]
+        if sends:
+            self._sends[key] = sends
+        else:
+            self._sends.pop(key, None)
+            return 0
+
+        wait = self.resend_interval - (now - sends[-1])
+        if len(sends) >= self.max_sends:
+            wait = max(wait, self.send_window - (now - sends[0]))
+        return max(0, int(wait + 0.999))
+
+    def issue(self, email, purpose="verify"):
+        """
+        New code for `email`, replacing any previous one.
+        Returns (code, 0), or (None, seconds to wait) when throttled.
+        """
+        with self._lock:
+            now = self.clock()
+            self._purge(now)
+            key = self.key(email, purpose)
+
+            wait = self._retry_after(key, now)
+            if wait:
+                return None, wait
+
+            code = generate_otp()
+            entry = OTPEntry(_digest(code), now + self.ttl)
+            self._codes[key] = entry
+            self._sends.setdefault(key, []).append(now)
+            heapq.heappush(self._expiry, (entry.expires_at, key))
+            heapq.heappush(self._send_expiry, (now + self.send_window, key))
+            return code, 0
+
+    # ---------------- Verification ----------------
+    def verify(self, email, code, purpose="verify"):
+        """
+        Check `code` for `email`. Returns (ok, message, can_retry);
+        a correct code is consumed, so it works only once.
+        """
+        with self._lock:
+            key = self.key(email, purpose)
+            entry = self._codes.get(key)
+            if entry is None:
+                return False, "No active code. Please request a new one.", False
+
+            if self.clock() >= entry.expires_at:
+                del self._codes[key]
+                return False, "This code has expired. Please request a new one.", False
+
+            if hmac.compare_digest(entry.digest, _digest((code or "").strip())):
+                del self._codes[key]
+                return True, "Verified", False
+
+            entry.attempts += 1
+            left = self.max_attempts - entry.attempts
+            if left <= 0:
+                del self._codes[key]
+                return False, "Too many incorrect attempts. Please request a new code.", False
+            return False, f"Invalid code. {left} attempt(s) left.", True
+
+    def discard(self, email, purpose="verify"):
+        with self._lock:
+            self._codes.pop(self.key(email, purpose), None)
+
+    # ---------------- Housekeeping ----------------
+    def _purge(self, now):
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry)
+            entry = self._codes.get(key)
+            # only drop the code this heap item was pushed for, not a newer one
+            if entry is not None and entry.expires_at == expires_at:
+                del self._codes[key]
+
+        # send histories of every email, not just the one being checked
+        while self._send_expiry and self._send_expiry[0][0] <= now:
+            _, key = heapq.heappop(self._send_expiry)
+            sends = self._sends.get(key)
+            if sends and now - sends[-1] >= self.send_window:
+                del self._sends[key]
+
+    def purge(self):
+        with self._lock:
+            self._purge(self.clock())
+
+    def __len__(self):
+        return len(self._codes)
+
+
+otp_store = None
+
+
+def get_otp_store():
+    """Global store shared by sign-up and password reset"""
+    global otp_store
+    if otp_store is None:
+        otp_store = OTPStore()
+    return otp_store
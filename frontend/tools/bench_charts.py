@@ -0,0 +1,134 @@
+"""
+Benchmark: native QPainter charts vs matplotlib FigureCanvas
+Builds the analytics line + accuracy charts for a synthetic trainee and
+reports import time, build time, paint time and Python heap usage.
+
+Usage (from the project root):
+    python -m frontend.tools.bench_charts --sessions 60 --repeat 20
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QImage, QPainter
+
+
+def make_data(sessions):
+    rng = random.Random(42)
+    correct = [rng.randint(0, 30) for _ in range(sessions)]
+    wrong = [rng.randint(0, 6) for _ in range(sessions)]
+    accuracy = [round(rng.uniform(30, 100), 1) for _ in range(6)]
+    return correct, wrong, accuracy
+
+
+def build_native(correct, wrong, accuracy):
+    from frontend.utils.charts import LineChartWidget, BarChartWidget
+
+    line = LineChartWidget("Push-up (Target: 30)", "Session", "Reps")
+    line.add_series("Correct Reps", correct)
+    line.add_series("Wrong Reps", wrong)
+    line.set_y_range(0, 30)
+    line.resize(900, 500)
+
+    bar = BarChartWidget("Exercise Accuracy %", "", "Accuracy")
+    bar.set_bars(["Jumping Jack", "Push-up", "Plank", "Crunches", "Squat", "Cobra Stretch"],
+                 accuracy, ["green" if v >= 60 else "red" for v in accuracy], "{}%")
+    bar.set_y_range(0, 100)
+    bar.resize(900, 520)
+    return [line, bar]
+
+
+def build_matplotlib(correct, wrong, accuracy):
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+
+    fig = Figure(figsize=(6, 10))
+    ax = fig.add_subplot(111)
+    x = list(range(1, len(correct) + 1))
+    ax.plot(x, correct, marker="o", label="Correct Reps")
+    ax.plot(x, wrong, marker="o", label="Wrong Reps")
+    ax.set_ylim(0, 30)
+    ax.set_xticks(x)
+    ax.legend()
+    ax.grid(True)
+    line = FigureCanvas(fig)
+    line.resize(900, 500)
+
+    fig = Figure(figsize=(6, 4))
+    ax = fig.add_subplot(111)
+    names = ["Jumping Jack", "Push-up", "Plank", "Crunches", "Squat", "Cobra Stretch"]
+    ax.bar(names, accuracy, color=["green" if v >= 60 else "red" for v in accuracy], width=0.3)
+    ax.set_ylim(0, 100)
+    for i, v in enumerate(accuracy):
+        ax.text(i, v + 1, f"{v}%", ha="center", fontsize=9)
+    bar = FigureCanvas(fig)
+    bar.resize(900, 520)
+    return [line, bar]
+
+
+def paint(widgets):
+    for w in widgets:
+        image = QImage(w.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        painter = QPainter(image)
+        w.render(painter)
+        painter.end()
+
+
+def run(name, builder, data, repeat):
+    t0 = time.perf_counter()
+    tracemalloc.start()
+    widgets = builder(*data)
+    t_build = time.perf_counter() - t0
+
+    # first paint fills the vertex / Agg caches
+    t0 = time.perf_counter()
+    paint(widgets)
+    t_first = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        paint(widgets)
+    t_repaint = (time.perf_counter() - t0) / repeat
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<12} build {t_build * 1000:8.1f} ms   first paint {t_first * 1000:8.1f} ms   "
+          f"repaint {t_repaint * 1000:7.2f} ms   heap peak {peak / 1024:8.0f} KiB")
+
+    for w in widgets:
+        w.deleteLater()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    data = make_data(args.sessions)
+
+    run("native", build_native, data, args.repeat)
+
+    t0 = time.perf_counter()
+    try:
+        import matplotlib.backends.backend_qtagg  # noqa: F401
+    except ImportError:
+        print("matplotlib not installed - skipping FigureCanvas comparison")
+        return
+    print(f"matplotlib import: {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    run("matplotlib", build_matplotlib, data, args.repeat)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
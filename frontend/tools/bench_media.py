@@ -0,0 +1,92 @@
+"""
+Benchmark: time-to-first-frame of the exercise demo videos
+Plays every demo video through a MediaPrefetcher - the original cold, and
+the rendition the session pane plays (entry.small_path, the proxy when one
+exists) both cold and after it was prefetched into the pool, as
+WorkoutDemo.start_workout does - and reports the time until the video widget
+receives its first decoded frame.
+
+Needs a working QtMultimedia backend (FFmpeg / platform plugin).
+
+Usage (from the project root):
+    python -m frontend.tools.bench_media --timeout 5000
+"""
+
+import argparse
+import sys
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QEventLoop, QTimer
+
+def wait_for(signal, timeout_ms):
+    """Spin the event loop until `signal` fires; return its args or None on timeout"""
+    loop = QEventLoop()
+    result = []
+
+    def done(*args):
+        result.extend(args)
+        loop.quit()
+
+    signal.connect(done)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    signal.disconnect(done)
+    return result or None
+
+
+def wait_until_loaded(player, timeout_ms):
+    from PyQt6.QtMultimedia import QMediaPlayer
+
+    ready = (QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia)
+    while player.mediaStatus() not in ready:
+        if wait_for(player.mediaStatusChanged, timeout_ms) is None:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--timeout", type=int, default=5000, help="per-video timeout in ms")
+    args = parser.parse_args()
+
+    try:
+        from PyQt6.QtMultimediaWidgets import QVideoWidget
+        from frontend.utils.media_prefetch import MediaPrefetcher
+        from frontend.utils.assets import get_asset_manifest
+    except ImportError as e:
+        print(f"QtMultimedia is not available, no time-to-first-frame to measure: {e}")
+        raise SystemExit(1)
+
+    app = QApplication(sys.argv)
+
+    widget = QVideoWidget()
+    widget.resize(480, 360)
+    widget.show()
+    media = MediaPrefetcher(widget, volume=0.0)
+
+    entries = [e for e in get_asset_manifest().by_filename.values() if e.is_video]
+    print(f"{'video':<22}{'original':>10}{'small':>10}{'small+pf':>10}")
+
+    for entry in entries:
+        timings = []
+
+        for path, warm in ((entry.path, False), (entry.small_path, False), (entry.small_path, True)):
+            media.clear()
+            media.pool.unload_idle()    # force a cold start
+            if warm:
+                media.prefetch(path)
+                wait_until_loaded(media.pool.find(path), args.timeout)
+
+            media.play(path)
+            frame = wait_for(media.firstFrame, args.timeout)
+            timings.append(f"{frame[1]:8.0f}ms" if frame else "  timeout")
+
+        print(f"{entry.filename:<22}{timings[0]:>10}{timings[1]:>10}{timings[2]:>10}")
+
+    print(media.pool.stats())
+    media.stop()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: cost of navigating back to the Workout screen
+Replays what MainWindow.show_Workout does (Workout.set_user -> load_Workout_data
+-> refresh_cards) for a list of trainees and reports wall time, Python heap
+allocation and how many widgets the Workout screen owns afterwards.
+
+MainWindow itself is not constructed because the session/demo screens need
+QtMultimedia; the Workout widget is exercised directly against the real DB
+(read-only).
+
+Usage (from the project root):
+    python -m frontend.tools.bench_navigation --trainees 1 2 3 --repeat 50
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+
+def navigate(app, screen, trainee_id):
+    screen.set_user({"trainee_id": trainee_id})
+    # flush deferred deletes / polish events so they are part of the cost
+    app.processEvents()
+
+
+def run(app, screen, trainees, repeat):
+    # warm up: first visit builds the pooled rows
+    for trainee_id in trainees:
+        navigate(app, screen, trainee_id)
+
+    for label, sequence in (
+        ("same trainee", [trainees[0]] * repeat),
+        ("alternating", [trainees[i % len(trainees)] for i in range(repeat)]),
+    ):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        for trainee_id in sequence:
+            navigate(app, screen, trainee_id)
+        elapsed = (time.perf_counter() - t0) / len(sequence)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        widgets = len(screen.findChildren(QWidget))
+        print(f"{label:<14} {elapsed * 1000:7.2f} ms/show_Workout   "
+              f"heap retained {current / 1024:7.1f} KiB   peak {peak / 1024:7.1f} KiB   "
+              f"widgets {widgets}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--trainees", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    from frontend.utils.styles import get_main_stylesheet
+    from frontend.ui.Workout import Workout
+
+    app.setStyleSheet(get_main_stylesheet())
+    screen = Workout()
+    screen.resize(1200, 800)
+    screen.show()
+
+    run(app, screen, args.trainees, args.repeat)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Asset pipeline: low-resolution proxy renditions of the demo videos
+Re-encodes every MP4 in frontend/assets into frontend/assets/proxies/ at a
+reduced height / frame rate, H.264 Baseline (no B-frames, cheaper to decode)
+and without audio - the WorkoutSession demo pane is small and always muted.
+A manifest.json records each proxy with its source size and SHA-256, so
+unchanged sources are skipped on the next run and stale proxies are ignored
+by frontend.utils.assets.AssetManifest.
+
+Needs an ffmpeg binary: on PATH, via --ffmpeg, or from the optional
+imageio-ffmpeg package.
+
+Usage (from the project root):
+    python -m frontend.tools.make_proxies --height 240 --fps 15
+    python -m frontend.tools.make_proxies --bench      # decode CPU: original vs proxy
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+from frontend.utils.assets import ASSETS_DIR, PROXY_DIR, PROXY_MANIFEST, sha256_of
+
+
+def find_ffmpeg(explicit=None):
+    if explicit:
+        return explicit
+    found = shutil.which("ffmpeg")
+    if found:
+        return found
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        return None
+
+
+def load_manifest():
+    try:
+        with open(PROXY_MANIFEST, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"version": 1, "proxies": {}}
+
+
+def make_proxy(ffmpeg, source, target, height, fps, crf):
+    cmd = [
+        ffmpeg, "-y", "-loglevel", "error", "-i", source,
+        # keep aspect ratio, even width for yuv420p; never upscale
+        "-vf", f"scale=-2:'min({height},ih)',fps={fps}",
+        "-c:v", "libx264", "-profile:v", "baseline", "-preset", "slow", "-crf", str(crf),
+        "-pix_fmt", "yuv420p", "-an", "-movflags", "+faststart",
+        target,
+    ]
+    subprocess.run(cmd, check=True)
+
+
+def decode_cpu_seconds(ffmpeg, path):
+    """User CPU time ffmpeg needs to decode `path` once (single thread)"""
+    result = subprocess.run(
+        [ffmpeg, "-hide_banner", "-benchmark", "-threads", "1", "-i", path, "-an", "-f", "null", "-"],
+        capture_output=True, text=True, check=True,
+    )
+    match = re.search(r"utime=([\d.]+)s", result.stderr)
+    return float(match.group(1)) if match else float("nan")
+
+
+def build(ffmpeg, height, fps, crf, force):
+    os.makedirs(PROXY_DIR, exist_ok=True)
+    manifest = load_manifest()
+    proxies = manifest.setdefault("proxies", {})
+
+    for name in sorted(os.listdir(ASSETS_DIR)):
+        if not name.lower().endswith(".mp4"):
+            continue
+
+        source = os.path.join(ASSETS_DIR, name)
+        target = os.path.join(PROXY_DIR, name)
+        digest = sha256_of(source)
+        entry = proxies.get(name)
+
+        if (not force and entry and entry.get("source_sha256") == digest
+                and entry.get("height") == height and entry.get("fps") == fps
+                and os.path.exists(target)):
+            print(f"{name:<22} up to date")
+            continue
+
+        make_proxy(ffmpeg, source, target, height, fps, crf)
+        proxies[name] = {
+            "file": name,
+            "height": height,
+            "fps": fps,
+            "crf": crf,
+            "bytes": os.path.getsize(target),
+            "source_bytes": os.path.getsize(source),
+            "source_sha256": digest,
+        }
+        print(f"{name:<22} {proxies[name]['source_bytes'] / 1024:8.0f} KiB -> "
+              f"{proxies[name]['bytes'] / 1024:6.0f} KiB")
+
+    with open(PROXY_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Manifest written: {os.path.relpath(PROXY_MANIFEST)}")
+
+
+def bench(ffmpeg):
+    manifest = load_manifest()
+    print(f"{'video':<22}{'original':>12}{'proxy':>12}")
+    for name, entry in sorted(manifest.get("proxies", {}).items()):
+        original = decode_cpu_seconds(ffmpeg, os.path.join(ASSETS_DIR, name))
+        proxy = decode_cpu_seconds(ffmpeg, os.path.join(PROXY_DIR, entry["file"]))
+        print(f"{name:<22}{original:>11.2f}s{proxy:>11.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--height", type=int, default=240)
+    parser.add_argument("--fps", type=int, default=15)
+    parser.add_argument("--crf", type=int, default=30)
+    parser.add_argument("--force", action="store_true", help="re-encode even if up to date")
+    parser.add_argument("--bench", action="store_true", help="compare decode CPU time only")
+    parser.add_argument("--ffmpeg", help="path to the ffmpeg binary")
+    args = parser.parse_args()
+
+    ffmpeg = find_ffmpeg(args.ffmpeg)
+    if not ffmpeg:
+        print("ffmpeg not found: install it, pass --ffmpeg, or pip install imageio-ffmpeg")
+        sys.exit(1)
+
+    if args.bench:
+        bench(ffmpeg)
+    else:
+        build(ffmpeg, args.height, args.fps, args.crf, args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,8 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame, QGridLayout, QMessageBox, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtGui import QFont, QPixmap
 
 from backend.models.data_manager import (
     get_trainee_info,
@@ -23,7 +23,11 @@ from backend.models.data_manager import (
     save_workout_session,
     WORKOUT_COLUMNS
 )
-from backend.utils.activity_tracker import update_last_activity
+from frontend.utils.styles import apply_style
+from frontend.utils.assets import get_asset_manifest
+from frontend.utils.poster_cache import get_poster_cache
+
+THUMB_SIZE = QSize(72, 44)
 
 
 class Workout(QWidget):
@@ -47,46 +51,25 @@ class Workout(QWidget):
 
         # ---------------- NAV BAR ----------------
         nav_bar = QFrame()
+        nav_bar.setObjectName("navBar")
         nav_bar.setFixedHeight(80)
-        nav_bar.setStyleSheet("""
-            QFrame {
-                background: rgba(15, 12, 41, 0.45);
-                border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
+        apply_style(nav_bar, "navBar", screen="workout")
         nav_layout = QHBoxLayout(nav_bar)
         nav_layout.setContentsMargins(50, 0, 50, 0)
 
         app_title = QLabel("SmartARTrainer")
+        app_title.setObjectName("appTitle")
         app_title.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
-        app_title.setStyleSheet("color: #667eea; background: transparent; border: none;")
         nav_layout.addWidget(app_title)
         nav_layout.addStretch()
 
-        btn_style = """
-            QPushButton {
-                background: %s;
-                color: white;
-                border: %s;
-                border-radius: 8px;
-                padding: 8px 20px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: rgba(102, 126, 234, 0.3);
-            }
-        """
-
         dash_btn = QPushButton("Workout")
-        dash_btn.setStyleSheet(btn_style % ("rgba(102,126,234,0.8)", "none"))
+        dash_btn.setProperty("active", "true")
 
         analytics_btn = QPushButton("Dashboard")
-        analytics_btn.setStyleSheet(btn_style % ("transparent", "1px solid rgba(255,255,255,0.4)"))
         analytics_btn.clicked.connect(self.on_analytics_clicked)
 
         profile_btn = QPushButton("Profile")
-        profile_btn.setStyleSheet(btn_style % ("transparent", "1px solid rgba(255,255,255,0.4)"))
         profile_btn.clicked.connect(self.on_profile_clicked)
 
         
@@ -176,6 +159,15 @@ class Workout(QWidget):
         self.grid_layout.setSpacing(40)
         main_layout.addWidget(self.grid_container)
 
+        # The plan card is built once; refresh_cards() only updates row texts
+        self._plan_rows = []          # pooled (row widget, thumb, name label, value label)
+        self._row_videos = []         # demo video path shown in each row's thumbnail
+        self._plan_signature = None   # ((name, value text), ...) currently shown
+        self.build_plan_card()
+
+        # thumbnails extracted in the background fill in when ready
+        get_poster_cache().posterReady.connect(self.on_poster_ready)
+
     # ------------------- DATA HANDLING -------------------
     def set_user(self, user_data: dict):
         self.trainee_id = user_data.get("trainee_id")
@@ -202,13 +194,7 @@ class Workout(QWidget):
         self.refresh_cards()
 
     # ------------------- Workout CARDS -------------------
-    def refresh_cards(self):
-        for i in reversed(range(self.grid_layout.count())):
-            item = self.grid_layout.itemAt(i)
-            w = item.widget() if item else None
-            if w:
-                w.setParent(None)
-
+    def build_plan_card(self):
         card_layout = QHBoxLayout()
         card_layout.setSpacing(28)
 
@@ -223,32 +209,16 @@ class Workout(QWidget):
 
         left_layout.addStretch(2)
 
+        apply_style(left, "planQuotes")
+
         quote_top = QLabel("Are you ready to beat your challenge today?")
+        quote_top.setObjectName("quoteTop")
         quote_top.setAlignment(Qt.AlignmentFlag.AlignCenter)
         quote_top.setWordWrap(True)
-        quote_top.setStyleSheet("""
-            QLabel {
-                color: rgba(255,255,255,0.90);
-                font-size: 40px;
-                font-weight: 200;
-                background: transparent;
-                border: none;
-                padding: 0px;
-            }
-        """)
 
         quote_bottom = QLabel("Let’s start 💪")
+        quote_bottom.setObjectName("quoteBottom")
         quote_bottom.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        quote_bottom.setStyleSheet("""
-            QLabel {
-                color: #a3bffa;
-                font-size: 34px;
-                font-weight: 200;
-                background: transparent;
-                border: none;
-                padding: 0px;
-            }
-        """)
 
         left_layout.addWidget(quote_top)
         left_layout.addWidget(quote_bottom)
@@ -256,16 +226,11 @@ class Workout(QWidget):
 
         # ---------------- RIGHT HALF (PRIMARY) ----------------
         right = QFrame()
+        right.setObjectName("planCard")
         right_layout = QVBoxLayout(right)
         right_layout.setSpacing(18)
 
-        right.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.10);
-                border: 1px solid rgba(255, 255, 255, 0.18);
-                border-radius: 24px;
-            }
-        """)
+        apply_style(right, "planCard")
         right_layout.setContentsMargins(44, 40, 44, 40)
 
         header = QHBoxLayout()
@@ -273,14 +238,8 @@ class Workout(QWidget):
         h2 = QLabel("Repetition / Time")
 
         for h in (h1, h2):
+            h.setObjectName("planHeader")
             h.setFont(QFont("Segoe UI", 24, QFont.Weight.ExtraBold))
-            h.setStyleSheet("""
-                color: #ffffff;
-                letter-spacing: 0.9px;
-                background: transparent;
-                border: none;
-                padding: 0px;
-            """)
 
         header.addWidget(h1)
         header.addStretch(2)
@@ -288,71 +247,25 @@ class Workout(QWidget):
         right_layout.addLayout(header)
 
         divider = QFrame()
+        divider.setObjectName("planDivider")
         divider.setFixedHeight(1)
-        divider.setStyleSheet("background: rgba(255,255,255,0.32); border: none;")
         right_layout.addWidget(divider)
 
-        if not self.workouts:
-            empty = QLabel("No workouts found for this plan.")
-            empty.setFont(QFont("Segoe UI", 18, QFont.Weight.Medium))
-            empty.setStyleSheet("""
-                color: rgba(255,255,255,0.90);
-                background: transparent;
-                border: none;
-                padding: 0px;
-            """)
-            right_layout.addWidget(empty)
-        else:
-            for workout in self.workouts:
-                wname = workout.get("name", "Workout")
-                unit = "seconds" if wname in ["Plank", "Cobra Stretch"] else "reps"
-                target_val = workout.get("target", 0)
-
-                row = QHBoxLayout()
-                row.setSpacing(22)
-
-                name = QLabel(wname)
-                name.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
-                name.setStyleSheet("""
-                    color: #ffffff;
-                    background: transparent;
-                    border: none;
-                    padding: 0px;
-                """)
-
-                val = QLabel(f"{target_val} {unit}")
-                val.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
-                val.setStyleSheet("""
-                    color: #dbeafe;
-                    background: transparent;
-                    border: none;
-                    padding: 0px;
-                """)
-
-                row.addWidget(name)
-                row.addStretch(3)
-                row.addWidget(val)
-                right_layout.addLayout(row)
+        self.plan_empty_label = QLabel("No workouts found for this plan.")
+        self.plan_empty_label.setObjectName("planEmpty")
+        self.plan_empty_label.setFont(QFont("Segoe UI", 18, QFont.Weight.Medium))
+        right_layout.addWidget(self.plan_empty_label)
+
+        # rows live in their own layout so pooled rows stay above the stretch
+        self.plan_rows_layout = QVBoxLayout()
+        self.plan_rows_layout.setSpacing(18)
+        right_layout.addLayout(self.plan_rows_layout)
 
         right_layout.addStretch(1)
 
         start_btn = QPushButton("Start Workout")
+        start_btn.setObjectName("planStart")
         start_btn.setFixedHeight(66)
-        start_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                           stop:0 #667eea, stop:1 #764ba2);
-                color: white;
-                font-size: 19px;
-                font-weight: bold;
-                border-radius: 18px;
-                padding: 12px 18px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                           stop:0 #764ba2, stop:1 #667eea);
-            }
-        """)
         start_btn.clicked.connect(self.start_workout_safely)
         right_layout.addWidget(start_btn)
 
@@ -363,6 +276,90 @@ class Workout(QWidget):
         container.setLayout(card_layout)
         self.grid_layout.addWidget(container, 0, 0)
 
+    def _plan_row(self, index):
+        """Return pooled row `index`, creating rows only the first time they are needed"""
+        while len(self._plan_rows) <= index:
+            row_widget = QWidget()
+            row_widget.setObjectName("planRow")
+            row = QHBoxLayout(row_widget)
+            row.setContentsMargins(0, 0, 0, 0)
+            row.setSpacing(22)
+
+            thumb = QLabel()
+            thumb.setObjectName("planRowThumb")
+            thumb.setFixedSize(THUMB_SIZE)
+            thumb.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+            name = QLabel()
+            name.setObjectName("planRowName")
+            name.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
+
+            val = QLabel()
+            val.setObjectName("planRowValue")
+            val.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
+
+            row.addWidget(thumb)
+            row.addWidget(name)
+            row.addStretch(3)
+            row.addWidget(val)
+            self.plan_rows_layout.addWidget(row_widget)
+            self._plan_rows.append((row_widget, thumb, name, val))
+            self._row_videos.append(None)
+
+        return self._plan_rows[index]
+
+    def refresh_cards(self):
+        rows = []
+        for workout in self.workouts:
+            wname = workout.get("name", "Workout")
+            unit = "seconds" if wname in ["Plank", "Cobra Stretch"] else "reps"
+            target_val = workout.get("target", 0)
+            rows.append((wname, f"{target_val} {unit}"))
+
+        signature = tuple(rows)
+        if signature == self._plan_signature:
+            return
+        self._plan_signature = signature
+
+        self.plan_empty_label.setVisible(not rows)
+
+        for i, (wname, value) in enumerate(rows):
+            row_widget, _, name, val = self._plan_row(i)
+            name.setText(wname)
+            val.setText(value)
+            self.set_row_thumbnail(i, wname)
+            row_widget.show()
+
+        # hide, don't delete, rows left over from a longer plan
+        for row_widget, _, _, _ in self._plan_rows[len(rows):]:
+            row_widget.hide()
+
+    def set_row_thumbnail(self, index, workout_name):
+        entry = get_asset_manifest().lookup(workout_name)
+        if entry is None or not entry.is_video:
+            entry = None
+        self._row_videos[index] = entry.path if entry else None
+
+        poster = get_poster_cache().poster(entry.path, entry.sha256) if entry else None
+        self._plan_rows[index][1].setPixmap(self.thumbnail(poster) if poster else QPixmap())
+
+    def on_poster_ready(self, path, pixmap):
+        for index, video in enumerate(self._row_videos):
+            if video == path:
+                self._plan_rows[index][1].setPixmap(self.thumbnail(pixmap))
+
+    @staticmethod
+    def thumbnail(pixmap):
+        """Poster scaled to fill THUMB_SIZE, centre-cropped"""
+        scaled = pixmap.scaled(
+            THUMB_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        x = (scaled.width() - THUMB_SIZE.width()) // 2
+        y = (scaled.height() - THUMB_SIZE.height()) // 2
+        return scaled.copy(x, y, THUMB_SIZE.width(), THUMB_SIZE.height())
+
     def start_workout_safely(self):
         """Start the first workout in the plan (unlocked)."""
         if not self.workouts:
@@ -408,9 +405,7 @@ class Workout(QWidget):
         success, msg = save_workout_session(self.trainee_id, session_data)
 
         if success:
-            
-            update_last_activity(self.trainee_id)
-            
+            # save_workout_session also recorded the trainee's last activity
             self.session_completed = True
             QMessageBox.information(self, "Session Saved",
                                     "Workout session completed and saved successfully!")
@@ -10,7 +10,8 @@ from PyQt6.QtCore import Qt, pyqtSignal, QRect, QTimer
 from PyQt6.QtGui import QFont, QColor, QPalette, QPainter, QPainterPath, QLinearGradient
 
 import re
-from backend.utils.email_service import generate_otp, send_otp_simulated, OTPInputDialog
+from frontend.ui.otp_dialogs import send_otp, OTPInputDialog
+from backend.utils.otp_store import get_otp_store
 from backend.models.data_manager import (
     check_email_exists, 
     update_password, 
@@ -115,31 +116,44 @@ class ForgotPasswordDialog(QMessageBox):
             return
             
         self.email = email
-        self.otp = generate_otp()
+        otp_store = get_otp_store()
+        self.otp, wait = otp_store.issue(email, "reset")
+        if self.otp is None:
+            QMessageBox.warning(self.parent(), "Please Wait", f"A code was sent recently. Try again in {wait} seconds.")
+            return
         
-        # Step 2: Send OTP (Simulated)
-        send_otp_simulated(email, self.otp, self.parent(), "Password Reset Request")
+        # Step 2: Send OTP (background email, simulated without SMTP settings)
+        send_otp(email, self.otp, self.parent(), "Password Reset Request")
         
         # Define resend callback
         def resend():
-            self.otp = generate_otp()
-            send_otp_simulated(email, self.otp, self.parent(), "Password Reset")
+            code, wait = otp_store.issue(email, "reset")
+            if code is None:
+                QMessageBox.warning(self.parent(), "Please Wait", f"Please wait {wait} seconds before requesting another code.")
+                return False
+            self.otp = code
+            send_otp(email, self.otp, self.parent(), "Password Reset")
 
         # Step 3: Verify OTP (Using new custom dialog)
-        otp_input, ok = OTPInputDialog.get_otp(
-            email, 
-            title="Reset Password", 
-            description=f"Enter the code sent to {email} to reset your password",
-            parent=self.parent(),
-            resend_callback=resend
-        )
-        
-        if not ok or not otp_input:
-            return
+        while True:
+            otp_input, ok = OTPInputDialog.get_otp(
+                email, 
+                title="Reset Password", 
+                description=f"Enter the code sent to {email} to reset your password",
+                parent=self.parent(),
+                resend_callback=resend
+            )
             
-        if otp_input != self.otp:
-            QMessageBox.critical(self.parent(), "Error", "Invalid OTP.")
-            return
+            if not ok or not otp_input:
+                otp_store.discard(email, "reset")
+                return
+                
+            verified, message, can_retry = otp_store.verify(email, otp_input, "reset")
+            if verified:
+                break
+            QMessageBox.critical(self.parent(), "Error", message)
+            if not can_retry:
+                return
             
         while True:
             # Step 4: New Password
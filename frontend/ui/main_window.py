@@ -3,10 +3,13 @@ Main Window for SmartARTrainer
 Central navigation controller using QStackedWidget.
 """
 
-from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QMessageBox, QStackedWidget
-from PyQt6.QtCore import Qt
+import os
 
-from frontend.utils.styles import get_main_stylesheet
+from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QMessageBox, QStackedWidget
+from PyQt6.QtCore import Qt, QTimer
+
+from frontend.utils.styles import StyleParseCounter
+from frontend.utils.assets import get_asset_manifest
 from frontend.ui.login_screen import LoginScreen
 from frontend.ui.fitness_form import FitnessForm
 from frontend.ui.Workout import Workout
@@ -16,7 +19,12 @@ from frontend.ui.profile_screen import ProfileScreen
 from frontend.ui.analytics_screen import AnalyticsScreen
 
 from backend.models.data_manager import get_trainee_info, register_user
-from backend.utils.email_service import generate_otp, send_otp_simulated, OTPInputDialog
+from backend.tools.inactivity_sweep import run_sweep
+from frontend.ui.otp_dialogs import send_otp, OTPInputDialog
+from backend.utils.otp_store import get_otp_store
+
+# How often a long-running window (e.g. a gym kiosk) repeats the inactivity sweep
+SWEEP_INTERVAL_MS = 60 * 60 * 1000
 
 
 class MainWindow(QMainWindow):
@@ -29,12 +37,32 @@ class MainWindow(QMainWindow):
         # Used for returning when leaving WorkoutDemo
         self._demo_return_widget = None
 
+        # Scan frontend/assets once, before any screen resolves a preview
+        manifest = get_asset_manifest()
+        if os.getenv("SMARTAR_MEDIA_STATS"):
+            print(f"[media] asset manifest: {len(manifest)} files in {manifest.build_ms:.1f} ms")
+
+        # Reset trainees inactive for 30+ days in one batch, off the screens' render path:
+        # at startup, on every login and hourly while the window stays open
+        run_sweep(verbose=False)
+        self._sweep_timer = QTimer(self)
+        self._sweep_timer.timeout.connect(lambda: run_sweep(verbose=False))
+        self._sweep_timer.start(SWEEP_INTERVAL_MS)
+
         self.init_ui()
 
     def init_ui(self):
         self.setWindowTitle("SmartARTrainer")
         self.setMinimumSize(1000, 700)
-        self.setStyleSheet(get_main_stylesheet())
+        # The global stylesheet is applied once on the QApplication (main.py);
+        # setting it here too made Qt parse and cascade it a second time.
+
+        # SMARTAR_STYLE_STATS=1 prints how many stylesheet applications each
+        # navigation triggers
+        self._style_counter = None
+        if os.getenv("SMARTAR_STYLE_STATS") and QApplication.instance():
+            self._style_counter = StyleParseCounter(self)
+            QApplication.instance().installEventFilter(self._style_counter)
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -86,9 +114,23 @@ class MainWindow(QMainWindow):
         self.profile_screen.backRequested.connect(self.show_Workout)
         self.analytics_screen.backRequested.connect(self.show_Workout)
 
+        if self._style_counter:
+            parsed, restyled = self._style_counter.take()
+            print(f"[style] startup: {parsed} stylesheet parses, {restyled} widgets restyled")
+            self.stack.currentChanged.connect(self._schedule_style_report)
+
         # Default start screen
         self.stack.setCurrentWidget(self.login_screen)
 
+    def _schedule_style_report(self, index: int):
+        # report after the event loop has flushed the new screen's polish events
+        QTimer.singleShot(0, lambda: self._report_style_stats(index))
+
+    def _report_style_stats(self, index: int):
+        screen = type(self.stack.widget(index)).__name__
+        parsed, restyled = self._style_counter.take()
+        print(f"[style] -> {screen}: {parsed} stylesheet parses, {restyled} widgets restyled")
+
     # =====================================================
     # Auth + user setup
     # =====================================================
@@ -96,6 +138,9 @@ class MainWindow(QMainWindow):
         """After login, show Analytics first (as requested)."""
         self.current_user = user_data
 
+        # the trainee may have crossed 30 days since the last sweep
+        run_sweep(verbose=False)
+
         # Update screens that depend on user
         self.Workout.set_user(user_data)
         self.analytics_screen.set_user(user_data)
@@ -158,6 +203,7 @@ class MainWindow(QMainWindow):
             workout_name = getattr(self.workout_demo, "title_label", None)
             workout_name = workout_name.text() if workout_name else "Workout"
 
+        self.workout_session.set_plan(getattr(self.Workout, "workouts", []))
         self.workout_session.set_workout({"name": workout_name}, workout_id)
         self.stack.setCurrentWidget(self.workout_session)
 
@@ -207,28 +253,44 @@ class MainWindow(QMainWindow):
     def on_fitness_completed(self, fitness_data: dict):
         # Before creating the account, verify the email via OTP
         email = self.signup_data.get("email")
-        otp = generate_otp()
+        otp_store = get_otp_store()
+
+        # Codes are issued (expiry, attempts, resend throttling) by the OTP store
+        otp, wait = otp_store.issue(email, "signup")
+        if otp is None:
+            QMessageBox.warning(self, "Please Wait", f"A code was sent recently. Try again in {wait} seconds.")
+            return
 
-        # Send OTP using in-app simulated dialog
-        send_otp_simulated(email, otp, parent=self, purpose="Email Verification")
+        # Send OTP by email in the background (in-app dialog without SMTP settings)
+        send_otp(email, otp, parent=self, purpose="Email Verification")
 
         # Resend callback for dialog
         def _resend():
-            nonlocal otp
-            otp = generate_otp()
-            send_otp_simulated(email, otp, parent=self, purpose="Email Verification")
-
-        otp_input, ok = OTPInputDialog.get_otp(
-            email,
-            title="Verify Email",
-            description=f"Enter the 6-digit code sent to {email}",
-            parent=self,
-            resend_callback=_resend
-        )
-
-        if not ok or otp_input != otp:
-            QMessageBox.critical(self, "Verification Failed", "Invalid OTP or verification cancelled.")
-            return
+            code, wait = otp_store.issue(email, "signup")
+            if code is None:
+                QMessageBox.warning(self, "Please Wait", f"Please wait {wait} seconds before requesting another code.")
+                return False
+            send_otp(email, code, parent=self, purpose="Email Verification")
+
+        while True:
+            otp_input, ok = OTPInputDialog.get_otp(
+                email,
+                title="Verify Email",
+                description=f"Enter the 6-digit code sent to {email}",
+                parent=self,
+                resend_callback=_resend
+            )
+            if not ok:
+                otp_store.discard(email, "signup")
+                QMessageBox.critical(self, "Verification Failed", "Verification cancelled.")
+                return
+
+            verified, message, can_retry = otp_store.verify(email, otp_input, "signup")
+            if verified:
+                break
+            QMessageBox.critical(self, "Verification Failed", message)
+            if not can_retry:
+                return
 
         # Create account with fitness info
         success, message, trainee_id = register_user(
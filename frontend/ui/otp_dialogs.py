@@ -0,0 +1,303 @@
+"""
+OTP dialogs for SmartARTrainer
+The in-app code dialog, the OTP input dialog and send_otp(), which queues
+the email on the background MailDispatcher and falls back to the in-app
+dialog. Transport and OTP logic stay Qt-free in backend/utils.
+"""
+
+from PyQt6.QtWidgets import (
+    QMessageBox, QDialog, QVBoxLayout, QLabel, 
+    QLineEdit, QPushButton, QHBoxLayout
+)
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from PyQt6.QtGui import QFont
+
+from backend.utils.email_service import SMTPConfig, build_otp_message
+from backend.utils.mail_dispatcher import get_mail_dispatcher
+
+
+class OTPDelivery(QObject):
+    """
+    One background OTP email. The dispatcher's callbacks run on its worker
+    thread; emitting these signals hands the result to the GUI thread.
+    """
+
+    sent = pyqtSignal(str)          # email
+    failed = pyqtSignal(str, str)   # email, error
+
+    active = set()                  # keeps parentless deliveries alive until done
+
+    def __init__(self, email, otp, purpose, parent=None):
+        super().__init__(parent)
+        self.email = email
+        self.otp = otp
+        self.purpose = purpose
+        self.failed.connect(self.on_failed)
+        self.sent.connect(self.on_sent)
+
+    def start(self, config):
+        OTPDelivery.active.add(self)
+        get_mail_dispatcher().submit(
+            build_otp_message(config, self.email, self.otp),
+            on_sent=lambda job: self._emit(self.sent, self.email),
+            on_failed=lambda job, error: self._emit(self.failed, self.email, error),
+        )
+
+    @staticmethod
+    def _emit(signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            pass    # parent window already closed
+
+    def on_sent(self, email):
+        print(f"Verification email sent to {email}")
+        self.finish()
+
+    def on_failed(self, email, error):
+        # Fallback: inform of the failure and show the code in-app instead
+        parent = self.parent()
+        try:
+            if parent:
+                QMessageBox.warning(parent, "Email Send Failed", f"Failed to send verification email: {error}\nShowing in-app code instead.")
+        except Exception:
+            pass
+        send_otp_simulated(email, self.otp, parent, self.purpose)
+        self.finish()
+
+    def finish(self):
+        OTPDelivery.active.discard(self)
+        self.deleteLater()
+
+
+def send_otp(email, otp, parent=None, purpose="Verification"):
+    """Send OTP by email in the background; fall back to the simulated dialog.
+
+    Returns immediately. Without SMTP settings the simulated dialog is shown
+    right away; if a real send fails, the failure is reported and the
+    simulated dialog shown when the dispatcher gives up.
+    Returns True if a real send was queued, False if the fallback was used.
+    """
+    config = SMTPConfig.from_env()
+    if not config.is_configured:
+        send_otp_simulated(email, otp, parent, purpose)
+        return False
+
+    OTPDelivery(email, otp, purpose, parent).start(config)
+    return True
+
+def send_otp_simulated(email, otp, parent=None, purpose="Password Reset Request"):
+    """
+    Compact simulated OTP notification to remove empty space.
+    """
+    dialog = QDialog(parent)
+    dialog.setWindowTitle(purpose)
+    dialog.setMinimumWidth(320)
+    
+    layout = QVBoxLayout(dialog)
+    layout.setContentsMargins(20, 20, 20, 20)
+    layout.setSpacing(10)
+    
+    dialog.setStyleSheet("""
+        QDialog {
+            background-color: #0f172a;
+            border: 1px solid #334155;
+            border-radius: 10px;
+        }
+        QLabel {
+            color: #f1f5f9;
+            font-size: 13px;
+            font-family: 'Segoe UI', sans-serif;
+        }
+        QPushButton {
+            background-color: #334155;
+            color: white;
+            border-radius: 5px;
+            padding: 6px 20px;
+            font-weight: bold;
+            border: 1px solid #475569;
+        }
+        QPushButton:hover {
+            background-color: #475569;
+        }
+    """)
+    
+    content = QLabel(
+        f"<b>To:</b> {email}<br>"
+        f"<b>Your Verification Code:</b> <b style='color:#667eea;'>{otp}</b><br><br>"
+        f"Please enter this code in the application to proceed.<br>"
+        f"This code will expire in 10 minutes."
+    )
+    content.setWordWrap(True)
+    layout.addWidget(content)
+    
+    btn_layout = QHBoxLayout()
+    btn_layout.addStretch()
+    ok_btn = QPushButton("OK")
+    ok_btn.setCursor(Qt.CursorShape(13))
+    ok_btn.clicked.connect(dialog.accept)
+    btn_layout.addWidget(ok_btn)
+    layout.addLayout(btn_layout)
+    
+    dialog.exec()
+
+
+class OTPInputDialog(QDialog):
+    """Custom styled dialog for entering OTP"""
+    def __init__(self, email, title="Verify OTP", description=None, parent=None):
+        super().__init__(parent)
+        self.email = email
+        self.dialog_title = title
+        self.dialog_description = description or f"Enter the 6-digit code sent to\n{self.email}"
+        self.otp_value = ""
+        self.resend_callback = None # Can be set to a function that regenerates and resends
+        self.init_ui()
+
+    def init_ui(self):
+        self.setWindowTitle(self.dialog_title)
+        self.setFixedWidth(460) # Increased width to accommodate long emails
+        self.setMinimumHeight(320)
+        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.FramelessWindowHint)
+        
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #0f172a;
+                border: 2px solid #334155;
+                border-radius: 20px;
+            }
+            QLabel {
+                color: #f1f5f9;
+                background: transparent;
+            }
+            QLineEdit {
+                background-color: #1e293b;
+                border: 1px solid #334155;
+                border-radius: 8px;
+                padding: 10px;
+                color: white;
+                font-size: 18px;
+                letter-spacing: 5px;
+                font-weight: bold;
+            }
+            QPushButton#verify_btn {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 #667eea, stop:1 #764ba2);
+                color: white;
+                border-radius: 8px;
+                font-weight: bold;
+                padding: 10px;
+                font-size: 14px;
+            }
+            QPushButton#verify_btn:hover {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 #764ba2, stop:1 #667eea);
+            }
+            QPushButton#cancel_btn {
+                background: transparent;
+                color: #94a3b8;
+                border: 1px solid #334155;
+                border-radius: 8px;
+                padding: 10px;
+            }
+            QPushButton#cancel_btn:hover {
+                color: white;
+                border-color: #475569;
+            }
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 30)
+        layout.setSpacing(20)
+
+        title = QLabel(self.dialog_title)
+        title.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title)
+
+        desc = QLabel(self.dialog_description)
+        desc.setFont(QFont("Segoe UI", 10))
+        desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        desc.setWordWrap(True)
+        desc.setStyleSheet("color: #94a3b8; padding: 0 10px;")
+        layout.addWidget(desc)
+
+        self.otp_input = QLineEdit()
+        self.otp_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.otp_input.setMaxLength(6)
+        self.otp_input.setPlaceholderText("· · · · · ·")
+        self.otp_input.setMinimumHeight(50)
+        layout.addWidget(self.otp_input)
+
+        # Resend Option
+        resend_layout = QHBoxLayout()
+        resend_layout.setContentsMargins(0, 0, 0, 0)
+        resend_text = QLabel("Didn't receive the code?")
+        resend_text.setStyleSheet("color: #64748b; font-size: 11px;")
+        
+        self.resend_btn = QPushButton("Resend OTP")
+        self.resend_btn.setCursor(Qt.CursorShape(13))
+        self.resend_btn.setStyleSheet("""
+            QPushButton {
+                background: transparent;
+                color: #667eea;
+                border: none;
+                font-size: 11px;
+                font-weight: bold;
+                text-decoration: underline;
+            }
+            QPushButton:hover {
+                color: #764ba2;
+            }
+        """)
+        self.resend_btn.clicked.connect(self.on_resend)
+        
+        resend_layout.addStretch()
+        resend_layout.addWidget(resend_text)
+        resend_layout.addWidget(self.resend_btn)
+        resend_layout.addStretch()
+        layout.addLayout(resend_layout)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.setSpacing(15)
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setObjectName("cancel_btn")
+        cancel_btn.setCursor(Qt.CursorShape(13))
+        cancel_btn.setMinimumHeight(45)
+        cancel_btn.clicked.connect(self.reject)
+        
+        verify_btn = QPushButton("Verify Account")
+        verify_btn.setObjectName("verify_btn")
+        verify_btn.setCursor(Qt.CursorShape(13))
+        verify_btn.setMinimumHeight(45)
+        verify_btn.clicked.connect(self.on_verify)
+
+        btn_layout.addWidget(cancel_btn, 1)
+        btn_layout.addWidget(verify_btn, 2)
+        layout.addLayout(btn_layout)
+
+    def on_resend(self):
+        """Simulate resending the OTP"""
+        if self.resend_callback:
+            # a callback returning False refused to resend (e.g. throttled)
+            if self.resend_callback() is False:
+                return
+            QMessageBox.information(self, "OTP Resent", "A new verification code has been sent to your email.")
+        else:
+            # Default behavior if no callback
+            QMessageBox.information(self, "OTP Resent", "Verification code has been resent to your email.")
+
+    def on_verify(self):
+        self.otp_value = self.otp_input.text().strip()
+        if len(self.otp_value) == 6:
+            self.accept()
+        else:
+            QMessageBox.warning(self, "Invalid OTP", "Please enter a 6-digit code.")
+
+    @staticmethod
+    def get_otp(email, title="Verify OTP", description=None, parent=None, resend_callback=None):
+        dialog = OTPInputDialog(email, title, description, parent)
+        dialog.resend_callback = resend_callback
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            return dialog.otp_value, True
+        return "", False
@@ -11,56 +11,53 @@ Workout Demo Screen (LOCAL ASSETS)
    - Start -> main_win.show_workout_session(workout_id)
 """
 
-import os
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame, QTextEdit, QDialog, QMessageBox,
     QSizePolicy, QSlider, QStyle
 )
-from PyQt6.QtCore import Qt, QUrl, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QFont, QMovie, QPixmap
 
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+from PyQt6.QtMultimedia import QMediaPlayer
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 
 from backend.models import data_manager
+from frontend.utils.media_prefetch import MediaPrefetcher
+from frontend.utils.assets import get_asset_manifest
+from frontend.utils.poster_cache import get_poster_cache
+from frontend.utils.pixmap_cache import ScaledPixmapCache
 
 
 class WorkoutDemo(QWidget):
     """Exercise preview screen with local asset preview + instructions"""
 
-    ASSET_MAP = {
-        "squats": "Squats.mp4",
-        "push ups": "Push ups.mp4",
-        "crunches": "Crunches.mp4",
-        "jumping jacks": "Jumping jacks.mp4",
-        "plank": "Plank.mp4",
-        "cobra stretch": "Cobra stretch.mp4"
-    }
-
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.current_workout_id = None
+        self.preview_entry = None       # asset manifest entry being previewed
         self.camera_permission_granted = False
 
         # GIF
         self.movie = None
 
-        # Video
-        self.player = QMediaPlayer(self)
-        self.audio = QAudioOutput(self)
-        self.player.setAudioOutput(self.audio)
+        # Image / poster scaling
+        self.scaled_cache = ScaledPixmapCache()
+        self.smooth_timer = QTimer(self)
+        self.smooth_timer.setSingleShot(True)
+        self.smooth_timer.setInterval(150)
+        self.smooth_timer.timeout.connect(self._refresh_scaled_preview)
+        self._last_image_path = None
+
+        # Video - player leased from the shared media pool, created with
+        # its video widget in init_ui
+        self.media = None
 
         # ✅ Sound ON by default
-        self.audio.setVolume(1.0)          # 0.0 to 1.0
         self.is_muted = False
 
-
-        # ✅ connect error handler (NOW exists as a class method)
-        self.player.errorOccurred.connect(self.on_media_error)
-
         # Seek state
         self.is_seeking = False
 
@@ -192,6 +189,9 @@ class WorkoutDemo(QWidget):
     # ==================================================
     def hideEvent(self, event):
         self._pause_preview()
+        # release decoder resources while another screen is shown
+        if self.media:
+            self.media.release()
         super().hideEvent(event)
 
     def closeEvent(self, event):
@@ -199,8 +199,10 @@ class WorkoutDemo(QWidget):
         super().closeEvent(event)
 
     def resizeEvent(self, event):
-        # keep GIF and image scaled nicely when resizing
-        self._refresh_scaled_preview()
+        # keep GIF and image scaled nicely when resizing: fast scale while
+        # the window is being dragged, smooth pass once it settles
+        self._refresh_scaled_preview(smooth=False)
+        self.smooth_timer.start()
         super().resizeEvent(event)
 
     # ==================================================
@@ -279,7 +281,16 @@ class WorkoutDemo(QWidget):
         self.video_widget.setStyleSheet("background: black; border-radius: 10px;")
         self.video_widget.hide()
 
-        self.player.setVideoOutput(self.video_widget)
+        self.media = MediaPrefetcher(
+            self.video_widget, volume=1.0, loops=QMediaPlayer.Loops.Once, parent=self
+        )
+
+        # poster stays up until the first decoded frame (or this fallback)
+        self.poster = None
+        self.poster_timer = QTimer(self)
+        self.poster_timer.setSingleShot(True)
+        self.poster_timer.setInterval(1500)
+        self.poster_timer.timeout.connect(self.reveal_video)
 
         # --- Controls container ---
         self.controls_container = QFrame()
@@ -486,20 +497,12 @@ class WorkoutDemo(QWidget):
 
     # ==================================================
     def hook_player_signals(self):
-        self.player.positionChanged.connect(self.on_position_changed)
-        self.player.durationChanged.connect(self.on_duration_changed)
-        self.player.playbackStateChanged.connect(self.on_playback_state_changed)
-
-    # ==================================================
-    def assets_path(self, filename: str) -> str:
-        # this file is: frontend/ui/workout_demo.py
-        # assets are:   frontend/assets/
-        frontend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        return os.path.join(frontend_dir, "assets", filename)
-
-    @staticmethod
-    def normalize_name(name: str) -> str:
-        return " ".join(name.strip().lower().split())
+        self.media.firstFrame.connect(self.reveal_video)
+        # ✅ connect error handler (NOW exists as a class method)
+        self.media.errorOccurred.connect(self.on_media_error)
+        self.media.positionChanged.connect(self.on_position_changed)
+        self.media.durationChanged.connect(self.on_duration_changed)
+        self.media.playbackStateChanged.connect(self.on_playback_state_changed)
 
     # ==================================================
     def load_workout(self, workout_id):
@@ -533,10 +536,11 @@ class WorkoutDemo(QWidget):
             self.movie.stop()
             self.movie = None
 
-        # Stop video
-        if self.player:
-            self.player.pause()
-            self.player.setSource(QUrl())
+        # Stop video (the pool keeps it loaded)
+        if self.media:
+            self.media.clear()
+            self.poster = None
+            self.poster_timer.stop()
 
         # Reset controls
         if self.controls_container:
@@ -559,56 +563,64 @@ class WorkoutDemo(QWidget):
             self.preview_label.setText("No Preview")
             self.preview_label.setPixmap(QPixmap())
             self.preview_label.setMovie(None)
+        self._last_image_path = None
         
         # ✅ Reset mute state for next time (optional)
         self.is_muted = False
-        self.audio.setMuted(False)
+        self.media.set_muted(False)
         if self.mute_btn and self.icon_volume:
             self.mute_btn.setIcon(self.icon_volume)
 
 
     # ==================================================
     def preview_asset(self, workout_name: str):
-        key = self.normalize_name(workout_name)
-        filename = self.ASSET_MAP.get(key)
+        entry = get_asset_manifest().lookup(workout_name)
+        self.preview_entry = entry
 
-        if not filename:
+        if not entry:
             self.stop_preview()
             self.preview_label.setText("No Preview Available")
             return
 
-        path = self.assets_path(filename)
-
-        if not os.path.exists(path):
-            self.stop_preview()
-            self.preview_label.setText(f"File Not Found: {filename}")
-            return
-
-        ext = os.path.splitext(filename)[1].lower()
-
-        if ext == ".mp4":
-            self.play_video(path)
-        elif ext == ".gif":
-            self.play_gif(path)
-        elif ext in (".png", ".jpg", ".jpeg"):
-            self.show_image(path)
+        # full-size view: always the original rendition, never the proxy
+        if entry.is_video:
+            self.play_video(entry.path, entry.sha256)
+        elif entry.ext == ".gif":
+            self.play_gif(entry.path)
+        elif entry.ext in (".png", ".jpg", ".jpeg"):
+            self.show_image(entry.path)
         else:
             self.stop_preview()
             self.preview_label.setText("Unsupported Preview Type")
 
     # ==================================================
-    def play_video(self, video_path: str):
+    def play_video(self, video_path: str, content_hash=None):
         self.stop_preview()
 
-        self.preview_label.hide()
-        self.video_widget.show()
+        # show the cached poster frame while the decoder starts
+        self.poster = get_poster_cache().poster(video_path, content_hash)
+        self.poster_key = video_path
+        if self.poster is not None:
+            self._refresh_scaled_preview()
+            self.poster_timer.start()
+        else:
+            self.preview_label.hide()
+            self.video_widget.show()
 
         # ✅ always show controls for mp4
         self.controls_container.show()
         self.controls_container.raise_()
 
-        self.player.setSource(QUrl.fromLocalFile(video_path))
-        self.player.play()
+        self.media.play(video_path)
+
+    def reveal_video(self, *args):
+        """Swap the poster for the video once frames are flowing"""
+        if self.poster is None:
+            return
+        self.poster = None
+        self.poster_timer.stop()
+        self.preview_label.hide()
+        self.video_widget.show()
 
     def play_gif(self, gif_path: str):
         self.stop_preview()
@@ -628,34 +640,38 @@ class WorkoutDemo(QWidget):
         self._last_image_path = img_path
         self._refresh_scaled_preview()
 
-    def _refresh_scaled_preview(self):
+    def _refresh_scaled_preview(self, smooth=True):
         # scale GIF
         if self.movie and self.preview_label:
             self.movie.setScaledSize(self.preview_label.size())
 
-        # scale image
-        img_path = getattr(self, "_last_image_path", None)
+        # scale video poster
+        if self.poster is not None and self.preview_label:
+            self.preview_label.setPixmap(
+                self.scaled_cache.scaled(("poster", self.poster_key), self.poster,
+                                         self.preview_label.size(), smooth)
+            )
+            return
+
+        # scale image (decoded from disk once, scaled copies cached per size)
+        img_path = self._last_image_path
         if img_path and self.preview_label:
-            pix = QPixmap(img_path)
+            pix = self.scaled_cache.source(img_path)
             if pix.isNull():
                 self.preview_label.setText("Image Load Failed")
                 return
             self.preview_label.setPixmap(
-                pix.scaled(
-                    self.preview_label.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
+                self.scaled_cache.scaled(img_path, pix, self.preview_label.size(), smooth)
             )
 
     # ==================================================
     # Controls
     # ==================================================
     def toggle_play_pause(self):
-        if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-            self.player.pause()
+        if self.media.is_playing():
+            self.media.pause()
         else:
-            self.player.play()
+            self.media.resume()
 
     def on_playback_state_changed(self, state):
         if state == QMediaPlayer.PlaybackState.PlayingState:
@@ -679,12 +695,12 @@ class WorkoutDemo(QWidget):
         self.current_time_lbl.setText(self.format_ms(value))
 
     def on_seek_released(self):
-        self.player.setPosition(self.seek_slider.value())
+        self.media.set_position(self.seek_slider.value())
         self.is_seeking = False
     
     def toggle_mute(self):
         self.is_muted = not self.is_muted
-        self.audio.setMuted(self.is_muted)
+        self.media.set_muted(self.is_muted)
 
         if self.is_muted:
             self.mute_btn.setIcon(self.icon_muted)
@@ -703,12 +719,17 @@ class WorkoutDemo(QWidget):
     # Navigation / screen switching
     # ==================================================
     def _pause_preview(self):
-        if self.player:
-            self.player.pause()
+        if self.media:
+            self.media.pause()
 
     def start_workout(self):
-        # ✅ pause preview BEFORE permission dialog
+        # ✅ pause preview BEFORE permission dialog, hand the player back to
+        # the pool and warm the proxy the session pane will play
         self._pause_preview()
+        self.media.release()
+        entry = self.preview_entry
+        if entry and entry.is_video:
+            self.media.prefetch(entry.small_path)
 
         self.open_camera_screen()
     
@@ -13,11 +13,16 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame, QSizePolicy, QDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QTime, QUrl, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QTime, QSize
 from PyQt6.QtGui import QFont, QMovie, QIcon, QPixmap
-from PyQt6.QtMultimedia import QCamera, QMediaCaptureSession, QAudioOutput, QMediaPlayer
+from PyQt6.QtMultimedia import QCamera, QMediaCaptureSession
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 
+from frontend.utils.styles import apply_style, set_style_state
+from frontend.utils.media_prefetch import MediaPrefetcher
+from frontend.utils.assets import get_asset_manifest
+from frontend.utils.poster_cache import get_poster_cache
+
 
 class WorkoutSession(QWidget):
     """Real-time workout session page with camera monitoring"""
@@ -25,16 +30,6 @@ class WorkoutSession(QWidget):
     sessionEnded = pyqtSignal()
     nextWorkoutRequested = pyqtSignal(int)
 
-    # 🔁 Exercise name → media file mapping
-    GIF_MAP = {
-        "squats": "Squats.mp4",
-        "push ups": "Push ups.mp4",
-        "crunches": "Crunches.mp4",
-        "jumping jacks": "Jumping jacks.mp4",
-        "plank": "Plank.mp4",
-        "cobra stretch": "Cobra stretch.mp4"
-}
-
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -55,13 +50,12 @@ class WorkoutSession(QWidget):
         self.stopwatch_timer.timeout.connect(self.update_stopwatch)
         self.session_time = QTime(0, 0)
 
-        # Demo player (ALWAYS MUTED)
-        self.demo_player = QMediaPlayer(self)
-        self.demo_audio = QAudioOutput(self)
-        self.demo_audio.setVolume(0.0)  # ✅ Always silent
-        self.demo_player.setAudioOutput(self.demo_audio)
-        self.demo_player.errorOccurred.connect(self.on_demo_media_error)
-        self.demo_player.setLoops(QMediaPlayer.Loops.Infinite)
+        # Demo player (ALWAYS MUTED) - leased from the shared media pool,
+        # created with its video widget in init_ui
+        self.demo_media = None
+
+        # Asset entries of the trainee's plan, in get_workout_plan order
+        self.plan_media = []
 
         self.init_ui()
         
@@ -76,53 +70,29 @@ class WorkoutSession(QWidget):
 
         # 1) Top Navigation Bar
         nav_bar = QFrame()
+        nav_bar.setObjectName("navBar")
         nav_bar.setFixedHeight(80)
-        nav_bar.setStyleSheet("""
-            QFrame {
-                background: rgba(15, 12, 41, 0.4);
-                border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
+        apply_style(nav_bar, "navBar")
         nav_layout = QHBoxLayout(nav_bar)
         nav_layout.setContentsMargins(50, 0, 50, 0)
 
         app_title = QLabel("SmartARTrainer")
+        app_title.setObjectName("appTitle")
         app_title.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
-        app_title.setStyleSheet("color: #667eea; background: transparent;")
         nav_layout.addWidget(app_title)
 
         nav_layout.addStretch()
 
-        btn_style = """
-            QPushButton {
-                background: transparent;
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.4);
-                border-radius: 8px;
-                padding: 8px 20px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: rgba(102, 126, 234, 0.3);
-            }
-        """
-
         self.dash_btn = QPushButton("Workout")
-        self.dash_btn.setStyleSheet(
-            btn_style.replace("transparent", "rgba(102, 126, 234, 0.8)")
-                     .replace("1px solid rgba(255, 255, 255, 0.4)", "none")
-        )
+        self.dash_btn.setProperty("active", "true")
         self.dash_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.dash_btn.clicked.connect(lambda: self.sessionEnded.emit())
 
         self.analytics_btn = QPushButton("Dashboard")
-        self.analytics_btn.setStyleSheet(btn_style)
         self.analytics_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.analytics_btn.clicked.connect(self.on_analytics_clicked)
 
         self.profile_btn = QPushButton("Profile")
-        self.profile_btn.setStyleSheet(btn_style)
         self.profile_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.profile_btn.clicked.connect(self.on_profile_clicked)
 
@@ -222,7 +192,16 @@ class WorkoutSession(QWidget):
         self.demo_video_widget.setStyleSheet("background: transparent;")
         self.demo_video_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.demo_video_widget.setVisible(False)
-        self.demo_player.setVideoOutput(self.demo_video_widget)
+        self.demo_media = MediaPrefetcher(self.demo_video_widget, volume=0.0, parent=self)  # ✅ Always silent
+        self.demo_media.errorOccurred.connect(self.on_demo_media_error)
+        self.demo_media.firstFrame.connect(self.reveal_demo_video)
+
+        # poster stays up until the first decoded frame (or this fallback)
+        self.showing_poster = False
+        self.poster_timer = QTimer(self)
+        self.poster_timer.setSingleShot(True)
+        self.poster_timer.setInterval(1500)
+        self.poster_timer.timeout.connect(self.reveal_demo_video)
         demo_main_layout.addWidget(self.demo_video_widget, stretch=1)
 
         self.tutorial_btn = QPushButton("Tutorial")
@@ -295,7 +274,7 @@ class WorkoutSession(QWidget):
         self.control_btn = QPushButton("Start")
         self.control_btn.setFixedSize(200, 55)
         self.control_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.set_start_style()
+        apply_style(self.control_btn, "sessionControl", state="start")
         self.control_btn.clicked.connect(self.toggle_session)
         footer_layout.addWidget(self.control_btn)
 
@@ -335,9 +314,8 @@ class WorkoutSession(QWidget):
         if self.camera_active:
             self.stop_session()
 
-        # pause demo preview inside session
-        if self.demo_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-            self.demo_player.pause()
+        # hand the demo player back to the pool; it stays loaded for resume()
+        self.demo_media.release()
         if self.movie and self.movie.state() == QMovie.MovieState.Running:
             self.movie.setPaused(True)
 
@@ -355,8 +333,7 @@ class WorkoutSession(QWidget):
         self.demo_container.hide()
         self.open_demo_btn.setVisible(True)
 
-        if self.demo_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-            self.demo_player.pause()
+        self.demo_media.pause()
 
         if self.movie and self.movie.state() == QMovie.MovieState.Running:
             self.movie.setPaused(True)
@@ -372,16 +349,32 @@ class WorkoutSession(QWidget):
         self.split_layout.setStretch(0, 40)
         self.split_layout.setStretch(1, 60)
 
-        if self.demo_player.playbackState() == QMediaPlayer.PlaybackState.PausedState:
-            self.demo_player.play()
+        self.demo_media.resume()
 
         if self.movie and self.movie.state() == QMovie.MovieState.Paused:
             self.movie.setPaused(False)
 
+    # ---------------- Visibility ----------------
+    def showEvent(self, event):
+        # re-lease the demo video (usually still loaded in the pool)
+        if not self.demo_container.isHidden():
+            self.demo_media.resume()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # release decoder resources while another screen is shown
+        self.demo_media.release()
+        super().hideEvent(event)
+
     # ---------------- Workout Flow ----------------
     def on_next_clicked(self):
         self.nextWorkoutRequested.emit(self.current_index)
 
+    def set_plan(self, workouts: list):
+        """Remember the plan order so the next exercise's demo can be prefetched"""
+        assets = get_asset_manifest()
+        self.plan_media = [assets.lookup(w.get("name", "")) for w in workouts]
+
     def set_workout(self, workout: dict, index: int):
         self.current_workout = workout
         self.current_index = index  # workout_id
@@ -393,7 +386,9 @@ class WorkoutSession(QWidget):
     # ---------------- Demo Media ----------------
     def on_demo_media_error(self, error, error_string):
         # If codecs/plugins are missing, show a friendly fallback
-        self.demo_player.stop()
+        self.showing_poster = False
+        self.poster_timer.stop()
+        self.demo_media.clear()
         self.demo_video_widget.setVisible(False)
         self.demo_widget.setVisible(True)
         self.demo_widget.setText(
@@ -403,47 +398,46 @@ class WorkoutSession(QWidget):
     )
 
     def preview_gif(self, workout_name: str):
-        key = workout_name.strip().lower()
-        media_file = self.GIF_MAP.get(key)
+        # 🔁 Exercise name → asset (manifest built once at startup, no stat here)
+        entry = get_asset_manifest().lookup(workout_name)
 
-        if not media_file:
+        if not entry:
             self.demo_widget.setText("No Preview Available")
             self.demo_widget.setVisible(True)
             self.demo_video_widget.setVisible(False)
             return
 
-        self.load_media(media_file)
-
-    def load_media(self, filename: str):
-        frontend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        media_path = os.path.join(frontend_dir, "assets", filename)
-
-        if not os.path.exists(media_path):
-            self.demo_widget.setText(f"File Not Found:\n{filename}")
-            self.demo_widget.setVisible(True)
-            self.demo_video_widget.setVisible(False)
-            return
+        self.load_media(entry)
 
+    def load_media(self, entry):
         if self.movie:
             self.movie.stop()
             self.movie = None
-        self.demo_player.stop()
 
-        ext = os.path.splitext(filename)[1].lower()
-
-        # ✅ Always force mute
-        self.demo_audio.setVolume(0.0)
-
-        if ext in [".mp4", ".avi", ".mov", ".mkv"]:
-            self.demo_widget.setVisible(False)
-            self.demo_video_widget.setVisible(True)
-            self.demo_player.setSource(QUrl.fromLocalFile(media_path))
-            self.demo_player.play()
+        if entry.is_video:
+            # the pane is small: prefer the low-resolution proxy rendition
+            media_path = entry.small_path
+            poster = get_poster_cache().poster(entry.path, entry.sha256)
+            if poster is not None:
+                self.demo_widget.setPixmap(poster)
+                self.demo_widget.setVisible(True)
+                self.demo_video_widget.setVisible(False)
+                self.showing_poster = True
+                self.poster_timer.start()
+            else:
+                self.demo_widget.setVisible(False)
+                self.demo_video_widget.setVisible(True)
+            self.demo_media.play(media_path)
+            self.prefetch_next(entry)
         else:
+            media_path = entry.path
+            self.showing_poster = False
+            self.poster_timer.stop()
+            self.demo_media.clear()
             self.demo_video_widget.setVisible(False)
             self.demo_widget.setVisible(True)
 
-            if ext == ".gif":
+            if entry.ext == ".gif":
                 self.movie = QMovie(media_path)
                 self.movie.setCacheMode(QMovie.CacheMode.CacheAll)
                 self.demo_widget.setMovie(self.movie)
@@ -457,36 +451,36 @@ class WorkoutSession(QWidget):
 
             self.demo_widget.setScaledContents(True)
 
+    def reveal_demo_video(self, *args):
+        """Swap the poster for the video once frames are flowing"""
+        if not self.showing_poster:
+            return
+        self.showing_poster = False
+        self.poster_timer.stop()
+        self.demo_widget.setVisible(False)
+        self.demo_video_widget.setVisible(True)
+
+    def prefetch_next(self, entry):
+        """Warm the decoder for the exercise after `entry` in the plan"""
+        if entry not in self.plan_media:
+            return
+
+        next_index = self.plan_media.index(entry) + 1
+        if next_index >= len(self.plan_media):
+            return
+
+        next_entry = self.plan_media[next_index]
+        if next_entry and next_entry.is_video:
+            self.demo_media.prefetch(next_entry.small_path)
+
     # ---------------- Session Controls ----------------
     def set_start_style(self):
         self.control_btn.setText("Start")
-        self.control_btn.setStyleSheet("""
-            QPushButton {
-                background: #48bb78;
-                color: white;
-                border-radius: 15px;
-                font-weight: bold;
-                font-size: 18px;
-            }
-            QPushButton:hover {
-                background: #38a169;
-            }
-        """)
+        set_style_state(self.control_btn, state="start")
 
     def set_stop_style(self):
         self.control_btn.setText("Stop")
-        self.control_btn.setStyleSheet("""
-            QPushButton {
-                background: #f56565;
-                color: white;
-                border-radius: 15px;
-                font-weight: bold;
-                font-size: 18px;
-            }
-            QPushButton:hover {
-                background: #e53e3e;
-            }
-        """)
+        set_style_state(self.control_btn, state="stop")
 
     def toggle_session(self):
         if not self.camera_active:
@@ -0,0 +1,74 @@
+"""
+Table model for the analytics summary tables
+Rows are keyed by workout name; set_rows() diffs against the current rows
+and only emits dataChanged for rows whose values actually changed, instead
+of rebuilding every QTableWidgetItem on each visit.
+"""
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+
+
+class AnalyticsTableModel(QAbstractTableModel):
+    """Read-only rows of (workout name, value, value, ...)"""
+
+    def __init__(self, headers, colors=None, formats=None, parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        # per-column foreground colour / str.format pattern (None = default)
+        self.colors = [QColor(c) if c else None for c in (colors or [None] * len(headers))]
+        self.formats = list(formats or ["{}"] * len(headers))
+        self._rows = []
+
+    # ---------------- Qt model API ----------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.formats[col].format(self._rows[index.row()][col])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            horizontal = Qt.AlignmentFlag.AlignLeft if col == 0 else Qt.AlignmentFlag.AlignCenter
+            return horizontal | Qt.AlignmentFlag.AlignVCenter
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.colors[col]
+        return None
+
+    # ---------------- Updates ----------------
+    def set_rows(self, rows):
+        """Apply new rows: drop vanished keys, update changed rows, append new keys"""
+        incoming = {row[0]: tuple(row) for row in rows}
+
+        # 1) remove rows whose workout disappeared (bottom-up keeps indices valid)
+        for i in reversed(range(len(self._rows))):
+            if self._rows[i][0] not in incoming:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._rows[i]
+                self.endRemoveRows()
+
+        # 2) update rows in place, notifying only when values differ
+        last_col = len(self.headers) - 1
+        for i, current in enumerate(self._rows):
+            new = incoming.pop(current[0])
+            if new != current:
+                self._rows[i] = new
+                self.dataChanged.emit(self.index(i, 0), self.index(i, last_col))
+
+        # 3) append workouts seen for the first time, in the order given
+        if incoming:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(incoming) - 1)
+            self._rows.extend(incoming.values())
+            self.endInsertRows()
@@ -0,0 +1,171 @@
+"""
+Asset manifest for SmartARTrainer
+frontend/assets is scanned once (at startup) into an AssetManifest: every
+preview file gets a normalized exercise name, absolute path, size, duration
+(MP4s) and SHA-256. Screens then resolve an exercise to its media with a
+plain dict lookup - no filename maps and no os.path.exists on the navigation
+path - and caches can key on the content hash instead of path + mtime.
+
+Demo videos can have a low-resolution proxy rendition (see
+frontend/tools/make_proxies.py). Small panes use entry.small_path, full-size
+views entry.path.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import time
+
+ASSETS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "assets"))
+PROXY_DIR = os.path.join(ASSETS_DIR, "proxies")
+PROXY_MANIFEST = os.path.join(PROXY_DIR, "manifest.json")
+
+VIDEO_EXTS = (".mp4", ".avi", ".mov", ".mkv")
+PREVIEW_EXTS = VIDEO_EXTS + (".gif", ".png", ".jpg", ".jpeg")
+
+
+def normalize_name(name):
+    """'Push Ups ' / 'push  ups' / 'Push ups.mp4' stem -> 'push ups'"""
+    return " ".join((name or "").strip().lower().split())
+
+
+def mp4_duration_ms(path):
+    """Duration from the MP4 'mvhd' atom (no decoder needed); None if unreadable"""
+    try:
+        with open(path, "rb") as f:
+            end = os.fstat(f.fileno()).st_size
+            return _find_mvhd_duration(f, 0, end)
+    except (OSError, struct.error):
+        return None
+
+
+def _find_mvhd_duration(f, start, end):
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:                       # 64-bit atom size
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:                     # atom runs to the end of the file
+            size = end - offset
+        if size < header:
+            return None
+
+        if kind == b"moov":
+            return _find_mvhd_duration(f, offset + header, offset + size)
+        if kind == b"mvhd":
+            version = f.read(4)[0]
+            if version == 1:
+                f.read(16)                  # creation + modification time (64-bit)
+                timescale, duration = struct.unpack(">IQ", f.read(12))
+            else:
+                f.read(8)
+                timescale, duration = struct.unpack(">II", f.read(8))
+            return int(duration * 1000 / timescale) if timescale else None
+        offset += size
+    return None
+
+
+def sha256_of(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AssetEntry:
+    """One preview asset and everything known about it"""
+
+    def __init__(self, name, filename, path, size, sha256, duration_ms=None, proxy_path=None):
+        self.name = name                  # normalized exercise name
+        self.filename = filename
+        self.path = path                  # original rendition
+        self.size = size
+        self.sha256 = sha256
+        self.duration_ms = duration_ms
+        self.proxy_path = proxy_path      # low-res rendition, None if absent / stale
+        self.ext = os.path.splitext(filename)[1].lower()
+
+    @property
+    def is_video(self):
+        return self.ext in VIDEO_EXTS
+
+    @property
+    def small_path(self):
+        """Rendition for small panes: the proxy when available"""
+        return self.proxy_path or self.path
+
+
+class AssetManifest:
+    """All preview assets, indexed by normalized name and by filename"""
+
+    def __init__(self, directory=ASSETS_DIR):
+        self.directory = directory
+        self.by_name = {}
+        self.by_filename = {}
+        self.build_ms = 0.0
+
+    def build(self):
+        t0 = time.perf_counter()
+        proxies = self._load_proxies()
+
+        for filename in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, filename)
+            if not filename.lower().endswith(PREVIEW_EXTS) or not os.path.isfile(path):
+                continue
+
+            digest = sha256_of(path)
+            entry = AssetEntry(
+                name=normalize_name(os.path.splitext(filename)[0]),
+                filename=filename,
+                path=path,
+                size=os.path.getsize(path),
+                sha256=digest,
+                duration_ms=mp4_duration_ms(path) if filename.lower().endswith(".mp4") else None,
+            )
+
+            # a proxy is only valid for the exact original it was encoded from
+            proxy = proxies.get(filename)
+            if proxy and proxy.get("source_sha256") == digest:
+                proxy_path = os.path.join(PROXY_DIR, proxy["file"])
+                if os.path.isfile(proxy_path):
+                    entry.proxy_path = proxy_path
+
+            self.by_name[entry.name] = entry
+            self.by_filename[filename] = entry
+
+        self.build_ms = (time.perf_counter() - t0) * 1000
+        return self
+
+    @staticmethod
+    def _load_proxies():
+        try:
+            with open(PROXY_MANIFEST, "r", encoding="utf-8") as f:
+                return json.load(f).get("proxies", {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Proxy manifest error: {e}")
+            return {}
+
+    def lookup(self, workout_name):
+        """Asset for an exercise name (any case / spacing), or None"""
+        return self.by_name.get(normalize_name(workout_name))
+
+    def __len__(self):
+        return len(self.by_filename)
+
+
+asset_manifest = None
+
+
+def get_asset_manifest():
+    """Global manifest, scanned on first use"""
+    global asset_manifest
+    if asset_manifest is None:
+        asset_manifest = AssetManifest().build()
+    return asset_manifest
@@ -0,0 +1,324 @@
+"""
+Lightweight QPainter chart widgets for SmartARTrainer
+Native alternative to matplotlib's FigureCanvas for the simple
+per-session line charts and accuracy bar chart on the analytics screen.
+
+Each chart is rendered into a QPixmap that is cached per widget size and
+data version: it is only redrawn after a resize or a data change, so
+repaints triggered by scrolling are a single pixmap blit. Pixel geometry
+(series polylines, marker points, bar rectangles) is built at that point.
+"""
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QPointF, QRectF, QLineF
+from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QBrush, QPixmap
+
+# matplotlib's default colour cycle, so both chart paths look alike
+SERIES_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"]
+
+
+class ChartWidget(QWidget):
+    """Base chart: title, axis labels, y range, grid, target line"""
+
+    MARGINS = (70, 50, 30, 60)  # left, top, right, bottom
+
+    def __init__(self, title="", x_label="", y_label="", parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.x_label = x_label
+        self.y_label = y_label
+        self.y_min = 0
+        self.y_max = 1
+        self.y_ticks = None
+        self.target = None
+        self.target_label = ""
+
+        self._geometry_key = None
+        self._data_version = 0
+        self._pixmap = None
+        self._pixmap_key = None
+
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+
+    # ---------------- Configuration ----------------
+    def set_y_range(self, y_min, y_max, ticks=None):
+        self.y_min = y_min
+        self.y_max = y_max if y_max > y_min else y_min + 1
+        self.y_ticks = list(ticks) if ticks is not None else None
+        self.invalidate()
+
+    def set_target(self, value, label=""):
+        """Draw a dashed horizontal reference line (e.g. the plan target)"""
+        self.target = value
+        self.target_label = label
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop cached vertices and the rendered pixmap, schedule a repaint"""
+        self._data_version += 1
+        self.update()
+
+    # ---------------- Geometry ----------------
+    def plot_rect(self):
+        left, top, right, bottom = self.MARGINS
+        return QRectF(left, top,
+                      max(1, self.width() - left - right),
+                      max(1, self.height() - top - bottom))
+
+    def map_y(self, value, rect):
+        span = self.y_max - self.y_min
+        ratio = (value - self.y_min) / span
+        return rect.bottom() - ratio * rect.height()
+
+    def _ensure_geometry(self):
+        key = (self.width(), self.height(), self._data_version)
+        if key != self._geometry_key:
+            self.build_geometry(self.plot_rect())
+            self._geometry_key = key
+
+    def build_geometry(self, rect):
+        """Subclasses convert data to cached pixel vertices here"""
+
+    def default_y_ticks(self):
+        if self.y_ticks is not None:
+            return self.y_ticks
+
+        span = self.y_max - self.y_min
+        step = 1
+        for candidate in (1, 2, 5, 10, 20, 25, 50, 100, 200, 500):
+            step = candidate
+            if span / candidate <= 8:
+                break
+
+        start = int(self.y_min // step) * step
+        return list(range(start, int(self.y_max) + 1, step))
+
+    # ---------------- Painting ----------------
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._rendered())
+        painter.end()
+
+    def _rendered(self):
+        """The whole chart as a pixmap, redrawn only after a resize or data change"""
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio, self._data_version)
+        if key == self._pixmap_key:
+            return self._pixmap
+
+        self._ensure_geometry()
+        pixmap = QPixmap(max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QColor("#ffffff"))
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = self.plot_rect()
+        self.draw_axes(painter, rect)
+        self.draw_data(painter, rect)
+        self.draw_target(painter, rect)
+        self.draw_legend(painter, rect)
+        painter.end()
+
+        self._pixmap = pixmap
+        self._pixmap_key = key
+        return pixmap
+
+    def draw_axes(self, painter, rect):
+        painter.setFont(QFont("Segoe UI", 9))
+        grid_pen = QPen(QColor("#b0b0b0"), 0.8)
+        text_pen = QPen(QColor("#222222"))
+
+        for tick in self.default_y_ticks():
+            if tick < self.y_min or tick > self.y_max:
+                continue
+            y = self.map_y(tick, rect)
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+            painter.setPen(text_pen)
+            painter.drawText(QRectF(0, y - 8, rect.left() - 8, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             str(tick))
+
+        painter.setPen(QPen(QColor("#222222"), 1))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(rect)
+
+        # Title + axis labels
+        painter.setFont(QFont("Segoe UI", 11))
+        painter.drawText(QRectF(rect.left(), 0, rect.width(), rect.top()),
+                         Qt.AlignmentFlag.AlignCenter, self.title)
+
+        painter.setFont(QFont("Segoe UI", 9))
+        painter.drawText(QRectF(rect.left(), self.height() - 22, rect.width(), 20),
+                         Qt.AlignmentFlag.AlignCenter, self.x_label)
+
+        painter.save()
+        painter.translate(14, rect.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-rect.height() / 2, -10, rect.height(), 20),
+                         Qt.AlignmentFlag.AlignCenter, self.y_label)
+        painter.restore()
+
+    def draw_data(self, painter, rect):
+        pass
+
+    def draw_target(self, painter, rect):
+        if self.target is None or not (self.y_min <= self.target <= self.y_max):
+            return
+        y = self.map_y(self.target, rect)
+        pen = QPen(QColor("#d62728"), 1.2, Qt.PenStyle.DashLine)
+        painter.setPen(pen)
+        painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+        if self.target_label:
+            painter.drawText(QRectF(rect.left() + 6, y - 18, rect.width() - 12, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             self.target_label)
+
+    def draw_legend(self, painter, rect):
+        pass
+
+
+class LineChartWidget(ChartWidget):
+    """Per-session line chart with markers (matplotlib marker='o' look)"""
+
+    def __init__(self, title="", x_label="", y_label="", parent=None):
+        super().__init__(title, x_label, y_label, parent)
+        self.series = []          # [(label, values, QColor)]
+        self.x_count = 0
+
+        # cached vertices, rebuilt in build_geometry
+        self._polylines = []
+        self._x_ticks = []
+
+    def add_series(self, label, values, color=None):
+        color = QColor(color or SERIES_COLORS[len(self.series) % len(SERIES_COLORS)])
+        self.series.append((label, list(values), color))
+        self.x_count = max(self.x_count, len(values))
+        self.invalidate()
+
+    def clear_series(self):
+        self.series = []
+        self.x_count = 0
+        self.invalidate()
+
+    def map_x(self, index, rect):
+        # sessions are 1-based; a single point sits in the middle
+        if self.x_count <= 1:
+            return rect.center().x()
+        pad = rect.width() * 0.05
+        usable = rect.width() - 2 * pad
+        return rect.left() + pad + usable * index / (self.x_count - 1)
+
+    def build_geometry(self, rect):
+        self._polylines = []
+        for label, values, color in self.series:
+            points = [
+                QPointF(self.map_x(i, rect), self.map_y(min(max(v, self.y_min), self.y_max), rect))
+                for i, v in enumerate(values)
+            ]
+            # separate segments stroke far faster than one antialiased polyline
+            segments = [QLineF(points[i], points[i + 1]) for i in range(len(points) - 1)]
+            self._polylines.append((segments, points, color))
+
+        # Thin out x tick labels so they never overlap
+        step = max(1, self.x_count // max(1, int(rect.width() // 28)))
+        self._x_ticks = [
+            (self.map_x(i, rect), str(i + 1))
+            for i in range(0, self.x_count, step)
+        ]
+
+    def draw_data(self, painter, rect):
+        painter.setFont(QFont("Segoe UI", 9))
+        painter.setPen(QPen(QColor("#222222")))
+        for x, text in self._x_ticks:
+            painter.drawText(QRectF(x - 14, rect.bottom() + 4, 28, 16),
+                             Qt.AlignmentFlag.AlignCenter, text)
+
+        for segments, points, color in self._polylines:
+            painter.setPen(QPen(color, 1.6))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            if segments:
+                painter.drawLines(segments)
+
+            painter.setBrush(QBrush(color))
+            for point in points:
+                painter.drawEllipse(point, 3.5, 3.5)
+
+    def draw_legend(self, painter, rect):
+        if not self.series:
+            return
+
+        painter.setFont(QFont("Segoe UI", 9))
+        line_h = 18
+        box = QRectF(rect.right() - 150, rect.top() + 8, 142, line_h * len(self.series) + 8)
+        painter.setPen(QPen(QColor("#cccccc")))
+        painter.setBrush(QBrush(QColor(255, 255, 255, 220)))
+        painter.drawRoundedRect(box, 4, 4)
+
+        for i, (label, _, color) in enumerate(self.series):
+            y = box.top() + 4 + line_h * i + line_h / 2
+            painter.setPen(QPen(color, 1.6))
+            painter.drawLine(QPointF(box.left() + 8, y), QPointF(box.left() + 30, y))
+            painter.setPen(QPen(QColor("#222222")))
+            painter.drawText(QRectF(box.left() + 36, y - line_h / 2, box.width() - 40, line_h),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, label)
+
+
+class BarChartWidget(ChartWidget):
+    """Vertical bar chart with value labels above each bar"""
+
+    MARGINS = (70, 50, 30, 80)
+
+    def __init__(self, title="", x_label="", y_label="", parent=None):
+        super().__init__(title, x_label, y_label, parent)
+        self.labels = []
+        self.values = []
+        self.colors = []
+        self.value_format = "{}"
+        self.bar_width = 0.3      # fraction of the slot, like matplotlib width=
+
+        self._bars = []
+
+    def set_bars(self, labels, values, colors=None, value_format="{}"):
+        self.labels = list(labels)
+        self.values = list(values)
+        self.colors = [QColor(c) for c in (colors or [SERIES_COLORS[0]] * len(values))]
+        self.value_format = value_format
+        self.invalidate()
+
+    def build_geometry(self, rect):
+        self._bars = []
+        count = len(self.values)
+        if not count:
+            return
+
+        slot = rect.width() / count
+        width = slot * self.bar_width
+        base = self.map_y(max(self.y_min, 0), rect)
+
+        for i, value in enumerate(self.values):
+            cx = rect.left() + slot * (i + 0.5)
+            top = self.map_y(min(max(value, self.y_min), self.y_max), rect)
+            bar = QRectF(cx - width / 2, top, width, base - top)
+            self._bars.append((bar, cx, self.colors[i], self.value_format.format(value), self.labels[i]))
+
+    def draw_data(self, painter, rect):
+        painter.setFont(QFont("Segoe UI", 9))
+        for bar, cx, color, value_text, label in self._bars:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QBrush(color))
+            painter.drawRect(bar)
+
+            painter.setPen(QPen(QColor("#222222")))
+            painter.drawText(QRectF(cx - 40, bar.top() - 18, 80, 16),
+                             Qt.AlignmentFlag.AlignCenter, value_text)
+
+            # x tick label, rotated like rotation=20 in matplotlib
+            painter.save()
+            painter.translate(cx, rect.bottom() + 10)
+            painter.rotate(-20)
+            painter.drawText(QRectF(-100, 0, 100, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
+            painter.restore()
@@ -0,0 +1,161 @@
+"""
+Shared QMediaPlayer pool for the exercise demo videos
+WorkoutDemo and WorkoutSession lease players from one pool instead of each
+keeping its own QMediaPlayer/QAudioOutput alive for the whole app lifetime.
+
+- lease(path) returns a player that already has `path` loaded when one is
+  idle (no reload), otherwise recycles the least recently used idle player.
+- release() detaches the player from the screen's video widget and parks it,
+  paused, in an LRU of loaded sources.
+- Only `max_loaded` idle players keep their source (and decoder) open;
+  older ones are unloaded, and spare players beyond `max_players` deleted.
+"""
+
+import os
+
+from PyQt6.QtCore import QObject, QUrl
+from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QVideoSink
+
+MEDIA_STATS = bool(os.getenv("SMARTAR_MEDIA_STATS"))
+
+
+class MediaPlayerPool(QObject):
+    """Leases QMediaPlayers by asset path, keeping recently used ones loaded"""
+
+    def __init__(self, max_players=4, max_loaded=2, parent=None):
+        super().__init__(parent)
+        self.max_players = max_players
+        self.max_loaded = max_loaded
+
+        self._idle = []          # least -> most recently used
+        self._leased = {}        # player -> owner
+        self._sinks = {}         # player -> off-screen sink used while idle
+
+        self.hits = 0
+        self.misses = 0
+
+    # ---------------- Players ----------------
+    def _new_player(self):
+        player = QMediaPlayer(self)
+        audio = QAudioOutput(self)
+        audio.setMuted(True)
+        player.setAudioOutput(audio)
+
+        sink = QVideoSink(self)
+        player.setVideoSink(sink)
+        self._sinks[player] = sink
+
+        player.errorOccurred.connect(lambda error, text, p=player: self._on_error(p))
+        return player
+
+    def _take_idle(self, url):
+        """Pop an idle player for `url`: a loaded match, a blank one, or the LRU"""
+        for player in reversed(self._idle):
+            if player.source() == url:
+                self._idle.remove(player)
+                return player, True
+
+        for player in self._idle:
+            if player.source().isEmpty():
+                self._idle.remove(player)
+                return player, False
+
+        if len(self._idle) + len(self._leased) < self.max_players or not self._idle:
+            return self._new_player(), False
+        return self._idle.pop(0), False
+
+    # ---------------- Leasing ----------------
+    def lease(self, path, owner):
+        """Return (player, warm) with `path` set as source and leased to `owner`"""
+        url = QUrl.fromLocalFile(path)
+        player, warm = self._take_idle(url)
+        if warm:
+            self.hits += 1
+        else:
+            self.misses += 1
+            player.stop()
+            player.setSource(url)
+
+        self._leased[player] = owner
+        if MEDIA_STATS:
+            state = "hit" if warm else "miss"
+            print(f"[media] lease {os.path.basename(path)}: {state} ({self.stats()})")
+        return player, warm
+
+    def release(self, player):
+        """Take `player` back: pause it, detach it from any widget, keep it loaded"""
+        if self._leased.pop(player, None) is None:
+            return
+
+        player.pause()
+        player.audioOutput().setMuted(True)
+        player.setVideoSink(self._sinks[player])
+        self._idle.append(player)
+        self._trim()
+
+    def release_owner(self, owner):
+        for player in [p for p, o in self._leased.items() if o is owner]:
+            self.release(player)
+
+    def prefetch(self, path):
+        """Load `path` on an idle player and decode its first frame"""
+        url = QUrl.fromLocalFile(path)
+        if any(p.source() == url for p in self._leased):
+            return
+
+        player, warm = self._take_idle(url)
+        if not warm:
+            player.setSource(url)
+            player.pause()      # loads and decodes the first frame without playing
+        self._idle.append(player)
+        self._trim()
+
+    def find(self, path):
+        """Player currently holding `path` (leased or idle), or None"""
+        url = QUrl.fromLocalFile(path)
+        return next((p for p in list(self._leased) + self._idle if p.source() == url), None)
+
+    def unload_idle(self):
+        """Close every idle source, e.g. under memory pressure"""
+        for player in self._idle:
+            player.stop()
+            player.setSource(QUrl())
+        self._trim()
+
+    def _trim(self):
+        # unload the oldest idle sources so their decoders are released
+        loaded = [p for p in self._idle if not p.source().isEmpty()]
+        for player in loaded[:max(0, len(loaded) - self.max_loaded)]:
+            player.stop()
+            player.setSource(QUrl())
+
+        # delete spare players once the pool is over budget
+        while self._idle and len(self._idle) + len(self._leased) > self.max_players:
+            player = next((p for p in self._idle if p.source().isEmpty()), None)
+            if player is None:
+                break
+            self._idle.remove(player)
+            self._sinks.pop(player).deleteLater()
+            player.audioOutput().deleteLater()
+            player.deleteLater()
+
+    def _on_error(self, player):
+        # failed prefetch: forget the source; leased players report via their screen
+        if player not in self._leased:
+            player.setSource(QUrl())
+
+    def stats(self):
+        loaded = sum(1 for p in self._idle if not p.source().isEmpty())
+        return (f"{len(self._leased)} leased, {len(self._idle)} idle, {loaded} idle loaded, "
+                f"{self.hits} hits / {self.misses} misses")
+
+
+media_pool = None
+
+
+def get_media_pool():
+    """Global pool, created on first use (after the QApplication exists)"""
+    global media_pool
+    if media_pool is None:
+        media_pool = MediaPlayerPool()
+    return media_pool
@@ -0,0 +1,159 @@
+"""
+Media prefetching for the exercise demo videos
+A screen-side client of the shared MediaPlayerPool: it leases the player for
+the current video, renders it into the screen's video widget and hands it
+back on release(). prefetch() asks the pool to open the *next* exercise of
+the plan and decode its first frame while the current one plays, so moving
+on leases an already-warm player instead of starting a cold decoder on a
+black video widget.
+
+Set SMARTAR_MEDIA_STATS=1 to print the time-to-first-frame of every play().
+"""
+
+import os
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtMultimedia import QMediaPlayer
+
+from frontend.utils.media_pool import get_media_pool, MEDIA_STATS
+
+
+class MediaPrefetcher(QObject):
+    """Plays pooled players into one video output and warms the next one"""
+
+    firstFrame = pyqtSignal(str, float, bool)   # path, ms to first frame, was warm
+    errorOccurred = pyqtSignal(object, str)     # forwarded from the leased player
+    positionChanged = pyqtSignal(int)
+    durationChanged = pyqtSignal(int)
+    playbackStateChanged = pyqtSignal(object)
+
+    def __init__(self, video_output, volume=1.0, loops=QMediaPlayer.Loops.Infinite, parent=None):
+        super().__init__(parent)
+        self.pool = get_media_pool()
+        self.video_output = video_output
+        self.volume = volume
+        self.loops = loops
+        self.muted = False
+
+        self.active = None          # leased player, None while released
+        self.last_path = None       # what resume() re-leases after a release()
+        self._pending = None        # path to warm once the active player has loaded
+
+        self._ttff_start = None
+        self._ttff_warm = False
+        video_output.videoSink().videoFrameChanged.connect(self._on_frame)
+
+    # ---------------- Playback ----------------
+    def play(self, path):
+        """Play `path` from the start, reusing a pooled player that has it loaded"""
+        self.release()
+        warm = self._lease(path)
+        if warm and self.active.position() > 0:
+            self.active.setPosition(0)
+
+        self._ttff_start = time.perf_counter()
+        self._ttff_warm = warm
+        self.active.play()
+        return self.active
+
+    def resume(self):
+        """Continue playback, re-leasing the last video if it was released"""
+        if self.active is None:
+            if not self.last_path:
+                return
+            self._lease(self.last_path)
+        self.active.play()
+
+    def pause(self):
+        if self.active and self.active.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+            self.active.pause()
+
+    def stop(self):
+        self._pending = None
+        if self.active:
+            self.active.stop()
+
+    def is_playing(self):
+        return bool(self.active) and \
+            self.active.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+
+    def set_position(self, ms):
+        if self.active:
+            self.active.setPosition(ms)
+
+    def set_muted(self, muted):
+        self.muted = muted
+        if self.active:
+            self.active.audioOutput().setMuted(muted)
+
+    def prefetch(self, path):
+        """Have the pool open `path` and decode its first frame"""
+        # don't compete with the active player's own load for the decoder
+        if self.active and self.active.mediaStatus() == QMediaPlayer.MediaStatus.LoadingMedia:
+            self._pending = path
+            return
+        self._pending = None
+        self.pool.prefetch(path)
+
+    # ---------------- Leasing ----------------
+    def _lease(self, path):
+        player, warm = self.pool.lease(path, self)
+        player.setLoops(self.loops)
+        player.audioOutput().setVolume(self.volume)
+        player.audioOutput().setMuted(self.muted)
+        player.setVideoOutput(self.video_output)
+
+        player.errorOccurred.connect(self._on_error)
+        player.mediaStatusChanged.connect(self._on_status)
+        player.positionChanged.connect(self.positionChanged)
+        player.durationChanged.connect(self.durationChanged)
+        player.playbackStateChanged.connect(self.playbackStateChanged)
+
+        self.active = player
+        self.last_path = path
+        if warm:
+            self.durationChanged.emit(player.duration())
+        return warm
+
+    def release(self):
+        """Give the player back to the pool (paused, still loaded)"""
+        if self.active is None:
+            return
+
+        player, self.active = self.active, None
+        player.errorOccurred.disconnect(self._on_error)
+        player.mediaStatusChanged.disconnect(self._on_status)
+        player.positionChanged.disconnect(self.positionChanged)
+        player.durationChanged.disconnect(self.durationChanged)
+        player.playbackStateChanged.disconnect(self.playbackStateChanged)
+        self.pool.release(player)
+        self.playbackStateChanged.emit(QMediaPlayer.PlaybackState.PausedState)
+
+    def clear(self):
+        """Release and forget the last video (e.g. a GIF replaced it)"""
+        self.release()
+        self.last_path = None
+
+    # ---------------- Signals ----------------
+    def _on_status(self, status):
+        if self._pending and status in (
+            QMediaPlayer.MediaStatus.LoadedMedia,
+            QMediaPlayer.MediaStatus.BufferedMedia,
+        ):
+            path, self._pending = self._pending, None
+            self.pool.prefetch(path)
+
+    def _on_error(self, error, text):
+        self.errorOccurred.emit(error, text)
+
+    def _on_frame(self, frame):
+        if self._ttff_start is None or not frame.isValid():
+            return
+
+        ms = (time.perf_counter() - self._ttff_start) * 1000
+        self._ttff_start = None
+        self.firstFrame.emit(self.last_path or "", ms, self._ttff_warm)
+        if MEDIA_STATS:
+            state = "warm" if self._ttff_warm else "cold"
+            print(f"[media] first frame {os.path.basename(self.last_path or '')}: {ms:.0f} ms ({state})")
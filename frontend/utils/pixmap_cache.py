@@ -0,0 +1,68 @@
+"""
+Scaled pixmap cache for preview labels
+Source images are loaded from disk once, and scaled copies are cached per
+(source, target size bucket). During a live window resize callers ask for a
+fast (nearest-neighbour) scale, then request the smooth version once the
+resize settles; smooth results are cached so returning to a size is free.
+"""
+
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QPixmap
+
+
+class ScaledPixmapCache:
+    """LRU of scaled QPixmaps keyed by (source key, size bucket)"""
+
+    BUCKET = 16     # px; sizes are rounded down so the pixmap never outgrows its label
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._sources = {}              # path -> unscaled QPixmap
+        self._scaled = OrderedDict()    # (key, w, h) -> smooth QPixmap
+        self._bytes = 0
+
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def bucket(self, size):
+        step = self.BUCKET
+        return QSize(max(step, size.width() // step * step), max(step, size.height() // step * step))
+
+    def source(self, path):
+        """Unscaled pixmap for `path`, read from disk only the first time"""
+        pixmap = self._sources.get(path)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            if not pixmap.isNull():
+                self._sources[path] = pixmap
+        return pixmap
+
+    def scaled(self, key, pixmap, size, smooth=True):
+        """
+        `pixmap` (identified by `key`) scaled to fit `size`, keeping aspect.
+        smooth=False returns a cheap fast scale unless a smooth copy is cached.
+        """
+        target = self.bucket(size)
+        cache_key = (key, target.width(), target.height())
+
+        cached = self._scaled.get(cache_key)
+        if cached is not None:
+            self._scaled.move_to_end(cache_key)
+            return cached
+
+        if not smooth:
+            return pixmap.scaled(target, Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.FastTransformation)
+
+        result = pixmap.scaled(target, Qt.AspectRatioMode.KeepAspectRatio,
+                               Qt.TransformationMode.SmoothTransformation)
+        self._scaled[cache_key] = result
+        self._bytes += self.pixmap_bytes(result)
+        while self._bytes > self.max_bytes and len(self._scaled) > 1:
+            _, evicted = self._scaled.popitem(last=False)
+            self._bytes -= self.pixmap_bytes(evicted)
+        return result
+
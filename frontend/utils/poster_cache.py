@@ -0,0 +1,216 @@
+"""
+Poster-frame cache for the exercise demo videos
+Extracts one representative frame per video (a quarter into the clip, past
+any fade-in) the first time it is needed, stores it as a JPEG on disk keyed
+by the video's content hash from the asset manifest (path + mtime for files
+outside it), and serves QPixmaps from an in-memory LRU
+bounded by pixel bytes. Screens show the poster instantly instead of an
+empty widget while the decoder starts.
+
+Frames are decoded asynchronously with a dedicated muted QMediaPlayer; cache
+hits never touch QtMultimedia. Cache directory: SMARTAR_CACHE_DIR or the
+platform cache location.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, QStandardPaths, QTimer, QUrl, pyqtSignal, Qt
+from PyQt6.QtGui import QPixmap
+
+POSTER_POSITION = 0.25      # fraction of the clip used as the poster
+POSTER_MAX_WIDTH = 640
+EXTRACT_TIMEOUT_MS = 5000
+
+
+def cache_dir():
+    base = os.getenv("SMARTAR_CACHE_DIR") or QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.CacheLocation
+    )
+    return os.path.join(base or ".", "posters")
+
+
+class PosterCache(QObject):
+    """Disk + memory cache of per-video poster QPixmaps"""
+
+    posterReady = pyqtSignal(str, QPixmap)     # video path, poster
+
+    def __init__(self, max_bytes=24 * 1024 * 1024, directory=None, parent=None):
+        super().__init__(parent)
+        self.max_bytes = max_bytes
+        self.directory = directory or cache_dir()
+
+        self._lru = OrderedDict()      # disk key -> QPixmap
+        self._bytes = 0
+        self._hashes = {}              # video path -> content hash (no stat needed)
+
+        # extraction state (one video at a time)
+        self._queue = []
+        self._current = None
+        self._unavailable = False      # no multimedia backend: serve disk hits only
+        self._player = None
+        self._sink = None
+        self._seeked = False
+        self._target_us = 0
+        self._timeout = QTimer(self)
+        self._timeout.setSingleShot(True)
+        self._timeout.timeout.connect(self._finish)
+
+    # ---------------- Lookup ----------------
+    def disk_path(self, path):
+        """JPEG path for `path`'s current content (None if the video is missing)"""
+        digest = self._hashes.get(path)
+        if digest is None:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                return None
+            digest = hashlib.sha1(f"{os.path.abspath(path)}|{mtime}".encode()).hexdigest()
+        stem = os.path.splitext(os.path.basename(path))[0].replace(" ", "_")
+        return os.path.join(self.directory, f"{stem}-{digest[:16]}.jpg")
+
+    def poster(self, path, content_hash=None):
+        """Poster for `path` if cached, else None (posterReady fires once extracted)"""
+        if content_hash:
+            self._hashes[path] = content_hash
+        key = self.disk_path(path)
+        if key is None:
+            return None
+
+        pixmap = self._lru.get(key)
+        if pixmap is not None:
+            self._lru.move_to_end(key)
+            return pixmap
+
+        if os.path.exists(key):
+            pixmap = QPixmap(key)
+            if not pixmap.isNull():
+                self._remember(key, pixmap)
+                return pixmap
+
+        self.request(path)
+        return None
+
+    def request(self, path):
+        """Queue `path` for extraction (no-op if already queued)"""
+        if self._unavailable:
+            return
+        if path != self._current and path not in self._queue:
+            self._queue.append(path)
+        if self._current is None:
+            QTimer.singleShot(0, self._next)
+
+    # ---------------- Memory LRU ----------------
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def _remember(self, key, pixmap):
+        if key in self._lru:
+            self._bytes -= self.pixmap_bytes(self._lru.pop(key))
+        self._lru[key] = pixmap
+        self._bytes += self.pixmap_bytes(pixmap)
+
+        while self._bytes > self.max_bytes and len(self._lru) > 1:
+            _, evicted = self._lru.popitem(last=False)
+            self._bytes -= self.pixmap_bytes(evicted)
+
+    def memory_bytes(self):
+        return self._bytes
+
+    # ---------------- Extraction ----------------
+    def _ensure_player(self):
+        if self._player is not None:
+            return
+        # imported lazily: cache hits must not require a multimedia backend
+        from PyQt6.QtMultimedia import QMediaPlayer, QVideoSink
+
+        self._player = QMediaPlayer(self)
+        self._sink = QVideoSink(self)
+        self._player.setVideoSink(self._sink)
+        self._player.mediaStatusChanged.connect(self._on_status)
+        self._player.errorOccurred.connect(lambda *_: self._finish())
+        self._sink.videoFrameChanged.connect(self._on_frame)
+
+    def _next(self):
+        if self._current is not None or not self._queue:
+            return
+
+        self._current = self._queue.pop(0)
+        if self.disk_path(self._current) is None:
+            self._finish()
+            return
+
+        try:
+            self._ensure_player()
+        except ImportError as e:
+            print(f"Poster extraction unavailable: {e}")
+            self._unavailable = True
+            self._queue.clear()
+            self._current = None
+            return
+
+        self._seeked = False
+        self._timeout.start(EXTRACT_TIMEOUT_MS)
+        self._player.setSource(QUrl.fromLocalFile(self._current))
+        self._player.pause()
+
+    def _on_status(self, status):
+        from PyQt6.QtMultimedia import QMediaPlayer
+
+        if self._current is None or self._seeked:
+            return
+        if status in (QMediaPlayer.MediaStatus.LoadedMedia, QMediaPlayer.MediaStatus.BufferedMedia):
+            self._seeked = True
+            position = int(self._player.duration() * POSTER_POSITION)
+            self._target_us = position * 1000
+            self._player.setPosition(position)
+
+    def _on_frame(self, frame):
+        if self._current is None or not self._seeked or not frame.isValid():
+            return
+        # skip the first frame decoded by pause() that may land after the seek
+        if 0 <= frame.startTime() < self._target_us - 500_000:
+            return
+
+        image = frame.toImage()
+        if image.isNull():
+            return
+        if image.width() > POSTER_MAX_WIDTH:
+            image = image.scaledToWidth(POSTER_MAX_WIDTH, Qt.TransformationMode.SmoothTransformation)
+
+        path = self._current
+        key = self.disk_path(path)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if not image.save(key, "JPG", 85):
+                print(f"Poster save failed: {key}")
+        except OSError as e:
+            print(f"Poster cache error: {e}")
+
+        pixmap = QPixmap.fromImage(image)
+        self._remember(key, pixmap)
+        self._finish()
+        self.posterReady.emit(path, pixmap)
+
+    def _finish(self):
+        self._timeout.stop()
+        if self._player is not None:
+            self._player.stop()
+            self._player.setSource(QUrl())
+        self._current = None
+        self._seeked = False
+        if self._queue:
+            QTimer.singleShot(0, self._next)
+
+
+poster_cache = None
+
+
+def get_poster_cache():
+    """Global cache, created on first use (after the QApplication exists)"""
+    global poster_cache
+    if poster_cache is None:
+        poster_cache = PosterCache()
+    return poster_cache
@@ -0,0 +1,133 @@
+"""
+Custom-painted workout session tracker for SmartARTrainer
+Draws every session dot of a program from a single completed-session count,
+replacing the per-session QLabel grid (one stylesheet per label).
+"""
+
+import math
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QRect, QRectF, QSize
+from PyQt6.QtGui import QPainter, QColor, QFont, QRegion
+
+
+class SessionTrackerWidget(QWidget):
+    """Grid of numbered session dots; the first `completed` are highlighted"""
+
+    CELL = 50
+    SPACING = 10
+
+    COLOR_DONE = QColor("#667eea")
+    COLOR_TODO = QColor(255, 255, 255, 20)     # rgba(255,255,255,0.08)
+    COLOR_TEXT = QColor("#ffffff")
+
+    def __init__(self, total=60, columns=15, parent=None):
+        super().__init__(parent)
+        self.total = total
+        self.max_columns = columns
+        self.completed = 0
+        self._font = QFont("Segoe UI", 12, QFont.Weight.Bold)
+
+        policy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        policy.setHeightForWidth(True)
+        self.setSizePolicy(policy)
+
+    # ---------------- State ----------------
+    def set_total(self, total):
+        """Change the program length (e.g. longer plans than 60 sessions)"""
+        if total == self.total:
+            return
+        self.total = max(0, total)
+        self.completed = min(self.completed, self.total)
+        self.setMinimumHeight(self.heightForWidth(self.width()))
+        self.updateGeometry()
+        self.update()
+
+    def set_completed(self, count):
+        """Highlight the first `count` sessions, repainting only changed cells"""
+        count = max(0, min(count, self.total))
+        if count == self.completed:
+            return
+
+        low, high = sorted((self.completed, count))
+        self.completed = count
+
+        dirty = QRegion()
+        for index in range(low, high):
+            dirty = dirty.united(self.cell_rect(index))
+        self.update(dirty)
+
+    # ---------------- Layout ----------------
+    def columns(self):
+        step = self.CELL + self.SPACING
+        fit = max(1, (self.width() + self.SPACING) // step)
+        return max(1, min(self.max_columns, fit))
+
+    def rows_for(self, columns):
+        return math.ceil(self.total / columns) if self.total else 0
+
+    def cell_rect(self, index):
+        cols = self.columns()
+        row, col = divmod(index, cols)
+        step = self.CELL + self.SPACING
+        return QRect(col * step, row * step, self.CELL, self.CELL)
+
+    def hasHeightForWidth(self):
+        return True
+
+    def heightForWidth(self, width):
+        step = self.CELL + self.SPACING
+        cols = max(1, min(self.max_columns, (width + self.SPACING) // step))
+        rows = self.rows_for(cols)
+        return max(0, rows * step - self.SPACING)
+
+    def sizeHint(self):
+        step = self.CELL + self.SPACING
+        width = self.max_columns * step - self.SPACING
+        return QSize(width, self.heightForWidth(width))
+
+    def minimumSizeHint(self):
+        return QSize(self.CELL, self.CELL)
+
+    def resizeEvent(self, event):
+        # fewer columns fit on narrow windows, so reserve room for the extra rows
+        self.setMinimumHeight(self.heightForWidth(event.size().width()))
+        super().resizeEvent(event)
+
+    # ---------------- Painting ----------------
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._font)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        exposed = event.rect()
+        cols = self.columns()
+        step = self.CELL + self.SPACING
+
+        # only walk the rows that intersect the exposed area
+        first_row = max(0, exposed.top() // step)
+        last_row = min(self.rows_for(cols) - 1, exposed.bottom() // step)
+
+        for row in range(first_row, last_row + 1):
+            for col in range(cols):
+                index = row * cols + col
+                if index >= self.total:
+                    break
+
+                rect = QRectF(self.cell_rect(index))
+                if not exposed.intersects(rect.toRect()):
+                    continue
+
+                if index < self.completed:
+                    painter.setBrush(self.COLOR_DONE)
+                    painter.drawEllipse(rect)
+                else:
+                    painter.setBrush(self.COLOR_TODO)
+                    painter.drawRoundedRect(rect, 12, 12)
+
+                painter.setPen(self.COLOR_TEXT)
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(index + 1))
+                painter.setPen(Qt.PenStyle.NoPen)
+
+        painter.end()
@@ -2,6 +2,13 @@
 Centralized stylesheet definitions for SmartARTrainer application
 """
 
+from functools import lru_cache
+
+from PyQt6.QtCore import QObject, QEvent
+from PyQt6.QtWidgets import QWidget
+
+
+@lru_cache(maxsize=None)
 def get_main_stylesheet():
     """Returns the main application stylesheet with modern dark theme"""
     return """
@@ -262,3 +269,286 @@ def get_glass_effect_style():
         border-radius: 16px;
         backdrop-filter: blur(10px);
     """
+
+
+# =====================================================
+# NAMED STYLE REGISTRY
+# =====================================================
+# Each entry is parsed once by the container it is applied to; child widgets
+# pick their rule by objectName and runtime state changes flip a dynamic
+# property + re-polish instead of calling setStyleSheet() again.
+
+NAMED_STYLES = {
+    # Top navigation bar shared by Workout / Dashboard / Session screens.
+    # Tabs carry the dynamic property active="true" | "false"; the Workout
+    # screen's bar (screen="workout") is slightly darker.
+    "navBar": """
+        QFrame#navBar {
+            background: rgba(15, 12, 41, 0.4);
+            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+        }
+        QFrame#navBar[screen="workout"] {
+            background: rgba(15, 12, 41, 0.45);
+        }
+        QLabel#appTitle {
+            color: #667eea;
+            background: transparent;
+            border: none;
+        }
+        QPushButton {
+            background: transparent;
+            color: white;
+            border: 1px solid rgba(255, 255, 255, 0.4);
+            border-radius: 8px;
+            padding: 8px 20px;
+            font-weight: bold;
+            font-size: 14px;
+        }
+        QPushButton[active="true"] {
+            background: rgba(102, 126, 234, 0.8);
+            border: none;
+        }
+        QPushButton:hover {
+            background: rgba(102, 126, 234, 0.3);
+        }
+    """,
+
+    # Analytics screen: header, summary cards, rounded glass panels, tables
+    "analyticsPage": """
+        QLabel#welcomeLabel {
+            color: white;
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 rgba(102,126,234,0.35),
+                stop:1 rgba(118,75,162,0.35));
+            border-left: 10px solid #667eea;
+            border-radius: 18px;
+            padding: 18px 28px;
+            margin-bottom: 12px;
+            font-size: 24px;
+            letter-spacing: 2px;
+        }
+        QLabel#planLabel {
+            color: #ffffff;
+            background: rgba(102,126,234,0.22);
+            border: 3px solid rgba(102,126,234,0.6);
+            border-radius: 16px;
+            padding: 14px 24px;
+            font-size: 24px;
+            letter-spacing: 1.5px;
+        }
+        QPushButton#logoutButton {
+            background: rgba(255, 255, 255, 0.08);
+            color: white;
+            border-radius: 10px;
+            font-weight: bold;
+            border: 1px solid rgba(255, 255, 255, 0.1);
+        }
+        QPushButton#logoutButton:hover {
+            background: rgba(255, 107, 107, 0.15);
+            border-color: #ff6b6b;
+            color: #ff6b6b;
+        }
+        QLabel#pageTitle {
+            color: white;
+            background: transparent;
+        }
+        QLabel#insightLabel {
+            color: #e2e8f0;
+            padding: 10px;
+        }
+        QFrame#summaryCard {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                       stop:0 rgba(102, 126, 234, 0.15),
+                                       stop:1 rgba(118, 75, 162, 0.15));
+            border: 2px solid rgba(102, 126, 234, 0.3);
+            border-radius: 20px;
+            padding: 20px;
+        }
+        QFrame#summaryCard QLabel#value {
+            color: white;
+            background: transparent;
+            border: none;
+        }
+        QFrame#summaryCard QLabel#summaryLabel {
+            color: #fbbf24;
+            letter-spacing: 1px;
+            background: transparent;
+            border: none;
+        }
+        QTableView#workoutTable {
+            background: transparent;
+            border: none;
+            gridline-color: rgba(255, 255, 255, 0.05);
+            color: #e2e8f0;
+            font-size: 14px;
+            font-weight: bold;
+            outline: none;
+        }
+        QTableView#workoutTable::item {
+            padding: 15px;
+            border-bottom: 1px solid rgba(255, 255, 255, 0.05);
+        }
+        QTableView#workoutTable QHeaderView::section {
+            background: rgba(102, 126, 234, 0.1);
+            color: #fbbf24;
+            padding: 12px;
+            border: none;
+            font-weight: bold;
+            font-size: 13px;
+            text-transform: uppercase;
+            border-bottom: 2px solid rgba(102, 126, 234, 0.4);
+        }
+        QFrame#sectionBox {
+            background: rgba(255, 255, 255, 0.04);
+            border-radius: 20px;
+            border: 1px solid rgba(255,255,255,0.08);
+        }
+        QLabel#sectionTitle {
+            color: white;
+            border: none;
+            background: transparent;
+        }
+    """,
+
+    # WorkoutSession Start/Stop button, state="start" | "stop"
+    "sessionControl": """
+        QPushButton {
+            color: white;
+            border-radius: 15px;
+            font-weight: bold;
+            font-size: 18px;
+        }
+        QPushButton[state="start"] { background: #48bb78; }
+        QPushButton[state="start"]:hover { background: #38a169; }
+        QPushButton[state="stop"] { background: #f56565; }
+        QPushButton[state="stop"]:hover { background: #e53e3e; }
+    """,
+
+    # Workout screen: motivational quotes (left) and plan card (right)
+    "planQuotes": """
+        QLabel#quoteTop {
+            color: rgba(255,255,255,0.90);
+            font-size: 40px;
+            font-weight: 200;
+            background: transparent;
+            border: none;
+            padding: 0px;
+        }
+        QLabel#quoteBottom {
+            color: #a3bffa;
+            font-size: 34px;
+            font-weight: 200;
+            background: transparent;
+            border: none;
+            padding: 0px;
+        }
+    """,
+
+    "planCard": """
+        QFrame#planCard {
+            background: rgba(255, 255, 255, 0.10);
+            border: 1px solid rgba(255, 255, 255, 0.18);
+            border-radius: 24px;
+        }
+        QLabel#planHeader {
+            color: #ffffff;
+            letter-spacing: 0.9px;
+            background: transparent;
+            border: none;
+            padding: 0px;
+        }
+        QFrame#planDivider {
+            background: rgba(255,255,255,0.32);
+            border: none;
+        }
+        QWidget#planRow {
+            background: transparent;
+        }
+        QLabel#planRowThumb {
+            background: rgba(255,255,255,0.06);
+            border: none;
+            border-radius: 8px;
+        }
+        QLabel#planEmpty, QLabel#planRowName {
+            color: #ffffff;
+            background: transparent;
+            border: none;
+            padding: 0px;
+        }
+        QLabel#planEmpty {
+            color: rgba(255,255,255,0.90);
+        }
+        QLabel#planRowValue {
+            color: #dbeafe;
+            background: transparent;
+            border: none;
+            padding: 0px;
+        }
+        QPushButton#planStart {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                       stop:0 #667eea, stop:1 #764ba2);
+            color: white;
+            font-size: 19px;
+            font-weight: bold;
+            border-radius: 18px;
+            padding: 12px 18px;
+        }
+        QPushButton#planStart:hover {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                       stop:0 #764ba2, stop:1 #667eea);
+        }
+    """,
+}
+
+
+def apply_style(widget, name, **properties):
+    """Attach a named style to `widget` (one parse), setting dynamic properties first"""
+    for key, value in properties.items():
+        widget.setProperty(key, value)
+
+    sheet = NAMED_STYLES[name]
+    if widget.styleSheet() != sheet:
+        widget.setStyleSheet(sheet)
+
+
+def set_style_state(widget, **properties):
+    """Switch dynamic properties used by a named style and re-polish, without re-parsing"""
+    changed = False
+    for key, value in properties.items():
+        if widget.property(key) != value:
+            widget.setProperty(key, value)
+            changed = True
+
+    if changed:
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
+
+class StyleParseCounter(QObject):
+    """
+    App-wide event filter counting stylesheet (re)applications.
+    Every setStyleSheet() makes Qt re-resolve the sheet for the widget and its
+    children, each of which receives a StyleChange event. `parsed` counts the
+    widgets that carry their own sheet text (the actual CSS parses),
+    `restyled` every widget touched by the cascade.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parsed = 0
+        self.restyled = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.StyleChange and isinstance(obj, QWidget):
+            self.restyled += 1
+            if obj.styleSheet():
+                self.parsed += 1
+        return False
+
+    def take(self):
+        """Return (parsed, restyled) since the last call and start a new window"""
+        counts = (self.parsed, self.restyled)
+        self.parsed = self.restyled = 0
+        return counts